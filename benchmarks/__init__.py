@@ -0,0 +1,3 @@
+"""파이프라인 단계별 지연시간/메모리 벤치마크. 실행: python -m benchmarks"""
+
+from benchmarks import stages  # noqa: F401  (벤치마크 등록)
@@ -0,0 +1,82 @@
+"""
+사용법:
+    python -m benchmarks                       # 전체 실행, 결과를 history 에 기록하고 직전 run 과 비교
+    python -m benchmarks -k journal erp        # 이름 또는 그룹으로 선택
+    python -m benchmarks --scale 20000 --ocr paddle --pdf input/한의원.pdf
+    python -m benchmarks --no-save --fail-on-regression
+"""
+import argparse
+import sys
+
+from loguru import logger
+
+from benchmarks import harness, stages
+
+
+def _fmt_bytes(n):
+    if n is None:
+        return "-"
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(n) < 1024:
+            return f"{n:.0f}{unit}"
+        n /= 1024
+    return f"{n:.1f}TB"
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Pipeline stage benchmarks")
+    parser.add_argument("-k", "--select", nargs="*", help="benchmark names or groups to run")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--scale", type=int, default=stages.CONFIG["scale"], help="vouchers for journal/ERP stages")
+    parser.add_argument("--pdf", help="PDF to rasterize instead of the synthetic one")
+    parser.add_argument("--pdf-pages", type=int, default=stages.CONFIG["pdf_pages"])
+    parser.add_argument("--dpi", type=int, default=stages.CONFIG["dpi"])
+    parser.add_argument("--ocr", choices=["stub", "paddle"], default="stub")
+    parser.add_argument("--history", default=str(harness.DEFAULT_HISTORY_PATH))
+    parser.add_argument("--no-save", action="store_true", help="do not append this run to history")
+    parser.add_argument("--threshold", type=float, default=0.2, help="regression threshold (0.2 = 20%% slower)")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    parser.add_argument("--list", action="store_true")
+    args = parser.parse_args(argv)
+
+    stages.CONFIG.update({
+        "scale": args.scale, "pdf": args.pdf, "pdf_pages": args.pdf_pages, "dpi": args.dpi, "ocr": args.ocr,
+    })
+    benches = harness.registered(args.select)
+    if args.list:
+        for b in benches:
+            print(f"{b.group:14s} {b.name}")
+        return 0
+
+    # 측정 중 파이프라인 로그 출력 억제
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    results = []
+    print(f"{'benchmark':30s} {'median':>10s} {'min':>10s} {'peak alloc':>12s} {'rss Δ':>10s}")
+    for bench in benches:
+        r = harness.measure(bench, repeat=args.repeat, warmup=args.warmup)
+        results.append(r)
+        print(f"{r.name:30s} {r.median_s * 1000:9.2f}ms {r.min_s * 1000:9.2f}ms "
+              f"{_fmt_bytes(r.peak_alloc_bytes):>12s} {_fmt_bytes(r.rss_delta_bytes):>10s}")
+
+    meta = {k: stages.CONFIG[k] for k in ("scale", "pdf", "pdf_pages", "dpi", "ocr")}
+    # 같은 조건(meta)으로 실행한 가장 최근 run 과 비교
+    baseline = next((run for run in reversed(harness.load_history(args.history)) if run.get("meta") == meta), None)
+    rows = harness.compare(results, baseline, args.threshold)
+    if rows:
+        print(f"\ncompared with run at {baseline['ts']} ({baseline['env'].get('git_rev')})")
+        for row in rows:
+            flag = "REGRESSION" if row["regression"] else ""
+            print(f"{row['name']:30s} {row['ratio']:6.2f}x {flag}")
+
+    if not args.no_save:
+        harness.append_history(results, meta, args.history)
+
+    if args.fail_on_regression and any(r["regression"] for r in rows):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+"""
+벤치마크 실행기.
+
+- @benchmark(name, group) 로 등록한 함수는 (setup) → 인자 반환, (run) 을 측정 대상으로 가짐
+- 시간: warmup 후 repeat 회 perf_counter 측정 → min/median/mean
+- 메모리: 별도 1회 실행에서 tracemalloc peak(파이썬 할당), psutil 이 있으면 RSS 증가량
+- 결과는 history.jsonl 에 한 줄(run 단위)로 누적 → 직전 run 과 median 비교
+"""
+import gc
+import json
+import os
+import platform
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+BENCH_ROOT = Path(__file__).resolve().parent
+DEFAULT_HISTORY_PATH = BENCH_ROOT / "results" / "history.jsonl"
+
+
+@dataclass
+class Benchmark:
+    name: str
+    group: str
+    run: Callable[..., Any]
+    setup: Optional[Callable[[], Any]] = None
+    repeat: Optional[int] = None  # 느린 단계는 기본 반복 수를 줄임
+
+
+@dataclass
+class BenchResult:
+    name: str
+    group: str
+    repeat: int
+    min_s: float
+    median_s: float
+    mean_s: float
+    peak_alloc_bytes: int
+    rss_delta_bytes: Optional[int]
+    extra: dict = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return self.__dict__.copy()
+
+
+_REGISTRY: dict[str, Benchmark] = {}
+
+def benchmark(name: str, group: str, setup: Optional[Callable[[], Any]] = None, repeat: Optional[int] = None):
+    def deco(fn):
+        _REGISTRY[name] = Benchmark(name=name, group=group, run=fn, setup=setup, repeat=repeat)
+        return fn
+    return deco
+
+def registered(selected: Optional[list[str]] = None) -> list[Benchmark]:
+    benches = list(_REGISTRY.values())
+    if selected:
+        benches = [b for b in benches if b.name in selected or b.group in selected]
+    return benches
+
+
+def _prepare(bench: Benchmark) -> Callable[[], Any]:
+    """setup 을 실행하고(측정 제외) 측정할 0-인자 callable 반환"""
+    args = bench.setup() if bench.setup else None
+    if args is None:
+        return bench.run
+    if isinstance(args, tuple):
+        return lambda: bench.run(*args)
+    return lambda: bench.run(args)
+
+def measure(bench: Benchmark, repeat: int = 5, warmup: int = 1) -> BenchResult:
+    repeat = bench.repeat or repeat
+    for _ in range(warmup):
+        _prepare(bench)()
+
+    times = []
+    for _ in range(repeat):
+        fn = _prepare(bench)
+        gc.collect()
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+
+    # 메모리는 시간 측정과 분리(tracemalloc 오버헤드)
+    gc.collect()
+    proc = psutil.Process() if PSUTIL_AVAILABLE else None
+    rss_before = proc.memory_info().rss if proc else None
+    fn = _prepare(bench)
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    rss_delta = proc.memory_info().rss - rss_before if proc else None
+
+    return BenchResult(
+        name=bench.name,
+        group=bench.group,
+        repeat=repeat,
+        min_s=min(times),
+        median_s=statistics.median(times),
+        mean_s=statistics.fmean(times),
+        peak_alloc_bytes=peak,
+        rss_delta_bytes=rss_delta,
+    )
+
+
+def environment_info() -> dict:
+    info = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+    try:
+        import subprocess
+        info["git_rev"] = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BENCH_ROOT, capture_output=True, text=True, timeout=5
+        ).stdout.strip() or None
+    except Exception:
+        info["git_rev"] = None
+    return info
+
+def load_history(path: Path = DEFAULT_HISTORY_PATH) -> list[dict]:
+    if not Path(path).exists():
+        return []
+    runs = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                runs.append(json.loads(line))
+    return runs
+
+def append_history(results: list[BenchResult], meta: dict, path: Path = DEFAULT_HISTORY_PATH) -> dict:
+    run = {
+        "ts": datetime.utcnow().isoformat() + "Z",
+        "env": environment_info(),
+        "meta": meta,
+        "results": [r.to_dict() for r in results],
+    }
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(run, ensure_ascii=False) + "\n")
+    return run
+
+def compare(results: list[BenchResult], baseline_run: Optional[dict], threshold: float = 0.2) -> list[dict]:
+    """
+    baseline(이전 run) 대비 median 변화율. threshold 이상 느려지면 regression=True
+    같은 meta(scale 등)로 실행한 run 끼리만 비교하는 것은 호출측 책임
+    """
+    if not baseline_run:
+        return []
+    base = {r["name"]: r for r in baseline_run.get("results", [])}
+    rows = []
+    for r in results:
+        b = base.get(r.name)
+        if not b or not b["median_s"]:
+            continue
+        ratio = r.median_s / b["median_s"]
+        rows.append({
+            "name": r.name,
+            "baseline_s": b["median_s"],
+            "current_s": r.median_s,
+            "ratio": ratio,
+            "regression": ratio > 1 + threshold,
+        })
+    return rows
@@ -0,0 +1,132 @@
+"""
+OCR 추론 런타임 비교 벤치마크 (pages/second, 정확도).
+
+샘플 이미지(test/1. OCR/INPUT, input/*.png)를 런타임 구성별로 OCR 하고
+처리량과 기준 결과 대비 문자 단위 유사도를 비교합니다.
+기준은 같은 이름의 녹화된 OCR 결과(JSON)가 있으면 그것을, 없으면 첫 번째 구성의 결과를 사용합니다.
+ONNX 구성은 OCR_ONNX_MODEL_DIR 아래에 내보낸 det/rec/cls(및 *_int8) 모델과 onnxruntime 이 필요합니다.
+
+사용법:
+    python -m benchmarks.ocr_engines
+    python -m benchmarks.ocr_engines --variants paddle-mkldnn onnx onnx-int8 --threads 4 --repeat 3
+    python -m benchmarks.ocr_engines --pdf input/한의원.pdf --pdf-pages 3
+"""
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from difflib import SequenceMatcher
+from pathlib import Path
+
+from loguru import logger
+
+from benchmarks.harness import environment_info
+from benchmarks.stages import REPO_ROOT, TEST_IMAGE, TEST_OCR_JSON
+
+# 구성 이름 → (OCRService inference_engine, 구성 중 덮어쓸 settings)
+VARIANTS = {
+    "paddle": ("paddle", {"ocr_enable_mkldnn": False}),
+    "paddle-mkldnn": ("paddle", {"ocr_enable_mkldnn": True}),
+    "onnx": ("onnxruntime", {"ocr_onnx_int8": False}),
+    "onnx-int8": ("onnxruntime", {"ocr_onnx_int8": True}),
+}
+
+SAMPLES = [
+    (TEST_IMAGE, TEST_OCR_JSON),
+    (REPO_ROOT / "input" / "TI-1.png", REPO_ROOT / "input" / "TI-1_extracted.json"),
+    (REPO_ROOT / "input" / "R-1.png", None),
+    (REPO_ROOT / "input" / "page_001.png", None),
+]
+
+
+def _texts(ocr_result) -> str:
+    return "\n".join(box.text for box in ocr_result.text_boxes)
+
+
+def _recorded_text(path) -> str:
+    with open(path, "r", encoding="utf-8") as f:
+        return "\n".join(tb["text"] for tb in json.load(f)["text_boxes"])
+
+
+def _pdf_pages(pdf: Path, pages: int, out_dir: Path) -> list:
+    from config.settings import settings
+    from src.entocr.pdf_render import render_pages
+
+    return [(Path(path), None) for _, path in render_pages(str(pdf), list(range(pages)), settings.pdf_dpi, False, str(out_dir), "page")]
+
+
+def run_variant(name: str, samples: list, threads: int, repeat: int) -> dict:
+    """한 구성으로 모든 샘플을 repeat 회 OCR 하고 처리량/결과 텍스트를 반환."""
+    from config.settings import settings
+    from src.entocr.ocr_service import OCRService
+
+    engine, overrides = VARIANTS[name]
+    saved = {key: getattr(settings, key) for key in overrides}
+    try:
+        for key, value in overrides.items():
+            setattr(settings, key, value)
+        service = OCRService(backend="paddle", inference_engine=engine, cpu_threads=threads)
+        start = time.perf_counter()
+        service.ocr_engine  # 모델 로드는 처리량에서 제외
+        init_s = time.perf_counter() - start
+
+        service.extract_text(samples[0][0])  # warmup (MKLDNN/ORT 그래프 최적화)
+        runs, results = [], []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            results = [service.extract_text(image) for image, _ in samples]
+            runs.append(time.perf_counter() - start)
+    finally:
+        for key, value in saved.items():
+            setattr(settings, key, value)
+
+    return {
+        "init_s": init_s,
+        "pages_per_s": len(samples) / statistics.median(runs),
+        "avg_confidence": statistics.mean(r.average_confidence for r in results),
+        "texts": [_texts(r) for r in results],
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.ocr_engines", description="OCR inference runtime comparison")
+    parser.add_argument("--variants", nargs="*", choices=list(VARIANTS), default=list(VARIANTS))
+    parser.add_argument("--threads", type=int, default=0, help="CPU inference threads (0: runtime default)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--pdf", help="also OCR the first pages of this PDF (rendered at PDF_DPI)")
+    parser.add_argument("--pdf-pages", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    samples = [(image, ref) for image, ref in SAMPLES if image.exists()]
+    tmp = tempfile.TemporaryDirectory(prefix="entocr_engines_")
+    if args.pdf:
+        samples += _pdf_pages(Path(args.pdf), args.pdf_pages, Path(tmp.name))
+
+    env = environment_info()
+    print(f"{len(samples)} pages, threads={args.threads or 'default'}, "
+          f"cpu={env.get('cpu_count')}, git={env.get('git_rev')}\n")
+    print(f"{'variant':16s} {'init':>8s} {'pages/s':>9s} {'similarity':>11s} {'avg conf':>9s}")
+
+    references = [_recorded_text(ref) if ref else None for _, ref in samples]
+    for name in args.variants:
+        try:
+            r = run_variant(name, samples, args.threads, args.repeat)
+        except Exception as e:
+            print(f"{name:16s} skipped: {e}")
+            continue
+        # 녹화가 없는 샘플은 처음 성공한 구성의 결과를 기준으로 삼음
+        references = [ref if ref is not None else text for ref, text in zip(references, r["texts"])]
+        similarity = statistics.mean(SequenceMatcher(None, ref, text).ratio() for ref, text in zip(references, r["texts"]))
+        print(f"{name:16s} {r['init_s']:7.2f}s {r['pages_per_s']:9.2f} {similarity:11.3f} {r['avg_confidence']:9.3f}")
+
+    tmp.cleanup()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+"""
+파이프라인 단계별 벤치마크 정의.
+
+입력은 저장소에 있는 샘플(test/*/INPUT, input/)을 기본으로 하고, 규모가 필요한 단계는
+샘플을 복제한 합성 데이터(CONFIG["scale"] 건)를 사용합니다.
+OCR 은 CONFIG["ocr"] == "stub" 이면 녹화된 OCR 결과를 돌려주는 replay 백엔드 사용(모델 없이 실행 가능).
+"""
+import copy
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+
+from benchmarks.harness import benchmark
+
+# 벤치마크용 import 시 LLM 키가 없어도 모듈 로드가 가능하도록(실제 호출은 하지 않음)
+os.environ.setdefault("OPENAI_API_KEY", "")
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+TEST_IMAGE = REPO_ROOT / "test" / "1. OCR" / "INPUT" / "HUNTRIX.png"
+TEST_OCR_JSON = REPO_ROOT / "test" / "2. LLM" / "INPUT" / "HUNTRIX.json"
+TEST_LLM_DATA = REPO_ROOT / "test" / "3. VISUALIZATION" / "INPUT" / "HUNTRIX_data.json"
+TEST_SELECTIONS = REPO_ROOT / "test" / "3. VISUALIZATION" / "INPUT" / "HUNTRIX_selections.json"
+TEST_VOUCHER = REPO_ROOT / "test" / "4. JOURNAL_ENTRY" / "INPUT" / "HUNTRIX_data.json"
+
+CONFIG = {
+    "scale": 2000,       # 분개/ERP 단계의 voucher 수
+    "pdf_pages": 5,      # 합성 PDF 페이지 수
+    "pdf": None,         # 실제 PDF 경로(지정 시 합성 PDF 대신 사용)
+    "dpi": 200,
+    "ocr": "stub",       # "stub" | "paddle"
+}
+
+_TMP = tempfile.TemporaryDirectory(prefix="entocr_bench_")
+TMP_DIR = Path(_TMP.name)
+
+
+def _load_json(path: Path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# === PDF 래스터화 ===
+@lru_cache(maxsize=None)
+def _synthetic_pdf(pages: int) -> Path:
+    import fitz
+
+    path = TMP_DIR / f"synthetic_{pages}.pdf"
+    doc = fitz.open()
+    lines = [tb["text"] for tb in _load_json(TEST_OCR_JSON)["text_boxes"]]
+    for p in range(pages):
+        page = doc.new_page(width=595, height=842)  # A4 pt
+        for i, text in enumerate(lines[:60]):
+            page.insert_text((40, 40 + i * 12), f"{p + 1}-{i} {text.encode('ascii', 'ignore').decode() or 'line'}", fontsize=9)
+    doc.save(str(path))
+    doc.close()
+    return path
+
+def _pdf_setup():
+    pdf = Path(CONFIG["pdf"]) if CONFIG["pdf"] else _synthetic_pdf(CONFIG["pdf_pages"])
+    out_dir = Path(tempfile.mkdtemp(dir=TMP_DIR))
+    return pdf, out_dir
+
+@benchmark("pdf_rasterize", group="ocr", setup=_pdf_setup, repeat=3)
+def bench_pdf_rasterize(pdf: Path, out_dir: Path):
+    from src.entocr.pdf_converter import convert_pdf_to_png
+    return convert_pdf_to_png(pdf, out_dir, dpi=CONFIG["dpi"])
+
+@benchmark("pdf_text_layer", group="ocr", setup=_pdf_setup, repeat=3)
+def bench_pdf_text_layer(pdf: Path, out_dir: Path):
+    # 합성 PDF 는 텍스트 레이어가 있으므로 래스터화/OCR 대신 바로 추출되는 경로
+    from src.entocr.pdf_text import extract_text_layer
+    return extract_text_layer(pdf, dpi=CONFIG["dpi"])
+
+
+# === OCR ===
+@lru_cache(maxsize=None)
+def _ocr_service():
+    from src.entocr.backends import ReplayOCRBackend
+    from src.entocr.ocr_service import OCRService
+
+    if CONFIG["ocr"] == "stub":
+        return OCRService(backend=ReplayOCRBackend(TEST_OCR_JSON))
+    return OCRService(backend="paddle")
+
+def _ocr_setup():
+    return _ocr_service(), TEST_IMAGE
+
+@benchmark("ocr_extract_text", group="ocr", setup=_ocr_setup)
+def bench_ocr(service, image_path):
+    return service.extract_text(image_path)
+
+
+# === LLM 전/후처리 (LLM 호출 자체는 제외) ===
+def _ocr_json_setup():
+    return _load_json(TEST_OCR_JSON)
+
+@benchmark("ocr_document_from_raw", group="llm", setup=_ocr_json_setup)
+def bench_from_raw(ocr_json):
+    from src.ant.ocr_document import OCRDocument
+    return OCRDocument.from_raw(ocr_json)
+
+def _doc_setup():
+    from src.ant.ocr_document import OCRDocument
+    return OCRDocument.from_raw(_load_json(TEST_OCR_JSON))
+
+@benchmark("build_candidates", group="llm", setup=_doc_setup)
+def bench_build_candidates(doc):
+    from src.ant.preprocessing import build_candidates
+    return build_candidates(doc, max_items=200)
+
+def _llm_data_setup():
+    return copy.deepcopy(_load_json(TEST_LLM_DATA))
+
+@benchmark("validate_and_coerce", group="llm", setup=_llm_data_setup)
+def bench_validate(data):
+    from src.ant.llm_main import _validate_and_coerce
+    _validate_and_coerce(data)
+    return data
+
+def _overlay_setup():
+    return str(TEST_IMAGE), _load_json(TEST_SELECTIONS), str(TMP_DIR / "overlay.png")
+
+@benchmark("draw_overlays", group="visualization", setup=_overlay_setup, repeat=3)
+def bench_overlay(image_path, selections, output_path):
+    from src.ant.visualization import draw_overlays
+    return draw_overlays(image_path, selections, output_path)
+
+
+# === 분개 / ERP 변환 ===
+@lru_cache(maxsize=None)
+def _vouchers(scale: int) -> tuple:
+    from src.entjournal.journal_main import get_json_wt_one_value_from_extract_invoice_fields, drop_source_id_from_json
+
+    base = drop_source_id_from_json([get_json_wt_one_value_from_extract_invoice_fields(_load_json(TEST_VOUCHER))])[0]
+    projects = ["HUNTRIX", "루미", "미라", "조이"]
+    out = []
+    for i in range(scale):
+        v = dict(base)
+        v["file_id"] = f"workspace/bench/input_files/{i:06d}.png"
+        v["금액"] = str(10000 + i * 37)
+        v["프로젝트명"] = projects[i % len(projects)]
+        out.append(v)
+    return tuple(out)
+
+def _voucher_setup():
+    return [dict(v) for v in _vouchers(CONFIG["scale"])]
+
+@benchmark("make_journal_entry", group="journal", setup=_voucher_setup, repeat=3)
+def bench_make_journal(vouchers):
+    from src.entjournal.journal_main import make_journal_entry
+    return make_journal_entry(vouchers)
+
+@benchmark("make_journal_entries_batch", group="journal", setup=_voucher_setup, repeat=3)
+def bench_make_journal_batch(vouchers):
+    from src.entjournal.batch import make_journal_entries_batch
+    return make_journal_entries_batch(vouchers)
+
+@lru_cache(maxsize=None)
+def _journal_lines(scale: int) -> tuple:
+    from src.entjournal.batch import make_journal_entries_batch
+    return tuple(make_journal_entries_batch(list(_vouchers(scale))))
+
+def _lines_setup():
+    return list(_journal_lines(CONFIG["scale"]))
+
+@benchmark("dzone_view", group="erp", setup=_lines_setup)
+def bench_dzone_view(lines):
+    from src.entjournal.journal_main import dzone_view
+    return dzone_view(lines)
+
+@benchmark("sap_view", group="erp", setup=_lines_setup)
+def bench_sap_view(lines):
+    from src.entjournal.journal_main import sap_view
+    return sap_view(lines)
+
+
+# === 기동 시간(새 인터프리터에서 import) ===
+def _python(*args: str) -> None:
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT))
+    subprocess.run([sys.executable, *args], cwd=REPO_ROOT, env=env, check=True, capture_output=True)
+
+@benchmark("import_api_main", group="startup", repeat=3)
+def bench_import_api():
+    _python("-c", "import src.api.main")
+
+@benchmark("import_entocr_cli", group="startup", repeat=3)
+def bench_import_cli():
+    _python("-c", "import src.entocr.cli")
+
+@benchmark("cli_help", group="startup", repeat=3)
+def bench_cli_help():
+    _python("-m", "src.entocr", "--help")
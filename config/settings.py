@@ -13,10 +13,40 @@ class Settings(BaseSettings):
     # OCR Configuration
     ocr_language: str = Field(default="korean", env="OCR_LANGUAGE")
     ocr_use_angle_cls: bool = Field(default=True, env="OCR_USE_ANGLE_CLS") 
+    # Orientation pre-pass: pages whose orientation is known (EXIF, or the whole-page
+    # classifier above the confidence) are rotated once and OCR'd without angle classification
+    ocr_orientation_prepass: bool = Field(default=False, env="OCR_ORIENTATION_PREPASS")
+    ocr_orientation_min_confidence: float = Field(default=0.9, ge=0.0, le=1.0, env="OCR_ORIENTATION_MIN_CONFIDENCE")
     ocr_use_gpu: bool = Field(default=False, env="OCR_USE_GPU")
     ocr_det_limit_side_len: int = Field(default=960, env="OCR_DET_LIMIT_SIDE_LEN")
     ocr_rec_batch_num: int = Field(default=6, env="OCR_REC_BATCH_NUM")
 
+    # Inference runtime of the PaddleOCR engine (PaddleOCR 3.x):
+    # "paddle" (Paddle Inference, MKLDNN on CPU) or "onnxruntime" (exported ONNX
+    # models in ocr_onnx_model_dir/{det,rec,cls}, or {det,rec,cls}_int8 if quantized)
+    ocr_inference_engine: str = Field(default="paddle", env="OCR_INFERENCE_ENGINE")
+    ocr_cpu_threads: int = Field(default=0, ge=0, env="OCR_CPU_THREADS")  # 0: runtime default
+    ocr_enable_mkldnn: bool = Field(default=True, env="OCR_ENABLE_MKLDNN")
+    ocr_onnx_model_dir: str = Field(default="models/onnx", env="OCR_ONNX_MODEL_DIR")
+    ocr_onnx_int8: bool = Field(default=False, env="OCR_ONNX_INT8")
+    # PaddleOCR constructor arguments rejected by the installed version, cached per
+    # package version so cold starts build the engine in one attempt ("" disables)
+    ocr_init_cache_file: str = Field(default="data/cache/paddleocr_init.json", env="OCR_INIT_CACHE_FILE")
+
+    # OCR Backend Configuration ("paddle" or a registered backend such as "replay")
+    ocr_backend: str = Field(default="paddle", env="OCR_BACKEND")
+    ocr_replay_path: Optional[str] = Field(default=None, env="OCR_REPLAY_PATH")
+    ocr_replay_latency: str = Field(default="0", env="OCR_REPLAY_LATENCY")
+    ocr_replay_error_rate: float = Field(default=0.0, ge=0.0, le=1.0, env="OCR_REPLAY_ERROR_RATE")
+    ocr_replay_seed: Optional[int] = Field(default=None, env="OCR_REPLAY_SEED")
+
+    # LLM Backend Configuration ("openai" or a registered backend such as "replay")
+    llm_backend: str = Field(default="openai", env="LLM_BACKEND")
+    llm_replay_path: Optional[str] = Field(default=None, env="LLM_REPLAY_PATH")
+    llm_replay_latency: str = Field(default="0", env="LLM_REPLAY_LATENCY")
+    llm_replay_error_rate: float = Field(default=0.0, ge=0.0, le=1.0, env="LLM_REPLAY_ERROR_RATE")
+    llm_replay_seed: Optional[int] = Field(default=None, env="LLM_REPLAY_SEED")
+
     # Logging Configuration
     log_level: str = Field(default="INFO", env="LOG_LEVEL")
     log_file: str = Field(default="logs/entocr.log", env="LOG_FILE")
@@ -29,6 +59,53 @@ class Settings(BaseSettings):
     # Image Processing Configuration
     max_image_size: int = Field(default=2048, env="MAX_IMAGE_SIZE")
     supported_formats: str = Field(default="jpg,jpeg,png,bmp,tiff", env="SUPPORTED_FORMATS")
+    # Document cropping: find the page quadrilateral in photos, perspective-correct and
+    # crop to it before OCR (boxes are mapped back to original photo pixels)
+    ocr_document_crop: bool = Field(default=False, env="OCR_DOCUMENT_CROP")
+    ocr_document_min_area: float = Field(default=0.2, gt=0.0, le=1.0, env="OCR_DOCUMENT_MIN_AREA")
+    ocr_grayscale: bool = Field(default=False, env="OCR_GRAYSCALE")
+
+    # Tiled OCR: images larger than max_image_size are split into overlapping
+    # tiles at full resolution instead of being downscaled
+    ocr_tiling: bool = Field(default=False, env="OCR_TILING")
+    ocr_tile_size: int = Field(default=1024, gt=0, env="OCR_TILE_SIZE")
+    ocr_tile_overlap: int = Field(default=128, ge=0, env="OCR_TILE_OVERLAP")
+
+    # Second pass: boxes below the threshold are cropped from the full-resolution
+    # image, upsampled/cleaned and re-recognized in one batch
+    ocr_refine_low_confidence: bool = Field(default=False, env="OCR_REFINE_LOW_CONFIDENCE")
+    ocr_refine_threshold: float = Field(default=0.8, ge=0.0, le=1.0, env="OCR_REFINE_THRESHOLD")
+    ocr_refine_target_height: int = Field(default=64, gt=0, env="OCR_REFINE_TARGET_HEIGHT")
+    ocr_refine_padding: float = Field(default=0.15, ge=0.0, env="OCR_REFINE_PADDING")  # relative to box height
+
+    # Cross-page batching: detection per page, recognition crops of all pages in a
+    # batch pooled into large batches (textline orientation classification is skipped)
+    ocr_cross_page_batching: bool = Field(default=False, env="OCR_CROSS_PAGE_BATCHING")
+    ocr_rec_pool_size: int = Field(default=64, gt=0, env="OCR_REC_POOL_SIZE")
+
+    # Born-digital PDF pages are read from the embedded text layer instead of OCR
+    pdf_text_layer: bool = Field(default=True, env="PDF_TEXT_LAYER")
+    pdf_text_min_chars: int = Field(default=20, ge=1, env="PDF_TEXT_MIN_CHARS")
+
+    # PDF rasterization: pages are split across worker processes for large PDFs
+    pdf_render_workers: int = Field(default=0, ge=0, env="PDF_RENDER_WORKERS")  # 0: one per CPU core
+    pdf_parallel_min_pages: int = Field(default=8, ge=1, env="PDF_PARALLEL_MIN_PAGES")
+    pdf_render_grayscale: bool = Field(default=False, env="PDF_RENDER_GRAYSCALE")
+
+    # PDF render resolution. In adaptive mode scanned pages are OCR'd at the lower
+    # steps first and re-rendered (up to pdf_dpi) only while quality is below thresholds
+    pdf_dpi: int = Field(default=300, gt=0, env="PDF_DPI")
+    pdf_adaptive_dpi: bool = Field(default=False, env="PDF_ADAPTIVE_DPI")
+    pdf_adaptive_dpi_steps: str = Field(default="150,200", env="PDF_ADAPTIVE_DPI_STEPS")
+    pdf_adaptive_min_confidence: float = Field(default=0.85, ge=0.0, le=1.0, env="PDF_ADAPTIVE_MIN_CONFIDENCE")
+    pdf_adaptive_min_text_density: float = Field(default=0.5, ge=0.0, env="PDF_ADAPTIVE_MIN_TEXT_DENSITY")  # chars per in²
+
+    # OCR worker processes: files are OCR'd in managed processes that are replaced after
+    # a number of pages or above an RSS limit (0 workers: OCR runs in the calling process)
+    ocr_workers: int = Field(default=0, ge=0, env="OCR_WORKERS")
+    ocr_worker_max_pages: int = Field(default=500, ge=0, env="OCR_WORKER_MAX_PAGES")  # 0: no page limit
+    ocr_worker_max_rss_mb: int = Field(default=3072, ge=0, env="OCR_WORKER_MAX_RSS_MB")  # 0: no RSS limit
+    ocr_worker_stop_timeout: float = Field(default=30.0, gt=0.0, env="OCR_WORKER_STOP_TIMEOUT")  # seconds
 
     # Application Configuration
     debug: bool = Field(default=False, env="DEBUG")
@@ -42,6 +119,15 @@ class Settings(BaseSettings):
             raise ValueError(f"Log level must be one of {valid_levels}")
         return v.upper()
 
+    @field_validator("ocr_inference_engine")
+    @classmethod
+    def validate_ocr_inference_engine(cls, v: str) -> str:
+        """Validate OCR inference engine value."""
+        valid_engines = ["paddle", "onnxruntime"]
+        if v.lower() not in valid_engines:
+            raise ValueError(f"OCR inference engine must be one of {valid_engines}")
+        return v.lower()
+
     @field_validator("output_format")
     @classmethod
     def validate_output_format(cls, v: str) -> str:
@@ -0,0 +1,131 @@
+"""
+LLM 백엔드 선택 (load_llm_model / call_llm_and_parse 뒤에서 사용).
+
+백엔드는 LangChain ChatModel 과 같은 invoke(messages) -> (.content 를 가진 응답) 형태면 됩니다.
+- "openai"(기본): load_llm.py 의 ChatOpenAI
+- "replay": 녹화된 LLM 결과 JSON 을 돌려주는 가짜 백엔드(네트워크/키 불필요)
+  지연시간 분포와 오류율을 설정할 수 있어 스케줄러/큐/저장소 부하 테스트에 사용
+
+설정(config/settings.py, 환경변수 또는 .env)
+    LLM_BACKEND=replay
+    LLM_REPLAY_PATH=<*_data.json 파일 또는 디렉토리>  (기본: test/3. VISUALIZATION/INPUT/HUNTRIX_data.json)
+    LLM_REPLAY_LATENCY=lognormal:0.5,0.4   (src.utils.replay.LatencyModel 스펙)
+    LLM_REPLAY_ERROR_RATE=0.02
+    LLM_REPLAY_SEED=42
+"""
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from loguru import logger
+
+from config.settings import settings
+from src.utils.constants import ROOT_DIR
+from src.utils.replay import RecordingPicker, ReplayFaults, load_recordings, recording_key
+
+DEFAULT_LLM_RECORDINGS = Path(ROOT_DIR) / "test" / "3. VISUALIZATION" / "INPUT" / "HUNTRIX_data.json"
+# 녹화 파일명 접미사(HUNTRIX_data.json → huntrix 로 매칭)
+RECORDING_SUFFIX = "_data"
+
+
+@dataclass
+class ReplayMessage:
+    """LangChain AIMessage 대용(응답 본문만)"""
+    content: str
+
+
+def _source_image_of(messages: List[Dict[str, Any]]) -> Optional[str]:
+    """build_llm_messages 가 만든 user 메시지의 컨텍스트 JSON 에서 원본 이미지 경로를 꺼냄"""
+    for msg in messages:
+        if msg.get("role") != "user":
+            continue
+        content = msg.get("content")
+        parts = content if isinstance(content, list) else [{"type": "text", "text": content}]
+        for part in parts:
+            if part.get("type") != "text" or not str(part.get("text", "")).startswith("{"):
+                continue
+            try:
+                return json.loads(part["text"]).get("이미지")
+            except (ValueError, AttributeError):
+                continue
+    return None
+
+
+class ReplayChatModel:
+    """녹화된 LLM 결과를 돌려주는 ChatModel. 원본 이미지 파일명으로 녹화를 고르고, 없으면 순환"""
+
+    def __init__(
+        self,
+        source: Union[str, Path] = DEFAULT_LLM_RECORDINGS,
+        latency: Any = 0.0,
+        error_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        recordings = load_recordings(source, suffix=RECORDING_SUFFIX)
+        # 응답은 매번 새 문자열로 직렬화되므로 호출측이 결과를 수정해도 녹화는 그대로
+        self._picker = RecordingPicker({k: json.dumps(v, ensure_ascii=False) for k, v in recordings.items()})
+        self.faults = ReplayFaults(latency, error_rate, seed)
+        logger.info(
+            f"Replay LLM backend: {len(recordings)} recordings from {source} "
+            f"(latency={self.faults.latency}, error_rate={self.faults.error_rate})"
+        )
+
+    def invoke(self, messages: List[Dict[str, Any]], **kwargs) -> ReplayMessage:
+        image = _source_image_of(messages)
+        self.faults.apply(image or "")
+        return ReplayMessage(content=self._picker.pick(recording_key(image)))
+
+    def stats(self) -> dict:
+        return self.faults.stats()
+
+
+def _replay_from_settings() -> ReplayChatModel:
+    return ReplayChatModel(
+        source=settings.llm_replay_path or DEFAULT_LLM_RECORDINGS,
+        latency=settings.llm_replay_latency,
+        error_rate=settings.llm_replay_error_rate,
+        seed=settings.llm_replay_seed,
+    )
+
+
+# 이름 → 백엔드 생성 함수. "openai" 는 load_llm.load_llm_model 이 직접 처리
+_BACKENDS: Dict[str, Callable[[], Any]] = {
+    "replay": _replay_from_settings,
+}
+_active: Dict[str, Any] = {}
+_lock = threading.Lock()
+
+
+def register_llm_backend(name: str, factory: Callable[[], Any]) -> None:
+    _BACKENDS[name] = factory
+    _active.pop(name, None)
+
+def set_llm_backend(backend: Any = None) -> None:
+    """
+    프로세스 전체에서 사용할 LLM 백엔드를 직접 지정(테스트/부하테스트용).
+    None 이면 해제하고 settings.llm_backend(LLM_BACKEND) 설정으로 돌아감
+    """
+    with _lock:
+        if backend is None:
+            _active.pop("override", None)
+        else:
+            _active["override"] = backend
+
+def get_llm_backend() -> Optional[Any]:
+    """
+    지정된 가짜/대체 백엔드 인스턴스. 기본(openai)이면 None
+    같은 프로세스에서는 인스턴스를 재사용(통계 누적, 녹화 1회 로드)
+    """
+    if "override" in _active:
+        return _active["override"]
+    name = settings.llm_backend.strip().lower()
+    if name in ("", "openai"):
+        return None
+    if name not in _BACKENDS:
+        raise ValueError(f"Unknown LLM backend: {name}. Available: {['openai', *_BACKENDS]}")
+    with _lock:
+        if name not in _active:
+            _active[name] = _BACKENDS[name]()
+        return _active[name]
@@ -38,6 +38,7 @@ from src.ant.constants import SYSTEM_PROMPT, USER_HARD_PROMPT, CATEGORY, ACCOUNT
 from src.ant.categorize import _normalize_token_ko
 from src.utils.constants import LLM_MODEL_NAME, OVERLAY_DIR, THUMBNAIL_DIR, EXTRACTED_JSON_DIR, VENDOR_TABLE_PATH
 from loguru import logger
+from src.utils.tracing import span, traced
 
 
 def build_llm_messages(doc: OCRDocument) -> List[Dict[str, object]]:
@@ -122,7 +123,8 @@ def call_llm_and_parse(
     llm = load_llm_model(model_name)
 
     # 2) LLM 호출: messages를 입력으로 대화 수행
-    resp = llm.invoke(messages)  # LangChain ChatOpenAI 호환 메서드
+    with span("llm.invoke", model=model_name):
+        resp = llm.invoke(messages)  # LangChain ChatOpenAI 호환 메서드
 
     # 3) 결과 문자열 추출
     raw = resp.content if hasattr(resp, "content") else str(resp)
@@ -251,6 +253,7 @@ def _validate_and_coerce(data: Dict[str, Any]) -> None:
 #     }
 #     return out
 
+@traced("llm.extract_with_locations")
 def extract_with_locations(ocr_json, artist_name: str = None, model_name: str = "gpt4o_latest") -> Tuple[Dict[str, Any], List[Dict[str, Any]], List[Dict[str, Any]]]:
     """
     확장 버전:
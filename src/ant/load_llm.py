@@ -1,16 +1,15 @@
-from langchain_openai import ChatOpenAI
-from langchain_core.prompts import PromptTemplate
-from langchain_core.output_parsers import StrOutputParser
-from langchain_openai import OpenAIEmbeddings
-
+# langchain/openai 는 import 비용이 커서(수 초) 실제 모델을 만들 때 import
 from dotenv import load_dotenv
 import warnings
 import os
 from src.utils.constants import ROOT_DIR
+from src.ant.llm_backends import get_llm_backend
 
 warnings.filterwarnings('ignore')
 load_dotenv(dotenv_path = os.path.join(ROOT_DIR, "src", "ant", ".env"))
-os.environ["OPENAI_API_KEY"] = os.getenv('OPENAI_API_KEY')
+# replay 백엔드 등 키 없이 실행하는 경우에도 import 가 가능하도록 값이 있을 때만 설정
+if os.getenv('OPENAI_API_KEY') is not None:
+    os.environ["OPENAI_API_KEY"] = os.getenv('OPENAI_API_KEY')
 HOST = os.getenv('HOST')
 PORT = os.getenv('PORT')
 PORT2 = os.getenv('PORT2')
@@ -52,6 +51,12 @@ def get_available_models():
 
 
 def load_llm_model(model_name: str):
+    # LLM_BACKEND(또는 set_llm_backend)로 지정된 대체 백엔드가 있으면 그것을 사용
+    backend = get_llm_backend()
+    if backend is not None:
+        return backend
+    from langchain_openai import ChatOpenAI
+
     selected_model = get_available_models()[model_name]
     openai_api_base = "https://genai-sharedservice-americas.pwcinternal.com"
     llm = ChatOpenAI(
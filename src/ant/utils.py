@@ -15,6 +15,9 @@ def _image_path_to_data_url(path: str) -> str:
     mime, _ = mimetypes.guess_type(path)
     if not mime:
         mime = "image/png"
+    if not mime.startswith("image/"):
+        # PDF 텍스트 레이어로 추출한 문서는 원본이 PDF → 이미지 첨부 불가
+        raise ValueError(f"이미지 파일이 아닙니다: {path}")
 
     with open(path, "rb") as f:
         b64 = base64.b64encode(f.read()).decode("utf-8")
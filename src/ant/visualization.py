@@ -1,6 +1,7 @@
 from typing import List, Dict, Any, Optional
 from PIL import Image, ImageDraw, ImageFont
 import os
+from src.utils.tracing import traced
 
 # ============================================================
 # 5) 시각화용 selections 구성 + 오버레이/썸네일 유틸
@@ -54,6 +55,7 @@ def _measure(draw: ImageDraw.ImageDraw, text: str, font: ImageFont.ImageFont):
         # 구버전 호환
         return draw.textsize(text, font=font)
 
+@traced("viz.draw_overlays")
 def draw_overlays(image_path: str, selections: List[Dict[str, Any]], output_path: str) -> None:
     """
     원본 이미지 위에 선택된 값의 bbox를 색상별로 표시하여 저장.
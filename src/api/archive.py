@@ -0,0 +1,249 @@
+import json
+import os
+import re
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+from loguru import logger
+
+from src.api.constants import *
+from src.api.journal import read_journal_lines
+from src.utils.tracing import traced
+
+# 중앙 분개 아카이브(central_db/journal_archive)
+"""
+(구) central_db/journal_entry.json 하나에 {workspace: lines} 전체를 읽고 다시 쓰던 방식을
+워크스페이스/기간별 파티션 파일로 분리.
+- 파티션: journal_archive/<workspace>/<YYYY-MM>.jsonl (한 줄 = 분개 라인 1개)
+  - 기간은 라인의 전표일자 앞 7자리, 형식이 아니면 "unknown"
+- manifest.json: {"schema_version", "partitions": {"<workspace>/<period>": {...메타}}}
+  - 메타: workspace, period, path(아카이브 루트 기준), lines, bytes, projects, archived_at
+- 아카이브 = 해당 워크스페이스 파티션만 교체(temp → fsync → os.replace), 나머지 워크스페이스는 건드리지 않음
+- manifest 갱신은 잠금 파일(O_EXCL)로 직렬화 → 동시 아카이브가 서로를 덮어쓰지 않음
+- 조회는 manifest 로 대상 파티션을 고른 뒤 해당 파일만 스트리밍
+"""
+
+ARCHIVE_SCHEMA_VERSION = 1
+UNKNOWN_PERIOD = "unknown"
+_PERIOD_RE = re.compile(r"^(\d{4})[-./]?(\d{2})")
+_LOCK_TIMEOUT_SEC = 30.0
+_LOCK_STALE_SEC = 120.0
+
+_THREAD_LOCK = threading.Lock()
+
+
+def period_of(line: dict) -> str:
+    m = _PERIOD_RE.match(str(line.get("전표일자") or ""))
+    return f"{m.group(1)}-{m.group(2)}" if m else UNKNOWN_PERIOD
+
+def _partition_key(workspace_name: str, period: str) -> str:
+    return f"{workspace_name}/{period}"
+
+def _partition_path(workspace_name: str, period: str) -> Path:
+    return get_archive_partition_root() / workspace_name / f"{period}.jsonl"
+
+
+@contextmanager
+def _manifest_lock():
+    """
+    프로세스 내(threading.Lock) + 프로세스 간(잠금 파일) 직렬화.
+    비정상 종료로 남은 잠금 파일은 _LOCK_STALE_SEC 이후 제거
+    """
+    root = get_archive_partition_root()
+    root.mkdir(parents=True, exist_ok=True)
+    lock_path = root / ".manifest.lock"
+    with _THREAD_LOCK:
+        deadline = time.monotonic() + _LOCK_TIMEOUT_SEC
+        while True:
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(fd, str(os.getpid()).encode("ascii"))
+                os.close(fd)
+                break
+            except FileExistsError:
+                try:
+                    if time.time() - lock_path.stat().st_mtime > _LOCK_STALE_SEC:
+                        logger.warning(f"Removing stale archive lock: {lock_path}")
+                        lock_path.unlink(missing_ok=True)
+                        continue
+                except FileNotFoundError:
+                    continue
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Archive is locked: {lock_path}")
+                time.sleep(0.05)
+        try:
+            yield
+        finally:
+            lock_path.unlink(missing_ok=True)
+
+
+def _write_atomic(path: Path, write) -> int:
+    """write(f) 로 temp 파일을 채운 뒤 교체. 쓴 바이트 수 반환"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8", newline="\n") as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        size = tmp.stat().st_size
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return size
+
+def read_archive_manifest() -> dict:
+    mpath = get_archive_manifest_path()
+    if not mpath.exists():
+        return {"schema_version": ARCHIVE_SCHEMA_VERSION, "partitions": {}}
+    return json.loads(mpath.read_text(encoding="utf-8"))
+
+def _write_manifest(manifest: dict) -> None:
+    _write_atomic(get_archive_manifest_path(), lambda f: json.dump(manifest, f, ensure_ascii=False, indent=2))
+
+
+def _archive_lines_locked(manifest: dict, workspace_name: str, lines: list[dict]) -> list[dict]:
+    groups: dict[str, list[dict]] = {}
+    for line in lines:
+        groups.setdefault(period_of(line), []).append(line)
+
+    archived_at = datetime.utcnow().isoformat() + "Z"
+    written = []
+    for period in sorted(groups):
+        rows = groups[period]
+        ppath = _partition_path(workspace_name, period)
+        size = _write_atomic(ppath, lambda f: f.writelines(json.dumps(r, ensure_ascii=False) + "\n" for r in rows))
+        meta = {
+            "workspace": workspace_name,
+            "period": period,
+            "path": ppath.relative_to(get_archive_partition_root()).as_posix(),
+            "lines": len(rows),
+            "bytes": size,
+            "projects": sorted({str(r.get("프로젝트코드")) for r in rows if r.get("프로젝트코드")}),
+            "archived_at": archived_at,
+        }
+        manifest["partitions"][_partition_key(workspace_name, period)] = meta
+        written.append(meta)
+
+    # 이번 아카이브에 없는 기간의 파티션은 제거(워크스페이스 단위 교체)
+    stale = [k for k, m in manifest["partitions"].items()
+             if m["workspace"] == workspace_name and m["period"] not in groups]
+    for k in stale:
+        meta = manifest["partitions"].pop(k)
+        (get_archive_partition_root() / meta["path"]).unlink(missing_ok=True)
+    return written
+
+def _migrate_legacy_locked(manifest: dict) -> bool:
+    """(구) central_db/journal_entry.json 이 남아 있으면 파티션으로 옮기고 .migrated 로 이름 변경"""
+    legacy = get_central_db_path() / CENTRAL_JOURNAL_FILE
+    if not legacy.exists():
+        return False
+    legacy_d = json.loads(legacy.read_text(encoding="utf-8") or "{}")
+    for ws, lines in legacy_d.items():
+        if not any(m["workspace"] == ws for m in manifest["partitions"].values()):
+            _archive_lines_locked(manifest, ws, lines or [])
+    os.replace(legacy, legacy.with_suffix(".json.migrated"))
+    logger.info(f"Migrated legacy central journal ({len(legacy_d)} workspaces) to partitions")
+    return True
+
+@traced("db.archive_workspace_journal")
+def archive_workspace_journal(workspace_name: str) -> dict:
+    """
+    워크스페이스의 현재 분개를 기간별 파티션으로 아카이브.
+    반환: {"archivePath", "workspaceName", "partitions": [메타...]}
+    """
+    if not get_journal_file(workspace_name).exists():
+        raise FileNotFoundError("Current journal not found")
+    lines = read_journal_lines(workspace_name)
+    with _manifest_lock():
+        manifest = read_archive_manifest()
+        _migrate_legacy_locked(manifest)
+        written = _archive_lines_locked(manifest, workspace_name, lines)
+        _write_manifest(manifest)
+    return {
+        "archivePath": str(get_archive_partition_root() / workspace_name),
+        "workspaceName": workspace_name,
+        "partitions": written,
+    }
+
+
+@traced("db.query_archive")
+def query_archive(
+    workspace_name: str | None = None,
+    period_from: str | None = None,
+    period_to: str | None = None,
+    projects: list[str] | None = None,
+    limit: int | None = None,
+) -> dict:
+    """
+    manifest 로 파티션을 고른 뒤 해당 파일만 읽음.
+    기간은 "YYYY-MM" 문자열 비교. 반환 라인에는 workspaceName 이 추가됨
+    """
+    if get_central_db_path().joinpath(CENTRAL_JOURNAL_FILE).exists():
+        with _manifest_lock():
+            manifest = read_archive_manifest()
+            if _migrate_legacy_locked(manifest):
+                _write_manifest(manifest)
+    manifest = read_archive_manifest()
+    wanted = set(projects or [])
+
+    selected = []
+    for key in sorted(manifest["partitions"]):
+        meta = manifest["partitions"][key]
+        if workspace_name and meta["workspace"] != workspace_name:
+            continue
+        if period_from and meta["period"] < period_from:
+            continue
+        if period_to and meta["period"] > period_to:
+            continue
+        if wanted and not wanted.intersection(meta.get("projects", [])):
+            continue
+        selected.append(meta)
+
+    lines: list[dict] = []
+    truncated = False
+    for meta in selected:
+        ppath = get_archive_partition_root() / meta["path"]
+        if not ppath.exists():
+            logger.warning(f"Archive partition missing: {ppath}")
+            continue
+        with open(ppath, "r", encoding="utf-8") as f:
+            for raw in f:
+                if not raw.strip():
+                    continue
+                row = json.loads(raw)
+                if wanted and str(row.get("프로젝트코드")) not in wanted:
+                    continue
+                row["workspaceName"] = meta["workspace"]
+                lines.append(row)
+                if limit is not None and len(lines) >= limit:
+                    truncated = True
+                    break
+        if truncated:
+            break
+
+    return {
+        "journal": lines,
+        "partitions": [_partition_key(m["workspace"], m["period"]) for m in selected],
+        "truncated": truncated,
+    }
+
+
+def export_archive_parquet(
+    out_path: str,
+    workspace_name: str | None = None,
+    period_from: str | None = None,
+    period_to: str | None = None,
+) -> str:
+    """아카이브 조회 결과를 워크스페이스별 row group 으로 Parquet 저장(pyarrow 필요)"""
+    from src.entjournal.columnar import write_journal_parquet
+
+    result = query_archive(workspace_name, period_from, period_to)
+    journals: dict[str, list[dict]] = {}
+    for row in result["journal"]:
+        journals.setdefault(row.pop("workspaceName"), []).append(row)
+    return write_journal_parquet(out_path, journals)
@@ -0,0 +1,84 @@
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple
+
+# 프로세스 내 읽기 캐시
+"""
+setting.json / uploads_index.json 등 GET 경로에서 매 요청마다 파싱하던 JSON을 메모리에 보관.
+- key: 파일 경로, 검증: (st_mtime_ns, st_size) 가 바뀌면 다시 읽음
+- 쓰기 함수는 저장 직후 invalidate() 호출(같은 mtime 틱 안의 재쓰기 대비)
+- 항목 수/바이트(파일 크기 합) 상한을 넘으면 LRU 순으로 제거
+- 반환 객체는 캐시와 공유됨 → 호출측에서 수정 금지(수정이 필요하면 캐시 없이 읽을 것)
+"""
+
+Stamp = Tuple[int, int]
+
+def file_stamp(path: Path) -> Optional[Stamp]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class JsonFileCache:
+    def __init__(self, max_entries: int = 256, max_bytes: int = 32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[Stamp, Any]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: Path, loader: Optional[Callable[[Path], Any]] = None) -> Any:
+        """
+        캐시된 파싱 결과 반환. 파일이 없으면 FileNotFoundError.
+        loader 미지정 시 UTF-8 JSON 으로 파싱
+        """
+        key = str(path)
+        stamp = file_stamp(path)
+        if stamp is None:
+            self.invalidate(path)
+            raise FileNotFoundError(key)
+        with self._lock:
+            hit = self._entries.get(key)
+            if hit is not None and hit[0] == stamp:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return hit[1]
+        value = loader(path) if loader else json.loads(Path(path).read_text(encoding="utf-8"))
+        with self._lock:
+            self.misses += 1
+            self._pop(key)
+            self._entries[key] = (stamp, value)
+            self._bytes += stamp[1]
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                self._pop(next(iter(self._entries)))
+        return value
+
+    def invalidate(self, path: Path) -> None:
+        with self._lock:
+            self._pop(str(path))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _pop(self, key: str) -> None:
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old[0][1]
+
+
+_json_cache = JsonFileCache()
+
+def read_json_cached(path: Path) -> Any:
+    return _json_cache.get(path)
+
+def invalidate_cached(path: Path) -> None:
+    _json_cache.invalidate(path)
@@ -26,14 +26,28 @@ SETTING_FILE = "setting.json"
 FINAL_XLSX = "journal_entries.xlsx"
 FINAL_CSV = "journal_entries.csv"
 VOUCHER_DATA_FILE = "voucher_data.json"
-EDITS_LOG_FILE = "edits.log.jsonl"  # 선택
+EDITS_LOG_FILE = "edits.log.jsonl"  # voucher_data 편집 로그(append-only)
 UPLOADS_INDEX_FILE = "uploads_index.json"
 WS_CONFIG_FILE = "config.json"
+JOURNAL_FILE = "journal_entry.json"
+JOURNAL_INDEX_FILE = "journal_index.json"  # file_id별 내용 해시 + 라인 위치(증분 새로고침용)
+CENTRAL_JOURNAL_FILE = "journal_entry.json"  # (구) 중앙 아카이브 단일 파일, 파티션 저장소로 이관됨
+ARCHIVE_PARTITION_FOLDER = "journal_archive"
+ARCHIVE_MANIFEST_FILE = "manifest.json"
+
+# === Edit log ===
+EDITS_LOG_COMPACT_THRESHOLD = 200  # 로그 레코드가 이 수를 넘으면 스냅샷으로 컴팩션
 # === Path Helpers ===
 
 def get_central_db_path() -> Path:
     return DB_ROOT
 
+def get_archive_partition_root() -> Path:
+    return get_central_db_path() / ARCHIVE_PARTITION_FOLDER
+
+def get_archive_manifest_path() -> Path:
+    return get_archive_partition_root() / ARCHIVE_MANIFEST_FILE
+
 def get_workspace_path(workspace_name: str) -> Path:
     return WORKSPACE_ROOT / workspace_name
 
@@ -58,6 +72,12 @@ def get_visualization_path(workspace_name: str) -> Path:
 def get_journal_path(workspace_name: str) -> Path:
     return get_intermediate_path(workspace_name) / JOURNAL_FOLDER
 
+def get_journal_file(workspace_name: str) -> Path:
+    return get_journal_path(workspace_name) / JOURNAL_FILE
+
+def get_journal_index_path(workspace_name: str) -> Path:
+    return get_journal_path(workspace_name) / JOURNAL_INDEX_FILE
+
 def get_final_output_path(workspace_name: str) -> Path:
     return get_workspace_path(workspace_name) / FINAL_OUTPUT_FOLDER
 
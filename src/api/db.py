@@ -2,49 +2,189 @@ from src.api.constants import *
 import json
 import tempfile
 import os
+import copy
+import threading
+from loguru import logger
 from src.api.utils import _atomic_write_json, _now_iso, _read_json
 from src.api.upload import _normalize_rel
+from src.api.cache import file_stamp
+from src.api.log import append_edit_log, read_edit_log, rewrite_edit_log, make_edit_log_entry
+from src.utils.tracing import traced
 
-def initialize_voucher_data(workspace_name: str, reset: bool = False) -> None:
-    p = get_voucher_db_path(workspace_name)
-    if not p.exists():
-        p.parent.mkdir(parents=True, exist_ok=True)
-        base = {}
-        _atomic_write_json(p, base)
-    elif reset:
-        p.unlink()
-        p.parent.mkdir(parents=True, exist_ok=True)
-        base = {}
-        _atomic_write_json(p, base)
+# voucher_data 저장 구조
+"""
+- 스냅샷: db/voucher_data.json ({file_id: voucher} + 반영된 편집 버전 SNAPSHOT_VERSION_KEY)
+- 편집 로그: db/edits.log.jsonl (필드 변경분만 append)
+- 현재 상태 = 스냅샷 + 스냅샷 버전 이후 로그 재생.
+  스냅샷 교체 후 로그 교체 전에 중단돼도 이미 반영된 옛 로그는 다시 적용하지 않음. 프로세스 메모리에 워크스페이스별로 materialize 해두고,
+  로그가 EDITS_LOG_COMPACT_THRESHOLD 를 넘으면 백그라운드 스레드에서 스냅샷으로 컴팩션.
+- 메모리 상태는 스냅샷/로그 파일의 (mtime_ns, size) 로 검증 → 다른 프로세스가 쓰면 다시 materialize
+- 쓰기 직렬화는 프로세스 내 락만 보장(동시 다중 프로세스 쓰기는 미지원)
+"""
 
-def update_voucher_data(workspace_name: str, file_id: str, edits: dict) -> None:
-    try:
-        voucher_data_ds = read_voucher_data(workspace_name)
-        voucher_data_ds[_normalize_rel(file_id)] = edits
-        write_voucher_data(workspace_name, voucher_data_ds)
-        return True, None
-    except Exception as e:
-        return False, str(e)
+class _VoucherState:
+    def __init__(self, data: dict, version: int, pending: list[dict]):
+        self.data = data            # materialize 된 현재 상태
+        self.version = version      # 마지막 편집 버전
+        self.pending = pending      # 마지막 체크포인트 이후 로그 레코드
+        self.generation = 0         # 전체 덮어쓰기(write/reset) 시 증가 → 진행 중 컴팩션 무효화
+        self.compacting = False
+        self.stamps = None          # 마지막으로 확인한 (스냅샷, 로그) 파일 스탬프
 
-def read_voucher_data(workspace_name: str) -> dict:
+# 스냅샷 파일 안에 버전을 함께 저장 → 별도 파일 없이 스냅샷과 원자적으로 교체됨
+SNAPSHOT_VERSION_KEY = "__snapshot_version__"
+
+_STATES: dict[str, _VoucherState] = {}
+_LOCKS: dict[str, threading.RLock] = {}
+_LOCKS_GUARD = threading.Lock()
+
+def _ws_lock(workspace_name: str) -> threading.RLock:
+    with _LOCKS_GUARD:
+        return _LOCKS.setdefault(workspace_name, threading.RLock())
+
+def _empty_voucher_data() -> dict:
+    return {"schema_version": 1, "updated_at": None, "entries": []}
+
+def _apply_edit(data: dict, payload: dict) -> None:
+    fid = payload["file_id"]
+    cur = dict(data.get(fid) or {})
+    cur.update(copy.deepcopy(payload.get("set", {})))
+    for k in payload.get("unset", []):
+        cur.pop(k, None)
+    data[fid] = cur
+
+def _diff_voucher(old: dict | None, new: dict) -> tuple[dict, list[str]]:
+    """old → new 로 가기 위한 변경분(set/unset). 재생 시 멱등."""
+    old = old or {}
+    set_ = {k: v for k, v in new.items() if k not in old or old[k] != v}
+    unset = [k for k in old if k not in new]
+    return set_, unset
+
+def _materialize(workspace_name: str) -> _VoucherState:
     p = get_voucher_db_path(workspace_name)
-    if not p.exists():
-        return {"schema_version": 1, "updated_at": None, "entries": []}
-    return json.loads(p.read_text(encoding="utf-8"))
+    data = json.loads(p.read_text(encoding="utf-8")) if p.exists() else _empty_voucher_data()
+    # 버전이 없는 예전 스냅샷은 0 → 로그 전체 재생
+    snapshot_version = int(data.pop(SNAPSHOT_VERSION_KEY, 0) or 0)
+    version, pending = snapshot_version, []
+    for entry in read_edit_log(workspace_name):
+        entry_version = int(entry.get("version") or 0)
+        version = max(version, entry_version)
+        if entry.get("action") == "update" and entry_version > snapshot_version:
+            _apply_edit(data, entry["payload"])
+            pending.append(entry)
+    return _VoucherState(data, version, pending)
 
-def write_voucher_data(workspace_name: str, data: dict) -> None:
+def _voucher_stamps(workspace_name: str) -> tuple:
+    return (file_stamp(get_voucher_db_path(workspace_name)), file_stamp(get_edits_log_path(workspace_name)))
+
+def _get_state(workspace_name: str) -> _VoucherState:
+    st = _STATES.get(workspace_name)
+    stamps = _voucher_stamps(workspace_name)
+    if st is None or st.stamps != stamps:
+        st = _STATES[workspace_name] = _materialize(workspace_name)
+        st.stamps = stamps
+    return st
+
+def _snapshot_text(data: dict, version: int) -> str:
+    return json.dumps({SNAPSHOT_VERSION_KEY: version, **data}, ensure_ascii=False, indent=2)
+
+def _write_snapshot_text(workspace_name: str, text: str) -> None:
     """
     temp 파일에 쓰고 os.replace로 원자적 교체 → 부분쓰기/충돌 시 손상 방지
     """
     tgt = get_voucher_db_path(workspace_name)
     tgt.parent.mkdir(parents=True, exist_ok=True)
     with tempfile.NamedTemporaryFile("w", delete=False, dir=tgt.parent, encoding="utf-8") as tmp:
-        json.dump(data, tmp, ensure_ascii=False, indent=2)
+        tmp.write(text)
         tmp.flush()
         os.fsync(tmp.fileno())
         tmp_path = tmp.name
     os.replace(tmp_path, tgt)  # atomic on POSIX/Windows(>=Py3.3)
 
+@traced("db.initialize_voucher_data")
+def initialize_voucher_data(workspace_name: str, reset: bool = False) -> None:
+    p = get_voucher_db_path(workspace_name)
+    if not p.exists() or reset:
+        write_voucher_data(workspace_name, {})
+
+@traced("db.update_voucher_data")
+def update_voucher_data(workspace_name: str, file_id: str, edits: dict) -> None:
+    """
+    전체 DB를 다시 쓰지 않고 변경 필드만 편집 로그에 append (O(1) 쓰기).
+    결과 상태는 기존과 동일하게 voucher_data[file_id] == edits.
+    """
+    try:
+        fid = _normalize_rel(file_id)
+        with _ws_lock(workspace_name):
+            st = _get_state(workspace_name)
+            set_, unset = _diff_voucher(st.data.get(fid), edits)
+            if fid in st.data and not set_ and not unset:
+                return True, None
+            st.version += 1
+            entry = append_edit_log(workspace_name, "update", {"file_id": fid, "set": set_, "unset": unset}, st.version)
+            _apply_edit(st.data, entry["payload"])
+            st.pending.append(entry)
+            st.stamps = _voucher_stamps(workspace_name)
+            start_compaction = len(st.pending) >= EDITS_LOG_COMPACT_THRESHOLD and not st.compacting
+            if start_compaction:
+                st.compacting = True
+        if start_compaction:
+            threading.Thread(target=_compact_in_background, args=(workspace_name,), daemon=True).start()
+        return True, None
+    except Exception as e:
+        return False, str(e)
+
+@traced("db.read_voucher_data")
+def read_voucher_data(workspace_name: str) -> dict:
+    with _ws_lock(workspace_name):
+        return copy.deepcopy(_get_state(workspace_name).data)
+
+@traced("db.write_voucher_data")
+def write_voucher_data(workspace_name: str, data: dict) -> None:
+    """스냅샷 전체 교체 + 편집 로그를 체크포인트 한 줄로 초기화"""
+    with _ws_lock(workspace_name):
+        st = _get_state(workspace_name)
+        _write_snapshot_text(workspace_name, _snapshot_text(data, st.version))
+        rewrite_edit_log(workspace_name, [make_edit_log_entry("checkpoint", {}, st.version)])
+        st.data = copy.deepcopy(data)
+        st.pending = []
+        st.generation += 1
+        st.stamps = _voucher_stamps(workspace_name)
+
+@traced("db.compact_voucher_log")
+def compact_voucher_log(workspace_name: str) -> int:
+    """
+    현재 상태를 스냅샷으로 저장하고, 그 이후 로그만 남김.
+    직렬화(json.dumps)는 락 밖에서 수행해 컴팩션 중에도 편집 append가 막히지 않음.
+    return: 스냅샷에 반영된 버전
+    """
+    lock = _ws_lock(workspace_name)
+    with lock:
+        st = _get_state(workspace_name)
+        data, version, generation = copy.deepcopy(st.data), st.version, st.generation
+    text = _snapshot_text(data, version)
+    with lock:
+        if st.generation != generation or _STATES.get(workspace_name) is not st:
+            # 그 사이 전체 덮어쓰기(reset 등) 발생 → 오래된 스냅샷을 쓰지 않음
+            return st.version
+        remaining = [e for e in st.pending if int(e.get("version") or 0) > version]
+        _write_snapshot_text(workspace_name, text)
+        rewrite_edit_log(workspace_name, [make_edit_log_entry("checkpoint", {}, version)] + remaining)
+        st.pending = remaining
+        st.stamps = _voucher_stamps(workspace_name)
+    return version
+
+def _compact_in_background(workspace_name: str) -> None:
+    try:
+        compact_voucher_log(workspace_name)
+    except Exception as e:
+        logger.warning(f"voucher edit log compaction failed ({workspace_name}): {e}")
+    finally:
+        with _ws_lock(workspace_name):
+            st = _STATES.get(workspace_name)
+            if st is not None:
+                st.compacting = False
+
 class VoucherData:
     def __init__(self, workspace_name: str):
         self.workspace_name = workspace_name
@@ -57,6 +197,7 @@ class VoucherData:
         pass
 
 # constant.py (추가)
+@traced("db.load_workspace_config")
 def load_workspace_config(workspace_name: str) -> dict:
     """워크스페이스 config.json 없으면 기본 템플릿 생성."""
     p = get_workspace_config_path(workspace_name)
@@ -73,6 +214,7 @@ def load_workspace_config(workspace_name: str) -> dict:
         return base
     return _read_json(p)
 
+@traced("db.save_workspace_config")
 def save_workspace_config(workspace_name: str, cfg: dict, *, if_match: int | None = None) -> dict:
     p = get_workspace_config_path(workspace_name)
     current = load_workspace_config(workspace_name)
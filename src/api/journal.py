@@ -0,0 +1,281 @@
+import base64
+import hashlib
+import json
+import os
+import threading
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+
+from src.api.constants import *
+from src.api.cache import file_stamp, read_json_cached, invalidate_cached
+from src.api.db import read_voucher_data
+from src.entjournal.journal_main import make_journal_entry
+from src.utils.tracing import traced
+
+# 분개 초안 저장소(journal_entry.json + journal_index.json)
+"""
+journal/refresh 가 전체 voucher를 매번 다시 분개하던 것을, 바뀐 voucher만 재생성하도록 변경.
+- journal_index.json: {"schema_version", "journal_stamp", "vouchers": {file_id: {"hash", "start", "count"}}}
+  - hash: voucher_data 내용 해시, start/count: journal_entry.json 안의 라인 위치
+  - journal_stamp: 인덱스를 쓸 당시 journal_entry.json 의 (mtime_ns, size)
+- 새로고침: 해시가 같은 voucher는 기존 라인을 그대로 잘라 쓰고, 다른 것만 make_journal_entry
+- 전표번호 = voucher_data 순서(0부터), 라인번호 = voucher 내 1부터 → 부분 재생성이어도 결과가 동일
+- journal_entry.json 이 인덱스 없이 바뀌었으면(파이프라인 실행 등) stamp 불일치 → 전체 재생성
+"""
+
+JOURNAL_INDEX_SCHEMA_VERSION = 1
+
+_LOCKS: dict[str, threading.Lock] = {}
+_LOCKS_GUARD = threading.Lock()
+
+def _ws_lock(workspace_name: str) -> threading.Lock:
+    with _LOCKS_GUARD:
+        return _LOCKS.setdefault(workspace_name, threading.Lock())
+
+
+def voucher_content_hash(voucher_data: dict) -> str:
+    raw = json.dumps(voucher_data, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+def renumber_journal_lines(lines: list[dict], journal_no: int) -> list[dict]:
+    """한 voucher의 라인 묶음에 전표번호/라인번호를 다시 매김(대변 1, 차변 2..)"""
+    for line_no, line in enumerate(lines, start=1):
+        line["전표번호"] = journal_no
+        line["라인번호"] = line_no
+    return lines
+
+
+def _write_json_atomic(path: Path, data, indent: int | None = None) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=indent)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    invalidate_cached(path)
+
+def read_journal_lines(workspace_name: str) -> list[dict]:
+    """journal_entry.json 읽기(캐시 공유 객체 → 수정 금지). 없으면 []"""
+    try:
+        return read_json_cached(get_journal_file(workspace_name))
+    except FileNotFoundError:
+        return []
+
+def read_journal_index(workspace_name: str) -> dict:
+    """
+    journal_entry.json 과 짝이 맞는 인덱스만 반환, 아니면 {}
+    """
+    idx_path = get_journal_index_path(workspace_name)
+    try:
+        idx = json.loads(idx_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if idx.get("schema_version") != JOURNAL_INDEX_SCHEMA_VERSION:
+        return {}
+    stamp = file_stamp(get_journal_file(workspace_name))
+    if stamp is None or list(stamp) != idx.get("journal_stamp"):
+        return {}
+    return idx.get("vouchers", {})
+
+@traced("db.write_journal")
+def write_journal(workspace_name: str, lines: list[dict], vouchers_index: dict | None = None) -> Path:
+    """
+    journal_entry.json 저장. vouchers_index 가 있으면 인덱스도 같이 저장, 없으면 인덱스 제거
+    """
+    jpath = get_journal_file(workspace_name)
+    idx_path = get_journal_index_path(workspace_name)
+    _write_json_atomic(jpath, lines, indent=4)
+    if vouchers_index is None:
+        idx_path.unlink(missing_ok=True)
+        return jpath
+    _write_json_atomic(idx_path, {
+        "schema_version": JOURNAL_INDEX_SCHEMA_VERSION,
+        "journal_stamp": list(file_stamp(jpath)),
+        "vouchers": vouchers_index,
+    })
+    return jpath
+
+
+@traced("db.refresh_journal")
+def refresh_journal(workspace_name: str) -> tuple[list[dict], dict]:
+    """
+    voucher_data 기준으로 분개를 증분 재생성.
+    반환: (전체 라인, {"regenerated", "reused", "removed", "written"})
+    """
+    with _ws_lock(workspace_name):
+        ds = read_voucher_data(workspace_name)
+        prev_index = read_journal_index(workspace_name)
+        prev_lines = read_journal_lines(workspace_name) if prev_index else []
+
+        lines: list[dict] = []
+        vouchers_index: dict = {}
+        regenerated = reused = 0
+        for journal_no, (file_id, data) in enumerate(ds.items()):
+            h = voucher_content_hash(data)
+            prev = prev_index.get(file_id)
+            if prev and prev["hash"] == h:
+                # 캐시 공유 객체이므로 라인 단위 복사 후 번호만 갱신
+                block = [dict(l) for l in prev_lines[prev["start"]:prev["start"] + prev["count"]]]
+                reused += 1
+            else:
+                block = make_journal_entry(data)
+                regenerated += 1
+            renumber_journal_lines(block, journal_no)
+            vouchers_index[file_id] = {"hash": h, "start": len(lines), "count": len(block)}
+            lines.extend(block)
+
+        stats = {
+            "regenerated": regenerated,
+            "reused": reused,
+            "removed": len(set(prev_index) - set(vouchers_index)),
+            "written": False,
+        }
+        # 내용/순서가 모두 그대로면 다시 쓸 필요 없음
+        if regenerated or vouchers_index != prev_index:
+            write_journal(workspace_name, lines, vouchers_index)
+            stats["written"] = True
+        return lines, stats
+
+
+# 분개 초안 조회(페이지네이션/필터/정렬)
+"""
+20k 라인 규모의 월 분개를 한 번에 내려주지 않도록, 라인 인덱스를 만들어 두고 조회.
+- 인덱스는 journal_entry.json 의 stamp 단위로 메모리에 보관(파일이 바뀌면 재구성)
+- 필터: 전표일자 범위, 계정코드/프로젝트코드/거래처명(쉼표로 여러 값)
+- 정렬: 필드명, "-" 접두사면 내림차순. 필드별 정렬 순서는 처음 요청 시 만들어 재사용
+- cursor: {offset, journal stamp} 를 base64 로 감싼 값. 그 사이 분개가 바뀌면 만료
+"""
+
+DATE_FIELD = "전표일자"
+JOURNAL_FILTER_FIELDS = {
+    "account": "계정코드",
+    "project": "프로젝트코드",
+    "vendor": "거래처명",
+}
+
+def _sort_key(value):
+    if value is None:
+        return (2, "")
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return (0, value)
+    return (1, str(value))
+
+
+class JournalLineIndex:
+    def __init__(self, lines: list[dict]):
+        self.size = len(lines)
+        self._lines = lines
+        self.by_field: dict[str, dict[str, list[int]]] = {f: {} for f in JOURNAL_FILTER_FIELDS.values()}
+        dated = []
+        for pos, line in enumerate(lines):
+            for field, buckets in self.by_field.items():
+                buckets.setdefault(str(line.get(field) or ""), []).append(pos)
+            dated.append((str(line.get(DATE_FIELD) or ""), pos))
+        dated.sort()
+        self._date_keys = [d for d, _ in dated]
+        self._date_pos = [p for _, p in dated]
+        self._orders: dict[str, list[int]] = {}
+        self._lock = threading.Lock()
+
+    def select(self, *, date_from: str | None = None, date_to: str | None = None,
+               **filters: list[str] | None) -> set[int] | None:
+        """조건에 맞는 라인 위치 집합. 조건이 없으면 None(전체)"""
+        result: set[int] | None = None
+        if date_from or date_to:
+            lo = bisect_left(self._date_keys, date_from) if date_from else 0
+            hi = bisect_right(self._date_keys, date_to) if date_to else self.size
+            result = set(self._date_pos[lo:hi])
+        for key, values in filters.items():
+            if not values:
+                continue
+            buckets = self.by_field[JOURNAL_FILTER_FIELDS[key]]
+            matched = set()
+            for v in values:
+                matched.update(buckets.get(v, ()))
+            result = matched if result is None else result & matched
+        return result
+
+    def order(self, field: str) -> list[int]:
+        with self._lock:
+            order = self._orders.get(field)
+            if order is None:
+                order = sorted(range(self.size), key=lambda p: _sort_key(self._lines[p].get(field)))
+                self._orders[field] = order
+            return order
+
+
+_INDEXES: dict[str, tuple] = {}
+_INDEXES_GUARD = threading.Lock()
+
+def get_journal_line_index(workspace_name: str) -> tuple[list[dict], JournalLineIndex, str]:
+    """(라인, 인덱스, stamp 토큰) 반환. journal_entry.json 이 바뀌었으면 다시 만듦"""
+    jpath = get_journal_file(workspace_name)
+    stamp = file_stamp(jpath)
+    token = f"{stamp[0]}-{stamp[1]}" if stamp else "empty"
+    with _INDEXES_GUARD:
+        hit = _INDEXES.get(workspace_name)
+        if hit is not None and hit[2] == token:
+            return hit
+    lines = read_journal_lines(workspace_name)
+    entry = (lines, JournalLineIndex(lines), token)
+    with _INDEXES_GUARD:
+        _INDEXES[workspace_name] = entry
+    return entry
+
+def _encode_cursor(offset: int, token: str) -> str:
+    raw = json.dumps({"o": offset, "v": token}).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+def _decode_cursor(cursor: str, token: str) -> int:
+    try:
+        d = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        offset = int(d["o"])
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if d.get("v") != token:
+        raise ValueError("Cursor expired: journal has changed")
+    return offset
+
+def query_journal_lines(
+    workspace_name: str,
+    *,
+    cursor: str | None = None,
+    limit: int | None = None,
+    fields: list[str] | None = None,
+    sort: str | None = None,
+    date_from: str | None = None,
+    date_to: str | None = None,
+    account: list[str] | None = None,
+    project: list[str] | None = None,
+    vendor: list[str] | None = None,
+) -> dict:
+    """
+    반환: {"journal": 페이지 라인, "total": 조건에 맞는 전체 라인 수, "nextCursor": 다음 페이지 cursor 또는 None}
+    limit 이 없으면 조건에 맞는 라인 전체
+    """
+    lines, index, token = get_journal_line_index(workspace_name)
+    selected = index.select(date_from=date_from, date_to=date_to, account=account, project=project, vendor=vendor)
+
+    if sort:
+        desc = sort.startswith("-")
+        order = index.order(sort.lstrip("-"))
+        if desc:
+            order = order[::-1]
+        positions = order if selected is None else [p for p in order if p in selected]
+    else:
+        positions = range(index.size) if selected is None else sorted(selected)
+
+    total = len(positions)
+    start = _decode_cursor(cursor, token) if cursor else 0
+    end = total if limit is None else min(start + limit, total)
+
+    page = []
+    for p in positions[start:end]:
+        line = lines[p]
+        page.append({f: line.get(f) for f in fields} if fields else dict(line))
+    return {
+        "journal": page,
+        "total": total,
+        "nextCursor": _encode_cursor(end, token) if end < total else None,
+    }
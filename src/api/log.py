@@ -1,14 +1,60 @@
 from datetime import datetime
 from src.api.constants import *
 import json
+import os
 
-def append_edit_log(workspace_name: str, action: str, payload: dict) -> None:
-    logp = get_edits_log_path(workspace_name)
-    logp.parent.mkdir(parents=True, exist_ok=True)
-    entry = {
+# 편집 로그(edits.log.jsonl)
+"""
+voucher_data 수정 내역을 한 줄에 하나의 JSON으로 append만 하는 로그.
+- 한 줄 스키마: {"ts", "action", "version", "payload"}
+- action: "update"(필드 변경분), "checkpoint"(컴팩션 시점 표시)
+- 스냅샷(voucher_data.json) + 로그 재생(replay) = 현재 상태
+"""
+
+def make_edit_log_entry(action: str, payload: dict, version: int | None = None) -> dict:
+    return {
         "ts": datetime.utcnow().isoformat() + "Z",
-        "action": action,          # e.g., "add", "update", "delete"
+        "action": action,          # e.g., "update", "checkpoint"
+        "version": version,        # 워크스페이스 단위 단조 증가 버전
         "payload": payload         # diff or row id
     }
+
+def append_edit_log(workspace_name: str, action: str, payload: dict, version: int | None = None) -> dict:
+    logp = get_edits_log_path(workspace_name)
+    logp.parent.mkdir(parents=True, exist_ok=True)
+    entry = make_edit_log_entry(action, payload, version)
     with open(logp, "a", encoding="utf-8") as f:
-        f.write(json.dumps(entry, ensure_ascii=False) + "\n
\ No newline at end of file
+        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    return entry
+
+def read_edit_log(workspace_name: str) -> list[dict]:
+    """
+    로그 전체를 순서대로 읽음.
+    - 마지막 줄이 쓰다 만 상태(비정상 종료)면 그 줄만 버림
+    """
+    logp = get_edits_log_path(workspace_name)
+    if not logp.exists():
+        return []
+    entries = []
+    with open(logp, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                break
+    return entries
+
+def rewrite_edit_log(workspace_name: str, entries: list[dict]) -> None:
+    """컴팩션용: temp 파일에 쓴 뒤 os.replace로 로그 전체를 원자적으로 교체"""
+    logp = get_edits_log_path(workspace_name)
+    logp.parent.mkdir(parents=True, exist_ok=True)
+    tmp = logp.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        for entry in entries:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, logp)
@@ -17,29 +17,40 @@ from src.api.constants import (get_setting_file,
                                get_llm_path, 
                                get_visualization_path, 
                                get_journal_path,
+                               get_journal_file,
                                get_voucher_db_path,
-                               get_central_db_path)
+                               get_central_db_path,
+                               get_final_xlsx,
+                               get_logs_path,
+                               FINAL_XLSX,
+                               FINAL_CSV)
 from src.api.models.upload_models import UploadFileRow, compute_file_meta, UploadsIndexRepository, get_uploads_repo
-from src.ant.llm_main import extract_with_locations, draw_overlays
 from src.entjournal.journal_main import (get_json_wt_one_value_from_extract_invoice_fields, 
                                          drop_source_id_from_json, 
                                          make_journal_entry, 
                                          make_journal_entry_to_record_list,
                                          sap_view,
                                          dzone_view)
+from src.entjournal.export import write_xlsx_stream, iter_csv_chunks
 from pathlib import Path
 from typing import Union, Iterable
 from src.api.utils import _now_iso, fs_to_static_url
-from src.entocr.ocr_main import ocr_image_and_save_json_by_extension
 from src.api.db import read_voucher_data, update_voucher_data, initialize_voucher_data
+from src.api.journal import refresh_journal, query_journal_lines, read_journal_lines
+from src.api.archive import archive_workspace_journal, query_archive
+from src.utils.tracing import trace_run, span, render_prometheus
+from src.utils.profiling import profile_session, profiling_requested
+from src.api.warmup import start_warmup
+from contextlib import contextmanager
 import json
 import os
 
 from typing import Optional, List, Dict, Any
-from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Depends, Body
+from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Depends, Body, Query, Header
 from fastapi import Path as ApiPath
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from fastapi.responses import FileResponse, StreamingResponse, PlainTextResponse
 from pydantic import BaseModel
 from typing import Any, Dict, Optional
 import os, json
@@ -117,6 +128,17 @@ class VoucherUpdateBody(BaseModel):
 # ====== FastAPI 앱 ======
 app = FastAPI(title="Workspace API", version="1.0.0")
 
+# API_WARMUP=imports|engines 이면 기동 직후 백그라운드에서 무거운 모듈/엔진을 미리 로드
+@app.on_event("startup")
+def _warmup_on_startup():
+    start_warmup()
+
+# OCR 워커 프로세스(OCR_WORKERS)를 쓰는 경우 진행 중인 작업을 마친 뒤 종료
+@app.on_event("shutdown")
+def _stop_ocr_workers():
+    from src.entocr.ocr_workers import shutdown_ocr_worker_pool
+    shutdown_ocr_worker_pool()
+
 # 필요에 따라 Origin 제한하세요.
 app.add_middleware(
     CORSMiddleware,
@@ -643,75 +665,111 @@ def patch_set_project_name_api(workspaceName: str, body: ProjectMapBody):
 
 app.mount("/static", StaticFiles(directory=str(WORKSPACE_ROOT)), name="static")
 
+# 파이프라인 요청 프로파일링: ?profile=true 또는 X-Profile: 1 → 워크스페이스 logs/ 에 collapsed stack 저장
+@contextmanager
+def _request_profile(workspaceName: str, name: str, *flags):
+    if not profiling_requested(*flags):
+        yield None
+        return
+    with profile_session(get_logs_path(workspaceName), name) as prof:
+        yield prof
+
+def _with_profile_path(resp: ApiResponse, prof) -> ApiResponse:
+    if prof is not None and resp.data is not None:
+        resp.data["profilePath"] = str(prof.path) if prof.path else None
+    return resp
+
 # === 1) OCR + LLM + 시각화 + 분개 파이프라인 실행 ===
 @app.post("/workspaces/{workspaceName}/pipeline/ocr-journal", response_model=ApiResponse)
-def run_ocr_and_journal(workspaceName: str):
+def run_ocr_and_journal(
+    workspaceName: str,
+    profile: bool = Query(False, description="샘플링 프로파일 저장(logs/)"),
+    x_profile: Optional[str] = Header(None),
+):
+    with _request_profile(workspaceName, "pipeline.ocr_journal", profile, x_profile) as prof:
+        resp = _run_ocr_and_journal(workspaceName)
+    return _with_profile_path(resp, prof)
+
+def _run_ocr_and_journal(workspaceName: str) -> ApiResponse:
+    # OCR(paddle/cv2)·LLM(langchain) 모듈은 기동 시간을 위해 첫 실행(또는 warmup) 때 로드
+    from src.entocr.ocr_main import ocr_file
+    from src.ant.llm_main import extract_with_locations, draw_overlays
+
     try:
-        uploaded_files: list[str] = get_uploaded_files_path(workspaceName)  # 내부 구현
-        ocr_results_l, llm_results_l, journal_entry_l = [], [], []
-        visualization_d: Dict[str, str] = {}
-        initialize_voucher_data(workspaceName, True)
-        for file in uploaded_files:
-            ocr_result = ocr_image_and_save_json_by_extension(file)
-            if not ocr_result:
-                # 추후 서버 로깅 권장
-                continue
-
-            # OCR JSON 저장
-            ocr_dir = get_ocr_path(workspaceName)
-            Path(ocr_dir).mkdir(parents=True, exist_ok=True)
-            stem = Path(file).stem
-            ocr_json_path = os.path.join(ocr_dir, f"{stem}.json")
-            with open(ocr_json_path, "w", encoding="utf-8") as f:
-                json.dump(ocr_result, f, ensure_ascii=False, indent=4)
-            ocr_results_l.append(ocr_json_path)
-
-            # LLM 추출/저장
-            data, candidates, selections = extract_with_locations(ocr_result)
-            llm_dir = get_llm_path(workspaceName)
-            Path(llm_dir).mkdir(parents=True, exist_ok=True)
-            with open(os.path.join(llm_dir, f"{stem}_data.json"), "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=4)
-            with open(os.path.join(llm_dir, f"{stem}_candidates.json"), "w", encoding="utf-8") as f:
-                json.dump(candidates, f, ensure_ascii=False, indent=4)
-            with open(os.path.join(llm_dir, f"{stem}_selections.json"), "w", encoding="utf-8") as f:
-                json.dump(selections, f, ensure_ascii=False, indent=4)
-            llm_results_l.append(os.path.join(llm_dir, f"{stem}_data.json"))
-
-            # 시각화 이미지 생성
-            img_path = ocr_result.get("source_image")
-            if img_path:
-                filename = os.path.basename(img_path)
-                viz_dir = get_visualization_path(workspaceName)
-                Path(viz_dir).mkdir(parents=True, exist_ok=True)
-                overlay_path = os.path.join(viz_dir, f"{Path(filename).stem}_overlay.png")
-                draw_overlays(img_path, selections, overlay_path)
-                visualization_d[filename] = overlay_path
-
-            # 분개 생성
-            data_dict = get_json_wt_one_value_from_extract_invoice_fields(data)
-            data_dict = [data_dict]
-            data_dict = drop_source_id_from_json(data_dict)
-            update_voucher_data(workspaceName, file, data_dict[0])
-            record_list = make_journal_entry(data_dict)
-            # record_list = make_journal_entry_to_record_list(result_dict, os.path.basename(file))
-            journal_entry_l.extend(record_list)
-
-        # 상태 반영
-        add_ocr_results(workspaceName, ocr_results_l)
-        add_llm_results(workspaceName, llm_results_l)
-        add_visualization(workspaceName, visualization_d)
-
-        #시연용으로 더존만 내림
-
-        sap_journal_entry_l = sap_view(journal_entry_l)
-        dzone_journal_entry_l = dzone_view(journal_entry_l)
-
-        jpath = os.path.join(get_journal_path(workspaceName), "journal_entry.json")
-        Path(os.path.dirname(jpath)).mkdir(parents=True, exist_ok=True)
-        with open(jpath, "w", encoding="utf-8") as f:
-            json.dump(dzone_journal_entry_l, f, ensure_ascii=False, indent=4)
-        add_journal_drafts(workspaceName, [jpath])
+        # 단계별 소요시간/자원 사용량은 /metrics 로 누적되고, 실행 요약은 워크스페이스 logs/ 에 저장
+        with trace_run("pipeline.ocr_journal", get_logs_path(workspaceName), workspace=workspaceName) as run:
+            uploaded_files: list[str] = get_uploaded_files_path(workspaceName)  # 내부 구현
+            ocr_results_l, llm_results_l, journal_entry_l = [], [], []
+            visualization_d: Dict[str, str] = {}
+            initialize_voucher_data(workspaceName, True)
+            for file in uploaded_files:
+                ocr_result = ocr_file(file)
+                if not ocr_result:
+                    # 추후 서버 로깅 권장
+                    continue
+
+                # OCR JSON 저장
+                ocr_dir = get_ocr_path(workspaceName)
+                Path(ocr_dir).mkdir(parents=True, exist_ok=True)
+                stem = Path(file).stem
+                ocr_json_path = os.path.join(ocr_dir, f"{stem}.json")
+                with span("pipeline.write_ocr_json"):
+                    with open(ocr_json_path, "w", encoding="utf-8") as f:
+                        json.dump(ocr_result, f, ensure_ascii=False, indent=4)
+                ocr_results_l.append(ocr_json_path)
+
+                # LLM 추출/저장
+                data, candidates, selections = extract_with_locations(ocr_result)
+                llm_dir = get_llm_path(workspaceName)
+                Path(llm_dir).mkdir(parents=True, exist_ok=True)
+                with span("pipeline.write_llm_json"):
+                    with open(os.path.join(llm_dir, f"{stem}_data.json"), "w", encoding="utf-8") as f:
+                        json.dump(data, f, ensure_ascii=False, indent=4)
+                    with open(os.path.join(llm_dir, f"{stem}_candidates.json"), "w", encoding="utf-8") as f:
+                        json.dump(candidates, f, ensure_ascii=False, indent=4)
+                    with open(os.path.join(llm_dir, f"{stem}_selections.json"), "w", encoding="utf-8") as f:
+                        json.dump(selections, f, ensure_ascii=False, indent=4)
+                llm_results_l.append(os.path.join(llm_dir, f"{stem}_data.json"))
+
+                # 시각화 이미지 생성
+                img_path = ocr_result.get("source_image")
+                # PDF 텍스트 레이어로 추출한 경우 원본 이미지가 없으므로 시각화 생략
+                if img_path and Path(img_path).suffix.lower() != ".pdf":
+                    filename = os.path.basename(img_path)
+                    viz_dir = get_visualization_path(workspaceName)
+                    Path(viz_dir).mkdir(parents=True, exist_ok=True)
+                    overlay_path = os.path.join(viz_dir, f"{Path(filename).stem}_overlay.png")
+                    draw_overlays(img_path, selections, overlay_path)
+                    visualization_d[filename] = overlay_path
+
+                # 분개 생성
+                data_dict = get_json_wt_one_value_from_extract_invoice_fields(data)
+                data_dict = [data_dict]
+                data_dict = drop_source_id_from_json(data_dict)
+                update_voucher_data(workspaceName, file, data_dict[0])
+                with span("journal.make_journal_entry"):
+                    record_list = make_journal_entry(data_dict)
+                # record_list = make_journal_entry_to_record_list(result_dict, os.path.basename(file))
+                journal_entry_l.extend(record_list)
+
+            # 상태 반영
+            add_ocr_results(workspaceName, ocr_results_l)
+            add_llm_results(workspaceName, llm_results_l)
+            add_visualization(workspaceName, visualization_d)
+
+            #시연용으로 더존만 내림
+
+            with span("journal.erp_view"):
+                sap_journal_entry_l = sap_view(journal_entry_l)
+                dzone_journal_entry_l = dzone_view(journal_entry_l)
+
+            jpath = os.path.join(get_journal_path(workspaceName), "journal_entry.json")
+            Path(os.path.dirname(jpath)).mkdir(parents=True, exist_ok=True)
+            with span("journal.write"):
+                with open(jpath, "w", encoding="utf-8") as f:
+                    json.dump(dzone_journal_entry_l, f, ensure_ascii=False, indent=4)
+            add_journal_drafts(workspaceName, [jpath])
+            run.attrs["files"] = len(uploaded_files)
 
         # 시각화 경로는 /static URL도 같이 내려주자
         viz_for_front = {
@@ -725,7 +783,8 @@ def run_ocr_and_journal(workspaceName: str):
                 "llmResults": llm_results_l,
                 "journalPath": jpath,
                 "visualizations": viz_for_front,
-                "journal": dzone_journal_entry_l
+                "journal": dzone_journal_entry_l,
+                "runSummaryPath": str(run.summary_path) if run.summary_path else None
             },
             error=None,
             ts=_now_iso()
@@ -735,14 +794,36 @@ def run_ocr_and_journal(workspaceName: str):
 
 # === 2) 분개 초안 조회 ===
 @app.get("/workspaces/{workspaceName}/journal-drafts", response_model=ApiResponse)
-def get_journal_drafts_api(workspaceName: str):
+def get_journal_drafts_api(
+    workspaceName: str,
+    cursor: Optional[str] = Query(None, description="이전 응답의 nextCursor"),
+    limit: Optional[int] = Query(None, ge=1, le=5000, description="페이지 크기(미지정 시 전체)"),
+    fields: Optional[str] = Query(None, description="내려받을 컬럼(쉼표 구분)"),
+    sort: Optional[str] = Query(None, description="정렬 필드, '-' 접두사면 내림차순"),
+    dateFrom: Optional[str] = Query(None, description="전표일자 시작(YYYY-MM-DD)"),
+    dateTo: Optional[str] = Query(None, description="전표일자 끝(YYYY-MM-DD)"),
+    accountCode: Optional[str] = Query(None, description="계정코드(쉼표 구분)"),
+    project: Optional[str] = Query(None, description="프로젝트코드(쉼표 구분)"),
+    vendor: Optional[str] = Query(None, description="거래처명(쉼표 구분)"),
+):
+    def _csv(v: Optional[str]) -> Optional[List[str]]:
+        return [x.strip() for x in v.split(",") if x.strip()] if v else None
     try:
-        jpath = os.path.join(get_journal_path(workspaceName), "journal_entry.json")
-        if not Path(jpath).exists():
-            return ApiResponse(ok=True, data={"journal": []}, error=None, ts=_now_iso())
-        with open(jpath, "r", encoding="utf-8") as f:
-            journal_entry_l = json.load(f)
-        return ApiResponse(ok=True, data={"journal": journal_entry_l}, error=None, ts=_now_iso())
+        result = query_journal_lines(
+            workspaceName,
+            cursor=cursor,
+            limit=limit,
+            fields=_csv(fields),
+            sort=sort,
+            date_from=dateFrom,
+            date_to=dateTo,
+            account=_csv(accountCode),
+            project=_csv(project),
+            vendor=_csv(vendor),
+        )
+        return ApiResponse(ok=True, data=result, error=None, ts=_now_iso())
+    except ValueError as e:
+        return ApiResponse(ok=False, data=None, error=str(e), ts=_now_iso())
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -775,19 +856,17 @@ def patch_update_voucher_data_api(
 
 # === 5) VoucherData 기반 분개 재생성(새로고침) ===
 @app.post("/workspaces/{workspaceName}/journal/refresh", response_model=ApiResponse)
-def refresh_journal_entries_api(workspaceName: str):
+def refresh_journal_entries_api(
+    workspaceName: str,
+    profile: bool = Query(False, description="샘플링 프로파일 저장(logs/)"),
+    x_profile: Optional[str] = Header(None),
+):
     try:
-        ds = read_voucher_data(workspaceName)
-        journal_entry_l = []
-        for file_id, data in ds.items():
-            record_list = make_journal_entry(data)
-            # record_list = make_journal_entry_to_record_list(result_dict, os.path.basename(file_id))
-            journal_entry_l.extend(record_list)
-        jpath = os.path.join(get_journal_path(workspaceName), "journal_entry.json")
-        Path(os.path.dirname(jpath)).mkdir(parents=True, exist_ok=True)
-        with open(jpath, "w", encoding="utf-8") as f:
-            json.dump(journal_entry_l, f, ensure_ascii=False, indent=4)
-        return ApiResponse(ok=True, data={"journal": journal_entry_l, "journalPath": jpath}, error=None, ts=_now_iso())
+        with _request_profile(workspaceName, "journal.refresh", profile, x_profile) as prof:
+            journal_entry_l, stats = refresh_journal(workspaceName)
+        jpath = str(get_journal_file(workspaceName))
+        resp = ApiResponse(ok=True, data={"journal": journal_entry_l, "journalPath": jpath, "refresh": stats}, error=None, ts=_now_iso())
+        return _with_profile_path(resp, prof)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -795,7 +874,7 @@ def refresh_journal_entries_api(workspaceName: str):
 @app.get("/workspaces/{workspaceName}/visualizations/{fileId:path}", response_model=ApiResponse)
 def get_visualization_image_path_api(workspaceName: str, fileId: str = ApiPath(...)):
     try:
-        settings_d = _read_setting(get_setting_file(workspaceName))
+        settings_d = _read_setting(get_setting_file(workspaceName), cached=True)
         visualization_d = settings_d.get("files", {}).get("visualization", {})
         fs_path = visualization_d.get(os.path.basename(fileId), "")
         if not fs_path:
@@ -809,27 +888,55 @@ def get_visualization_image_path_api(workspaceName: str, fileId: str = ApiPath(.
 @app.post("/workspaces/{workspaceName}/journal/archive", response_model=ApiResponse)
 def archive_journal_entry_api(workspaceName: str):
     try:
-        central = os.path.join(get_central_db_path(), "journal_entry.json")
-        Path(os.path.dirname(central)).mkdir(parents=True, exist_ok=True)
-        central_d = {}
-        if Path(central).exists():
-            with open(central, "r", encoding="utf-8") as f:
-                central_d = json.load(f)
-
-        current_path = os.path.join(get_journal_path(workspaceName), "journal_entry.json")
-        if not Path(current_path).exists():
-            return ApiResponse(ok=False, data=None, error="Current journal not found", ts=_now_iso())
-        with open(current_path, "r", encoding="utf-8") as f:
-            current_l = json.load(f)
-
-        central_d[workspaceName] = current_l
-        with open(central, "w", encoding="utf-8") as f:
-            json.dump(central_d, f, ensure_ascii=False, indent=4)
-
-        return ApiResponse(ok=True, data={"archivePath": central, "workspaceName": workspaceName}, error=None, ts=_now_iso())
+        result = archive_workspace_journal(workspaceName)
+        return ApiResponse(ok=True, data=result, error=None, ts=_now_iso())
+    except FileNotFoundError as e:
+        return ApiResponse(ok=False, data=None, error=str(e), ts=_now_iso())
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# === 8) 분개 아카이브 조회 ===
+@app.get("/journal/archive", response_model=ApiResponse)
+def query_journal_archive_api(
+    workspaceName: Optional[str] = Query(None),
+    periodFrom: Optional[str] = Query(None, description="YYYY-MM"),
+    periodTo: Optional[str] = Query(None, description="YYYY-MM"),
+    project: Optional[str] = Query(None, description="프로젝트코드(쉼표 구분)"),
+    limit: Optional[int] = Query(None, ge=1),
+):
+    try:
+        projects = [x.strip() for x in project.split(",") if x.strip()] if project else None
+        result = query_archive(workspaceName, periodFrom, periodTo, projects, limit)
+        return ApiResponse(ok=True, data=result, error=None, ts=_now_iso())
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
     
+# === 9) 분개 내보내기(XLSX/CSV) ===
+@app.get("/workspaces/{workspaceName}/journal/export")
+def export_journal_api(workspaceName: str, format: str = Query("xlsx", pattern="^(xlsx|csv)$")):
+    try:
+        lines = read_journal_lines(workspaceName)
+        if format == "csv":
+            return StreamingResponse(
+                iter_csv_chunks(lines),
+                media_type="text/csv; charset=utf-8",
+                headers={"Content-Disposition": f'attachment; filename="{FINAL_CSV}"'},
+            )
+        out = get_final_xlsx(workspaceName)
+        write_xlsx_stream(lines, out)
+        return FileResponse(
+            out,
+            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            filename=FINAL_XLSX,
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# === 10) 메트릭(Prometheus 텍스트 포맷) ===
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics_api():
+    return PlainTextResponse(render_prometheus(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
 if __name__ == "__main__":
     # get_voucher_data_api("wshopp", "C:\\Users\\ykim513\\Desktop\\PythonWorkspace\\Entocr\\workspace\\wshopp\\input_files\\HUNTRIX.png")
     # refresh_journal_entries_api("wshopp")
@@ -0,0 +1,51 @@
+import json
+import uuid
+
+import pytest
+
+import src.api.constants as constants
+from src.api import archive, journal
+
+
+@pytest.fixture
+def central(tmp_path, monkeypatch):
+    monkeypatch.setattr(constants, "WORKSPACE_ROOT", tmp_path)
+    monkeypatch.setattr(constants, "DB_ROOT", tmp_path / "central_db")
+    return tmp_path
+
+
+def _line(date, project="HUNTRIX001"):
+    return {"전표일자": date, "프로젝트코드": project, "금액(원화)": 1000}
+
+
+def test_archive_replaces_only_own_partitions(central):
+    ws_a, ws_b = f"a_{uuid.uuid4().hex[:6]}", f"b_{uuid.uuid4().hex[:6]}"
+    journal.write_journal(ws_a, [_line("2025-11-03"), _line("2025-12-01", "루미01")])
+    journal.write_journal(ws_b, [_line("2025-12-15")])
+    archive.archive_workspace_journal(ws_a)
+    archive.archive_workspace_journal(ws_b)
+
+    # a 를 12월분만으로 다시 아카이브 → a/2025-11 파티션 제거, b 는 그대로
+    journal.write_journal(ws_a, [_line("2025-12-02")])
+    archive.archive_workspace_journal(ws_a)
+
+    manifest = archive.read_archive_manifest()
+    assert sorted(manifest["partitions"]) == sorted([f"{ws_a}/2025-12", f"{ws_b}/2025-12"])
+    assert not (constants.get_archive_partition_root() / ws_a / "2025-11.jsonl").exists()
+
+    result = archive.query_archive(period_from="2025-12", period_to="2025-12")
+    assert {(r["workspaceName"], r["전표일자"]) for r in result["journal"]} == {(ws_a, "2025-12-02"), (ws_b, "2025-12-15")}
+
+
+def test_query_skips_partitions_by_project_and_migrates_legacy(central):
+    legacy = constants.get_central_db_path() / constants.CENTRAL_JOURNAL_FILE
+    legacy.parent.mkdir(parents=True)
+    legacy.write_text(json.dumps({
+        "old": [_line("2025-10-01", "조이01"), _line("2025-11-01", "미라01")],
+    }, ensure_ascii=False), encoding="utf-8")
+
+    result = archive.query_archive(projects=["미라01"])
+
+    assert result["partitions"] == ["old/2025-11"]
+    assert [r["프로젝트코드"] for r in result["journal"]] == ["미라01"]
+    assert not legacy.exists()
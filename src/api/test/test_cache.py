@@ -0,0 +1,48 @@
+import json
+import os
+
+from src.api.cache import JsonFileCache
+
+
+def _write(path, data):
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def test_hit_until_file_changes(tmp_path):
+    p = tmp_path / "setting.json"
+    _write(p, {"version": 1})
+    cache = JsonFileCache()
+
+    first = cache.get(p)
+    assert cache.get(p) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    _write(p, {"version": 22})
+    st = os.stat(p)
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert cache.get(p) == {"version": 22}
+
+
+def test_invalidate_forces_reload(tmp_path):
+    p = tmp_path / "uploads_index.json"
+    _write(p, {"version": 1})
+    cache = JsonFileCache()
+    cache.get(p)
+    cache.invalidate(p)
+    cache.get(p)
+    assert cache.misses == 2
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = JsonFileCache(max_entries=2)
+    paths = [tmp_path / f"{i}.json" for i in range(3)]
+    for i, p in enumerate(paths):
+        _write(p, {"i": i})
+    cache.get(paths[0])
+    cache.get(paths[1])
+    cache.get(paths[0])
+    cache.get(paths[2])  # paths[1] 제거
+
+    cache.get(paths[0])
+    cache.get(paths[1])
+    assert cache.misses == 4
@@ -0,0 +1,82 @@
+import json
+import uuid
+
+import pytest
+
+import src.api.constants as constants
+from src.api import db
+from src.api.log import read_edit_log
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    monkeypatch.setattr(constants, "WORKSPACE_ROOT", tmp_path)
+    return f"ws_{uuid.uuid4().hex[:8]}"
+
+
+def test_update_appends_delta_instead_of_rewriting_snapshot(workspace):
+    """
+    수정은 편집 로그에 변경 필드만 append 되고, 스냅샷은 다시 쓰지 않음
+    """
+    db.initialize_voucher_data(workspace, reset=True)
+    db.update_voucher_data(workspace, "a.png", {"금액": "1000", "거래처": "A"})
+    db.update_voucher_data(workspace, "a.png", {"금액": "2000", "거래처": "A"})
+
+    snapshot = json.loads(constants.get_voucher_db_path(workspace).read_text(encoding="utf-8"))
+    assert snapshot == {db.SNAPSHOT_VERSION_KEY: 0}
+
+    updates = [e for e in read_edit_log(workspace) if e["action"] == "update"]
+    assert [e["version"] for e in updates] == [1, 2]
+    assert updates[1]["payload"] == {"file_id": "a.png", "set": {"금액": "2000"}, "unset": []}
+    assert db.read_voucher_data(workspace)["a.png"] == {"금액": "2000", "거래처": "A"}
+
+
+def test_replay_restores_state_after_restart(workspace):
+    """
+    프로세스 재시작(메모리 상태 유실) 후 스냅샷 + 로그 재생으로 동일 상태 복원
+    """
+    db.initialize_voucher_data(workspace, reset=True)
+    db.update_voucher_data(workspace, "a.png", {"금액": "1000", "유형": "식비"})
+    db.update_voucher_data(workspace, "a.png", {"금액": "1000"})
+    expected = db.read_voucher_data(workspace)
+
+    db._STATES.pop(workspace)
+    assert db.read_voucher_data(workspace) == expected == {"a.png": {"금액": "1000"}}
+
+
+def test_compaction_folds_log_into_snapshot(workspace):
+    db.initialize_voucher_data(workspace, reset=True)
+    for i in range(5):
+        db.update_voucher_data(workspace, f"{i}.png", {"금액": str(i)})
+
+    version = db.compact_voucher_log(workspace)
+
+    assert version == 5
+    snapshot = json.loads(constants.get_voucher_db_path(workspace).read_text(encoding="utf-8"))
+    assert snapshot.pop(db.SNAPSHOT_VERSION_KEY) == 5
+    assert snapshot == {f"{i}.png": {"금액": str(i)} for i in range(5)}
+    assert [e["action"] for e in read_edit_log(workspace)] == ["checkpoint"]
+
+    db.update_voucher_data(workspace, "0.png", {"금액": "9"})
+    db._STATES.pop(workspace)
+    assert db.read_voucher_data(workspace)["0.png"] == {"금액": "9"}
+    assert read_edit_log(workspace)[-1]["version"] == 6
+
+
+def test_crash_between_snapshot_and_log_rewrite(workspace):
+    """
+    전체 저장 중 스냅샷만 교체되고 로그는 옛 것으로 남아도, 이미 반영된 편집을 다시 적용하지 않음
+    """
+    db.initialize_voucher_data(workspace, reset=True)
+    db.update_voucher_data(workspace, "a.png", {"금액": "1000", "거래처": "A"})
+    log_path = constants.get_edits_log_path(workspace)
+    old_log = log_path.read_text(encoding="utf-8")
+
+    db.write_voucher_data(workspace, {"a.png": {"금액": "2000"}})
+    log_path.write_text(old_log, encoding="utf-8")
+    db._STATES.pop(workspace)
+
+    assert db.read_voucher_data(workspace) == {"a.png": {"금액": "2000"}}
+    db.update_voucher_data(workspace, "b.png", {"금액": "3000"})
+    db._STATES.pop(workspace)
+    assert db.read_voucher_data(workspace) == {"a.png": {"금액": "2000"}, "b.png": {"금액": "3000"}}
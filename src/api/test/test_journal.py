@@ -0,0 +1,109 @@
+import uuid
+
+import pytest
+
+import src.api.constants as constants
+from src.api import db, journal
+from src.entjournal.journal_main import make_journal_entry
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    monkeypatch.setattr(constants, "WORKSPACE_ROOT", tmp_path)
+    return f"ws_{uuid.uuid4().hex[:8]}"
+
+
+def _voucher(file_id, amount, project="루미", account="연예보조_기타"):
+    return {
+        "file_id": file_id,
+        "날짜": "2025-12-01",
+        "거래처": "거래처A",
+        "금액": amount,
+        "계정과목": account,
+        "계정코드": "8000000",
+        "유형": "기타",
+        "증빙유형": "영수증",
+        "프로젝트명": project,
+    }
+
+
+def _full_rebuild(ds):
+    lines = []
+    for journal_no, data in enumerate(ds.values()):
+        lines.extend(journal.renumber_journal_lines(make_journal_entry(data), journal_no))
+    return lines
+
+
+def _strip_ts(lines):
+    return [{k: v for k, v in l.items() if k != "입력일시"} for l in lines]
+
+
+def test_refresh_regenerates_only_changed_voucher(workspace):
+    db.initialize_voucher_data(workspace, reset=True)
+    db.update_voucher_data(workspace, "a.png", _voucher("a.png", 1000))
+    db.update_voucher_data(workspace, "b.png", _voucher("b.png", 3000, project="HUNTRIX"))
+    db.update_voucher_data(workspace, "c.png", _voucher("c.png", 500))
+
+    _, stats = journal.refresh_journal(workspace)
+    assert stats["regenerated"] == 3
+
+    _, stats = journal.refresh_journal(workspace)
+    assert stats == {"regenerated": 0, "reused": 3, "removed": 0, "written": False}
+
+    db.update_voucher_data(workspace, "b.png", _voucher("b.png", 6000, project="HUNTRIX"))
+    lines, stats = journal.refresh_journal(workspace)
+    assert (stats["regenerated"], stats["reused"]) == (1, 2)
+
+    # 분할(HUNTRIX 3인) 포함, 전체 재생성과 동일한 번호/내용
+    expected = _full_rebuild(db.read_voucher_data(workspace))
+    assert _strip_ts(lines) == _strip_ts(expected)
+    assert _strip_ts(journal.read_journal_lines(workspace)) == _strip_ts(expected)
+    assert [(l["전표번호"], l["라인번호"]) for l in lines if l["file_id"] == "b.png"] == [(1, 1), (1, 2), (1, 3), (1, 4)]
+
+
+def test_refresh_falls_back_to_full_rebuild_when_journal_replaced(workspace):
+    db.initialize_voucher_data(workspace, reset=True)
+    db.update_voucher_data(workspace, "a.png", _voucher("a.png", 1000))
+    journal.refresh_journal(workspace)
+
+    # 파이프라인 등이 인덱스 없이 journal_entry.json 을 덮어쓴 경우
+    constants.get_journal_file(workspace).write_text("[]", encoding="utf-8")
+
+    lines, stats = journal.refresh_journal(workspace)
+    assert stats["regenerated"] == 1
+    assert len(lines) == 2
+
+
+def test_query_paginates_filters_and_projects(workspace):
+    lines = []
+    for i in range(25):
+        lines.append({
+            "전표번호": i, "라인번호": 1,
+            "전표일자": f"2025-12-{i + 1:02d}",
+            "계정코드": "8000000" if i % 2 else "2530000",
+            "프로젝트코드": "HUNTRIX001",
+            "거래처명": f"V{i % 3}",
+            "금액(원화)": i * 100,
+        })
+    journal.write_journal(workspace, lines)
+
+    page = journal.query_journal_lines(
+        workspace, limit=5, fields=["전표번호", "금액(원화)"], sort="-금액(원화)",
+        date_from="2025-12-05", date_to="2025-12-20", account=["8000000"],
+    )
+    seen = [r["전표번호"] for r in page["journal"]]
+    while page["nextCursor"]:
+        page = journal.query_journal_lines(
+            workspace, cursor=page["nextCursor"], limit=5, fields=["전표번호", "금액(원화)"],
+            sort="-금액(원화)", date_from="2025-12-05", date_to="2025-12-20", account=["8000000"],
+        )
+        seen += [r["전표번호"] for r in page["journal"]]
+
+    assert page["total"] == 8
+    assert seen == [19, 17, 15, 13, 11, 9, 7, 5]
+    assert set(page["journal"][0]) == {"전표번호", "금액(원화)"}
+
+    first = journal.query_journal_lines(workspace, limit=5, vendor=["V0"])
+    journal.write_journal(workspace, lines[:3])
+    with pytest.raises(ValueError):
+        journal.query_journal_lines(workspace, cursor=first["nextCursor"], limit=5, vendor=["V0"])
@@ -0,0 +1,41 @@
+import time
+
+from src.utils import profiling
+from src.utils.profiling import profile_session, profiling_requested
+
+
+def _busy_stage(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        sum(range(1000))
+
+
+def test_profile_session_writes_collapsed_stacks(tmp_path):
+    with profile_session(tmp_path, "pipeline.test", interval=0.001) as prof:
+        _busy_stage(0.1)
+
+    assert prof.path.parent == tmp_path and prof.path.suffix == ".collapsed"
+    lines = prof.path.read_text(encoding="utf-8").splitlines()
+    assert lines and all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert any("_busy_stage" in line for line in lines)
+
+
+def test_concurrent_profiles_are_capped(tmp_path):
+    held = [profile_session(tmp_path, f"held{i}") for i in range(profiling.MAX_CONCURRENT_PROFILES)]
+    sessions = [cm.__enter__() for cm in held]
+    try:
+        assert all(s is not None for s in sessions)
+        with profile_session(tmp_path, "extra") as prof:
+            assert prof is None
+    finally:
+        for cm in held:
+            cm.__exit__(None, None, None)
+
+    with profile_session(tmp_path, "after") as prof:
+        assert prof is not None
+
+
+def test_profiling_requested_flags():
+    assert profiling_requested(False, "1")
+    assert profiling_requested(True, None)
+    assert not profiling_requested(False, None, "0")
@@ -0,0 +1,39 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+HEAVY_MODULES = ["paddleocr", "paddlex", "cv2", "fitz", "langchain_openai", "openai", "pandas", "openpyxl"]
+
+
+def _loaded_after(statement):
+    code = f"import sys, json; {statement}; print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    out = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def test_api_import_does_not_load_engines():
+    assert _loaded_after("import src.api.main") == []
+
+
+def test_cli_import_does_not_load_engines():
+    assert _loaded_after("import src.entocr.cli; import src.entocr") == []
+
+
+def test_engine_warmup_starts_worker_pool_instead_of_engine(monkeypatch):
+    # OCR_WORKERS 사용 시 API 프로세스에는 엔진을 만들지 않음
+    from config.settings import settings
+    from src.api import warmup
+    from src.entocr import ocr_main, ocr_workers
+
+    calls = []
+    monkeypatch.setattr(warmup, "WARMUP_MODULES", ())
+    monkeypatch.setattr(settings, "ocr_workers", 2)
+    monkeypatch.setattr(ocr_workers, "get_ocr_worker_pool", lambda: calls.append("pool"))
+    monkeypatch.setattr(ocr_main, "get_shared_extractor", lambda: calls.append("engine"))
+
+    state = warmup.warmup("engines")
+
+    assert calls == ["pool"]
+    assert state["errors"] == []
@@ -0,0 +1,70 @@
+import json
+
+import pytest
+
+from src.utils import tracing
+from src.utils.tracing import span, trace_run, traced
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    tracing.REGISTRY.reset()
+    yield
+    tracing.REGISTRY.reset()
+
+
+def test_spans_aggregate_into_prometheus_metrics():
+    @traced("test.stage")
+    def stage(fail=False):
+        if fail:
+            raise ValueError("boom")
+
+    stage()
+    with pytest.raises(ValueError):
+        stage(fail=True)
+
+    stats = tracing.REGISTRY.snapshot()["test.stage"]
+    assert stats["count"] == 2 and stats["errors"] == 1
+
+    text = tracing.render_prometheus()
+    assert 'voucherai_span_seconds_count{span="test.stage"} 2' in text
+    assert 'voucherai_span_seconds_bucket{span="test.stage",le="+Inf"} 2' in text
+    assert 'voucherai_span_errors_total{span="test.stage"} 1' in text
+
+
+def test_trace_run_writes_summary_with_nested_spans(tmp_path):
+    with trace_run("pipeline.test", tmp_path, workspace="ws") as run:
+        with span("outer"):
+            with span("inner", n=3) as sp:
+                with open(tmp_path / "out.txt", "w") as f:
+                    f.write("x" * 1000)
+                sp.set(done=True)
+
+    summary = json.loads(run.summary_path.read_text(encoding="utf-8"))
+    assert run.summary_path.parent == tmp_path
+    assert summary["run"] == "pipeline.test" and summary["attrs"] == {"workspace": "ws"}
+    by_name = {s["name"]: s for s in summary["spans"]}
+    assert by_name["inner"]["parent"] == "outer"
+    assert by_name["inner"]["attrs"] == {"n": 3, "done": True}
+    assert by_name["outer"]["parent"] == "pipeline.test"
+    assert set(summary["totals"]) == {"pipeline.test", "outer", "inner"}
+    assert summary["wall_s"] >= by_name["outer"]["wall_s"]
+    if tracing.PSUTIL_AVAILABLE:
+        assert by_name["inner"]["bytes_written"] >= 1000
+
+
+def test_trace_run_summary_failures_do_not_fail_the_run(tmp_path, monkeypatch):
+    np = pytest.importorskip("numpy")
+    with trace_run("pipeline.test", tmp_path) as run:
+        with span("ocr.stage") as sp:
+            sp.set(score=np.float32(0.5))
+    summary = json.loads(run.summary_path.read_text(encoding="utf-8"))
+    assert summary["spans"][0]["attrs"] == {"score": "0.5"}
+
+    def broken(run, out_dir):
+        raise TypeError("not serializable")
+
+    monkeypatch.setattr(tracing, "write_run_summary", broken)
+    with trace_run("pipeline.test", tmp_path) as run:
+        pass
+    assert run.summary_path is None
@@ -7,6 +7,7 @@ _write_setting)
 
 from src.api.constants import *
 from pathlib import Path
+from functools import lru_cache
 from typing import Union, Iterable
 import shutil
 import zipfile
@@ -16,6 +17,7 @@ import json
 import mimetypes
 from datetime import datetime
 from src.api.utils import _now_iso
+from src.api.cache import read_json_cached, invalidate_cached
 
 DEFAULT_ALLOWED_EXT = (".png",".jpg",".jpeg")
 
@@ -286,7 +288,7 @@ def extract_zip_to_workspace(
 # 업로드된 파일 리스트 읽기
 def list_uploaded_files(workspace_name: str) -> list[str]:
     # uploads_index = get_uploads_index_path(workspace_name)
-    uploads_index = _read_uploads_index(workspace_name)
+    uploads_index = _read_uploads_index(workspace_name, cached=True)
     files_list = uploads_index["files"]
     return files_list
 
@@ -294,6 +296,11 @@ def list_uploaded_files(workspace_name: str) -> list[str]:
 
 # 파일 삭제 처리 함수 > 정리 필요
 
+@lru_cache(maxsize=8)
+def _resolved_root(project_root: Path) -> Path:
+    # 분개 라인마다 호출되므로 루트 resolve 는 한 번만
+    return project_root.resolve()
+
 def _normalize_rel(path: str | Path, project_root: Path = PROJECT_ROOT) -> str:
     """PROJECT_ROOT 기준 상대경로 (POSIX 문자열)로 표준화"""
     if isinstance(path, str):
@@ -301,7 +308,7 @@ def _normalize_rel(path: str | Path, project_root: Path = PROJECT_ROOT) -> str:
 
     try:
         # 절대경로화 후 PROJECT_ROOT 기준 상대경로 계산
-        rel = path.resolve().relative_to(project_root.resolve())
+        rel = path.resolve().relative_to(_resolved_root(project_root))
     except Exception:
         # relative_to 실패하면 그냥 파일명만 사용 (fallback)
         rel = path.name
@@ -311,7 +318,7 @@ def _normalize_rel(path: str | Path, project_root: Path = PROJECT_ROOT) -> str:
 
 def get_excluded_files(workspace_name: str) -> set[str]:
     sf = get_setting_file(workspace_name)
-    data = _read_setting(sf)
+    data = _read_setting(sf, cached=True)
     return set(data.get("files", {}).get("excluded", []))
 
 def set_files_excluded(workspace_name: str, paths: list[str], excluded: bool, client_version: int | None = None) -> dict:
@@ -344,7 +351,7 @@ def set_files_excluded(workspace_name: str, paths: list[str], excluded: bool, cl
 # --- 현재 업로드 상태(프런트에 바로 주기 좋음) ---
 def list_uploads_state(workspace_name: str) -> dict:
     sf = get_setting_file(workspace_name)
-    data = _read_setting(sf)
+    data = _read_setting(sf, cached=True)
     uploaded = list(data.get("files", {}).get("uploaded", []))
     excluded = set(data.get("files", {}).get("excluded", []))
     effective = [p for p in uploaded if p not in excluded]
@@ -356,15 +363,18 @@ def list_uploads_state(workspace_name: str) -> dict:
     }
 
 
-def _read_uploads_index(workspace_name: str) -> dict:
+def _read_uploads_index(workspace_name: str, *, cached: bool = False) -> dict:
+    """cached=True: 조회 전용(반환 객체 수정 금지)"""
     p = get_uploads_index_path(workspace_name)
     if not p.exists():
         return {"version": 1, "updated_at": _now_iso(), "files": []}
+    if cached:
+        return read_json_cached(p)
     return json.loads(p.read_text(encoding="utf-8"))
 
 def get_uploaded_files_path(workspace_name: str) -> list[str]:
     # uploads_index = get_uploads_index_path(workspace_name)
-    uploads_index = _read_uploads_index(workspace_name)
+    uploads_index = _read_uploads_index(workspace_name, cached=True)
     uploaded_files = uploads_index.get("files", [])
     return [os.path.join(PROJECT_ROOT, file.get("rel")) for file in uploaded_files]
 
@@ -376,6 +386,7 @@ def _write_uploads_index(workspace_name: str, data: dict) -> None:
     tmp = p.with_suffix(".tmp")
     tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
     os.replace(tmp, p)
+    invalidate_cached(p)
 
 def _file_record(rel: str) -> dict:
     # 기본 레코드 스키마(필요 시 확장: owner, notes, labels 등)
@@ -402,7 +413,7 @@ def sync_uploads_index_from_settings(workspace_name: str) -> dict:
     - excluded 상태: (선택) 캐시 갱신
     return: uploads_index 최신 스냅샷
     """
-    sf = _read_setting(get_setting_file(workspace_name))
+    sf = _read_setting(get_setting_file(workspace_name), cached=True)
     uploaded = set(sf.get("files", {}).get("uploaded", []))
     excluded = set(sf.get("files", {}).get("excluded", []))
 
@@ -427,8 +438,8 @@ def list_uploads_with_projects(workspace_name: str) -> dict:
     """
     프런트로 반환하기 좋은 통합 뷰
     """
-    sf = _read_setting(get_setting_file(workspace_name))
-    idx = _read_uploads_index(workspace_name)
+    sf = _read_setting(get_setting_file(workspace_name), cached=True)
+    idx = _read_uploads_index(workspace_name, cached=True)
     uploaded = sf.get("files", {}).get("uploaded", [])
     excluded = set(sf.get("files", {}).get("excluded", []))
     # 인덱스 맵
@@ -509,7 +520,7 @@ def bulk_set_file_project(
     if if_match_index_version is not None and if_match_index_version != cur_ver:
         raise RuntimeError(f"version_conflict: client={if_match_index_version}, server={cur_ver}")
 
-    sf = _read_setting(get_setting_file(workspace_name))
+    sf = _read_setting(get_setting_file(workspace_name), cached=True)
     uploaded = set(sf.get("files", {}).get("uploaded", []))
     rec_map = {f["rel"]: f for f in idx.get("files", [])}
 
@@ -8,11 +8,13 @@ from datetime import date
 from decimal import Decimal, InvalidOperation
 from typing import Optional
 from src.api.constants import WORKSPACE_ROOT
+from src.api.cache import invalidate_cached
 
 def _atomic_write_json(path: Path, data: dict):
     tmp = path.with_suffix(".tmp")
     tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
     os.replace(tmp, path)
+    invalidate_cached(path)
     
 def _now_iso() -> str:
     return datetime.utcnow().isoformat() + "Z"
@@ -0,0 +1,75 @@
+"""
+기동 시간 최적화: API 모듈은 가벼운 엔드포인트(워크스페이스/업로드/전표 편집)만으로 빠르게 뜨도록
+OCR(paddleocr·cv2·PyMuPDF), LLM(langchain), pandas 를 첫 사용 시점에 import 합니다.
+첫 파이프라인 요청의 지연을 없애려면 API_WARMUP 으로 기동 직후 백그라운드 로드:
+- "imports": 무거운 모듈 import 만
+- "engines": import + OCR 엔진(PaddleOCR 모델) 초기화 (OCR_WORKERS 사용 시 워커 풀 기동 — 엔진은 각 워커에서 로드)
+"""
+import importlib
+import os
+import threading
+import time
+
+from loguru import logger
+
+from src.utils.tracing import span
+
+WARMUP_MODULES = (
+    "pandas",
+    "src.entocr.ocr_main",
+    "src.entocr.ocr_service",
+    "src.entocr.pdf_converter",
+    "fitz",
+    "paddleocr",
+    "src.ant.llm_main",
+    "langchain_openai",
+)
+
+_state = {"status": "idle", "seconds": None, "errors": []}
+_lock = threading.Lock()
+
+
+def warmup(level: str = "imports") -> dict:
+    """무거운 모듈(및 level=engines 면 OCR 엔진)을 로드. 실패해도 예외 없이 기록만"""
+    t0 = time.perf_counter()
+    errors = []
+    with span("api.warmup", level=level):
+        for name in WARMUP_MODULES:
+            try:
+                importlib.import_module(name)
+            except Exception as e:
+                errors.append(f"{name}: {e}")
+        if level == "engines":
+            try:
+                from config.settings import settings
+                if settings.ocr_workers > 0:
+                    # OCR 는 워커 프로세스에서 실행 → API 프로세스에는 엔진을 만들지 않고 워커 풀만 기동
+                    from src.entocr.ocr_workers import get_ocr_worker_pool
+                    get_ocr_worker_pool()
+                else:
+                    from src.entocr.ocr_main import get_shared_extractor
+                    get_shared_extractor().ocr_service.ocr_engine
+            except Exception as e:
+                errors.append(f"ocr_engine: {e}")
+    with _lock:
+        _state.update(status="done", seconds=round(time.perf_counter() - t0, 3), errors=errors)
+    for err in errors:
+        logger.warning(f"warmup: {err}")
+    return dict(_state)
+
+def start_warmup(level: str | None = None) -> threading.Thread | None:
+    """API_WARMUP 설정 시 백그라운드 스레드로 warmup 시작(요청 처리를 막지 않음)"""
+    level = (level or os.getenv("API_WARMUP", "")).strip().lower()
+    if level not in ("imports", "engines"):
+        return None
+    with _lock:
+        if _state["status"] != "idle":
+            return None
+        _state["status"] = "running"
+    t = threading.Thread(target=warmup, args=(level,), name="api-warmup", daemon=True)
+    t.start()
+    return t
+
+def warmup_status() -> dict:
+    with _lock:
+        return dict(_state)
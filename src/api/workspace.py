@@ -5,6 +5,7 @@ from pathlib import Path
 from src.api.constants import *
 import shutil
 from src.api.utils import _atomic_write_json, _now_iso, _read_json
+from src.api.cache import read_json_cached, invalidate_cached
 
 # 프런트 통신용 함수
 
@@ -87,11 +88,17 @@ def init_setting_file(workspace_name: str) -> None:
         }
     }
     setting_file.write_text(json.dumps(base_doc, indent=2, ensure_ascii=False), encoding="utf-8")
+    invalidate_cached(setting_file)
 
 # === Internal I/O ===
-def _read_setting(path: Path) -> Dict[str, Any]:
+def _read_setting(path: Path, *, cached: bool = False) -> Dict[str, Any]:
+    """
+    cached=True: 조회 전용 경로용. (mtime, size) 검증된 캐시 객체를 그대로 반환하므로 수정 금지
+    """
     if not path.exists():
         raise FileNotFoundError(f"setting.json not found: {path}")
+    if cached:
+        return read_json_cached(path)
     return json.loads(path.read_text(encoding="utf-8"))
 
 def _write_setting(path: Path, data: Dict[str, Any]) -> None:
@@ -99,6 +106,7 @@ def _write_setting(path: Path, data: Dict[str, Any]) -> None:
     # 자동 버전 증가
     data["version"] = int(data.get("version", 0)) + 1
     path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    invalidate_cached(path)
 
 
 # === Generic updater ===
@@ -306,7 +314,7 @@ def _collect_workspace_info(path: Path, archived: bool = False) -> dict:
     }
     if setting_file.exists():
         try:
-            data = _read_setting(setting_file)
+            data = _read_setting(setting_file, cached=True)
             info["status"] = data.get("status", info["status"])
             info["updated_at"] = data.get("updated_at").strftime("%Y-%m-%d")
             info["created_at"] = data.get("created_at").strftime("%Y-%m-%d")
@@ -0,0 +1,172 @@
+"""
+DataFrame 기반 분개 일괄 생성.
+
+make_journal_entry 는 라인마다 make_journal_line(큰 dict 리터럴)을 만들고 적요를 두 번,
+_normalize_rel 을 라인마다 호출합니다. 여기서는 voucher 전체를 하나의 테이블로 받아
+대변/차변 라인을 컬럼 연산으로 만든 뒤 한 번에 합칩니다.
+- 결과(라인 순서, 전표번호/라인번호, 금액, 적요 등)는 make_journal_entry 와 동일
+  (라인번호: 대변은 항상 1, 차변은 전체 voucher 에 걸친 누적 번호 - 기존 동작 그대로)
+- 그룹 분할(ACCOUNT_NAME_TO_SPLIT x PROJECT_NAME_GROUP): 1인당 금액은 ROUND_HALF_UP 반올림
+  allocate_remainder=True 면 반올림 잔차를 마지막 구성원에게 몰아서 합계를 원금액과 맞춤
+"""
+import datetime
+import itertools
+from decimal import Decimal
+from typing import Union
+
+import numpy as np
+import pandas as pd
+
+from src.api.upload import _normalize_rel
+from src.entjournal.constants import (AP_ACCOUNT_NAME,
+                                      AP_ACCOUNT_CODE,
+                                      PROJECT_NAME_GROUP,
+                                      ACCOUNT_NAME_TO_SPLIT,
+                                      GROUP_MEMBERS,
+                                      PROJECT_NAME_TO_CODE)
+from src.entjournal.journal_main import _round_krw
+
+# make_journal_line 과 같은 컬럼 순서
+JOURNAL_LINE_COLUMNS = [
+    "회사코드", "전표번호", "전표일자", "작성부서", "작성자", "적요", "회계연도", "회계기간",
+    "전표유형", "승인상태", "자동기표여부", "입력일시", "라인번호", "계정코드", "계정과목명",
+    "차변/대변구분", "금액(원화)", "금액(외화)", "차변", "대변", "거래처코드", "거래처명",
+    "부서코드", "프로젝트코드", "관리항목1", "관리항목2", "사업자등록번호", "증빙일",
+    "참조번호", "손익센터", "개별아이템텍스트", "file_id",
+]
+
+# make_journal_entry 의 Dummy 값과 동일하게 유지
+DEFAULT_ARTIST_CODE = "HUNTRIX001"
+
+_CONSTANT_COLUMNS = {
+    "회사코드": "001",
+    "작성부서": "회계팀",
+    "작성자": "USER",
+    "회계연도": "2025",
+    "회계기간": "12",
+    "전표유형": "SA",
+    "승인상태": "미결",
+    "자동기표여부": "N",
+    "거래처코드": None,
+    "부서코드": "KDH001",
+    "관리항목1": None,
+    "관리항목2": None,
+    "사업자등록번호": None,
+    "참조번호": None,
+    "손익센터": None,
+}
+
+
+def _split_amounts(amount, n_members: int, allocate_remainder: bool) -> list[int]:
+    per_member = _round_krw(Decimal(amount) / n_members)
+    amounts = [per_member] * n_members
+    if allocate_remainder:
+        amounts[-1] = int(Decimal(amount)) - per_member * (n_members - 1)
+    return amounts
+
+def _obj(series: pd.Series) -> np.ndarray:
+    return series.to_numpy(dtype=object)
+
+def _str_obj(series: pd.Series) -> np.ndarray:
+    # pandas 3 의 str(Arrow) dtype 을 거치지 않고 파이썬 문자열 배열로
+    return np.array([str(x) for x in series.to_numpy(dtype=object)], dtype=object)
+
+def _journal_columns(v: pd.DataFrame, now: str, allocate_remainder: bool) -> tuple[int, dict]:
+    """라인 수와 {컬럼: 배열 또는 스칼라}"""
+    n = len(v)
+    journal_no = np.arange(n)
+    amounts = _obj(v["금액"])
+    artists = _obj(v["프로젝트명"])
+    dates = _obj(v["날짜"])
+    file_ids = _obj(v["file_id"].map({f: _normalize_rel(f) for f in v["file_id"].unique()}))
+    date_text = np.array([d.replace("-", "") for d in _str_obj(v["날짜"])], dtype=object)
+    text_prefix = _str_obj(v["증빙유형"]) + "_" + date_text + "_"
+    text_suffix = "_" + _str_obj(v["거래처"]) + "_" + _str_obj(v["유형"])
+
+    # 차변 수: 분할 대상은 구성원 수만큼, 나머지는 1
+    split_mask = (v["계정과목"].isin(ACCOUNT_NAME_TO_SPLIT) & v["프로젝트명"].isin(PROJECT_NAME_GROUP)).to_numpy()
+    members = [GROUP_MEMBERS[a] if m else None for a, m in zip(artists, split_mask)]
+    n_debit = np.array([len(m) if m else 1 for m in members], dtype=np.int64)
+
+    # voucher 당 [대변 1 + 차변 n] 블록. 블록 내 위치 0 = 대변
+    block = 1 + n_debit
+    total = int(block.sum())
+    k = np.repeat(journal_no, block)
+    block_start = np.cumsum(block) - block
+    pos = np.arange(total) - block_start[k]
+    is_credit = pos == 0
+    seq = pos - 1  # 차변 내 순번
+
+    line_artist = artists[k].copy()
+    line_amount = amounts[k].copy()
+    line_code = np.full(total, DEFAULT_ARTIST_CODE, dtype=object)
+    for r in np.flatnonzero(split_mask[k] & ~is_credit):
+        group = members[k[r]]
+        m = seq[r]
+        if m == 0:
+            split_amounts = _split_amounts(amounts[k[r]], len(group), allocate_remainder)
+        line_artist[r] = group[m]
+        line_code[r] = PROJECT_NAME_TO_CODE[group[m]]
+        line_amount[r] = split_amounts[m]
+
+    # 라인번호: 대변 1, 차변은 voucher k 의 m번째 = 1 + Σ_{j<k}(1 + 차변수_j) + 1 + m
+    line_no = np.where(is_credit, 1, 1 + block_start[k] + 1 + seq)
+    text = text_prefix[k] + np.array([str(a) for a in line_artist], dtype=object) + text_suffix[k]
+    zero = np.zeros(total, dtype=object)
+
+    columns = dict(_CONSTANT_COLUMNS)
+    columns.update({
+        "전표번호": k,
+        "전표일자": dates[k],
+        "적요": text,
+        "입력일시": now,
+        "라인번호": line_no,
+        "계정코드": np.where(is_credit, AP_ACCOUNT_CODE, _obj(v["계정코드"])[k]).astype(object),
+        "계정과목명": np.where(is_credit, AP_ACCOUNT_NAME, _obj(v["계정과목"])[k]).astype(object),
+        "차변/대변구분": np.where(is_credit, "대변", "차변").astype(object),
+        "금액(원화)": line_amount,
+        "금액(외화)": line_amount,
+        "차변": np.where(is_credit, zero, line_amount),
+        "대변": np.where(is_credit, line_amount, zero),
+        "거래처명": _obj(v["거래처"])[k],
+        "프로젝트코드": line_code,
+        "증빙일": dates[k],
+        "개별아이템텍스트": text,
+        "file_id": file_ids[k],
+    })
+    return total, columns
+
+def _to_table(vouchers) -> pd.DataFrame:
+    if isinstance(vouchers, dict):
+        vouchers = [vouchers]
+    if isinstance(vouchers, pd.DataFrame):
+        return vouchers.reset_index(drop=True)
+    return pd.DataFrame(list(vouchers))
+
+def make_journal_frame(
+    vouchers: Union[pd.DataFrame, list, dict],
+    now: str | None = None,
+    allocate_remainder: bool = False,
+) -> pd.DataFrame:
+    """
+    voucher 테이블(DataFrame 또는 dict 리스트) → 분개 라인 DataFrame(JOURNAL_LINE_COLUMNS)
+    """
+    v = _to_table(vouchers)
+    if v.empty:
+        return pd.DataFrame(columns=JOURNAL_LINE_COLUMNS)
+    now = now or datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    total, columns = _journal_columns(v, now, allocate_remainder)
+    data = {c: columns[c] if isinstance(columns[c], np.ndarray) else np.full(total, columns[c], dtype=object)
+            for c in JOURNAL_LINE_COLUMNS}
+    return pd.DataFrame(data)
+
+def make_journal_entries_batch(vouchers, now: str | None = None, allocate_remainder: bool = False) -> list[dict]:
+    """make_journal_entry 와 같은 형태(list of dict)로 반환"""
+    v = _to_table(vouchers)
+    if v.empty:
+        return []
+    now = now or datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    total, columns = _journal_columns(v, now, allocate_remainder)
+    values = [columns[c].tolist() if isinstance(columns[c], np.ndarray) else itertools.repeat(columns[c], total)
+              for c in JOURNAL_LINE_COLUMNS]
+    return [dict(zip(JOURNAL_LINE_COLUMNS, row)) for row in zip(*values)]
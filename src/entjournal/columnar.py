@@ -0,0 +1,224 @@
+"""
+분개/VoucherData 의 Parquet(Arrow) 내보내기.
+
+JSON(journal_entry.json)은 1년치 아카이브를 분석할 때 파싱 시간/메모리가 커서,
+field_schema.json 기준의 고정 타입 스키마로 Parquet 파일을 만들고 필요한 컬럼만 읽어옵니다.
+- 금액: decimal128(18, 0) (원화 정수, ROUND_HALF_UP)
+- 일자: date32 (YY.MM.DD, YYYYMMDD 등 입력 형식도 인식, 인식하지 못한 값은 null + 경고 로그), 입력일시: timestamp[s]
+- 코드/구분값: dictionary(categorical), 자유 텍스트: string
+- 워크스페이스별로 row group 하나씩 기록 → workspace 필터 시 다른 row group 은 읽지 않음
+
+pyarrow 는 선택 의존성입니다. 설치되지 않은 경우 함수 호출 시 ImportError 를 발생시킵니다.
+"""
+import datetime
+import json
+import os
+import re
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from typing import Iterable, Mapping
+
+import pandas as pd
+from loguru import logger
+
+from src.entjournal.utils import get_field_list
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    logger.debug("pyarrow not available. Parquet export is disabled.")
+
+
+WORKSPACE_COLUMN = "workspace"
+# field_schema.json 에 없지만 journal line 에 들어있는 필드
+JOURNAL_EXTRA_FIELDS = ["계정과목명", "file_id"]
+
+INT_FIELDS = ("전표번호", "라인번호")
+AMOUNT_FIELDS = ("금액(원화)", "금액(외화)", "차변", "대변")
+DATE_FIELDS = ("전표일자", "증빙일")
+TIMESTAMP_FIELDS = ("입력일시",)
+TEXT_FIELDS = ("적요", "개별아이템텍스트", "거래처명", "관리항목1", "관리항목2", "참조번호", "file_id")
+
+VOUCHER_AMOUNT_FIELDS = ("금액",)
+VOUCHER_DATE_FIELDS = ("날짜",)
+
+# 2024-05-01, 24.05.01, 2024년 5월 1일 (구분자), 20240501, 240501 (무구분) → 두 자리 연도는 2000년대
+_DATE_RE = re.compile(r"^(\d{4}|\d{2})\s*(?:[-./]|년)\s*(\d{1,2})\s*(?:[-./]|월)\s*(\d{1,2})")
+_COMPACT_DATE_RE = re.compile(r"^(\d{4}|\d{2})(\d{2})(\d{2})(?!\d)")
+
+
+def _require_pyarrow():
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow is required for Parquet export. Install it with `pip install pyarrow`.")
+
+
+def _to_amount(value):
+    if value is None or value == "":
+        return None
+    try:
+        d = Decimal(str(value).replace(",", "").strip())
+    except InvalidOperation:
+        return None
+    return d.quantize(Decimal("1"), rounding=ROUND_HALF_UP)
+
+def _to_date(value):
+    if isinstance(value, datetime.date):
+        return value
+    text = str(value or "").strip()
+    m = _DATE_RE.match(text) or _COMPACT_DATE_RE.match(text)
+    if not m:
+        return None
+    year = int(m.group(1))
+    if len(m.group(1)) == 2:
+        year += 2000
+    try:
+        return datetime.date(year, int(m.group(2)), int(m.group(3)))
+    except ValueError:
+        return None
+
+def _to_timestamp(value):
+    if isinstance(value, datetime.datetime):
+        return value
+    try:
+        return datetime.datetime.fromisoformat(str(value)) if value else None
+    except ValueError:
+        return None
+
+def _to_int(value):
+    try:
+        return int(value) if value is not None and value != "" else None
+    except (TypeError, ValueError):
+        return None
+
+def _to_text(value):
+    if value is None:
+        return None
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False)
+    return str(value)
+
+
+def _journal_field_type(field: str):
+    if field in INT_FIELDS:
+        return pa.int32()
+    if field in AMOUNT_FIELDS:
+        return pa.decimal128(18, 0)
+    if field in DATE_FIELDS:
+        return pa.date32()
+    if field in TIMESTAMP_FIELDS:
+        return pa.timestamp("s")
+    if field in TEXT_FIELDS:
+        return pa.string()
+    return pa.dictionary(pa.int32(), pa.string())
+
+def journal_columns() -> list[str]:
+    """field_schema.json 순서 + 부가 필드"""
+    fields = get_field_list()
+    return fields + [f for f in JOURNAL_EXTRA_FIELDS if f not in fields]
+
+def journal_arrow_schema(with_workspace: bool = True) -> "pa.Schema":
+    _require_pyarrow()
+    fields = [pa.field(name, _journal_field_type(name)) for name in journal_columns()]
+    if with_workspace:
+        fields.insert(0, pa.field(WORKSPACE_COLUMN, pa.dictionary(pa.int32(), pa.string())))
+    return pa.schema(fields)
+
+def _column_array(values: list, typ: "pa.DataType"):
+    if pa.types.is_dictionary(typ):
+        return pa.array([_to_text(v) for v in values], pa.string()).dictionary_encode()
+    if pa.types.is_decimal(typ):
+        return pa.array([_to_amount(v) for v in values], typ)
+    if pa.types.is_date(typ):
+        dates = [_to_date(v) for v in values]
+        # 날짜로 읽지 못한 값은 null 로 기록되므로 건수를 남김
+        unparsed = [v for v, d in zip(values, dates) if d is None and v not in (None, "")]
+        if unparsed:
+            logger.warning(f"{len(unparsed)} date values could not be parsed and were written as null (e.g. {unparsed[0]!r})")
+        return pa.array(dates, typ)
+    if pa.types.is_timestamp(typ):
+        return pa.array([_to_timestamp(v) for v in values], typ)
+    if pa.types.is_integer(typ):
+        return pa.array([_to_int(v) for v in values], typ)
+    return pa.array([_to_text(v) for v in values], typ)
+
+def journal_lines_to_table(lines: list[dict], workspace_name: str | None = None) -> "pa.Table":
+    """
+    journal line(dict) 리스트를 고정 스키마의 Arrow 테이블로 변환.
+    스키마에 없는 키는 버리고, 없는 키는 null.
+    """
+    schema = journal_arrow_schema(with_workspace=workspace_name is not None)
+    arrays = []
+    for field in schema:
+        if field.name == WORKSPACE_COLUMN:
+            values = [workspace_name] * len(lines)
+        else:
+            values = [line.get(field.name) for line in lines]
+        arrays.append(_column_array(values, field.type))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+def write_journal_parquet(path: str, journals: Mapping[str, list[dict]], compression: str = "zstd") -> str:
+    """
+    {workspace: lines} 를 하나의 Parquet 파일로 저장. 워크스페이스마다 row group 1개.
+    temp 파일에 쓴 뒤 교체하므로 읽는 쪽에서 쓰다 만 파일을 보지 않음.
+    """
+    _require_pyarrow()
+    schema = journal_arrow_schema(with_workspace=True)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = f"{path}.tmp"
+    with pq.ParquetWriter(tmp, schema, compression=compression) as writer:
+        for workspace_name, lines in journals.items():
+            if not lines:
+                continue
+            writer.write_table(journal_lines_to_table(lines, workspace_name), row_group_size=len(lines))
+    os.replace(tmp, path)
+    return path
+
+def read_journal_parquet(
+    path: str,
+    columns: Iterable[str] | None = None,
+    workspaces: Iterable[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Parquet 분개를 DataFrame 으로 읽음. columns 로 필요한 컬럼만, workspaces 로 row group 만 선택.
+    코드 컬럼은 category, 금액은 Decimal(object) 로 복원됨.
+    """
+    _require_pyarrow()
+    filters = [(WORKSPACE_COLUMN, "in", list(workspaces))] if workspaces else None
+    table = pq.read_table(path, columns=list(columns) if columns else None, filters=filters)
+    return table.to_pandas()
+
+
+def voucher_data_to_table(voucher_data: Mapping[str, dict]) -> "pa.Table":
+    """
+    {file_id: voucher} 를 Arrow 테이블로 변환.
+    voucher 필드는 고정되어 있지 않으므로 등장 순서대로 컬럼을 만들고, 금액/날짜 외에는 문자열.
+    """
+    _require_pyarrow()
+    columns: list[str] = ["file_id"]
+    for voucher in voucher_data.values():
+        for key in voucher:
+            if key not in columns:
+                columns.append(key)
+    rows = [{**voucher, "file_id": file_id} for file_id, voucher in voucher_data.items()]
+
+    fields, arrays = [], []
+    for name in columns:
+        if name in VOUCHER_AMOUNT_FIELDS:
+            typ = pa.decimal128(18, 0)
+        elif name in VOUCHER_DATE_FIELDS:
+            typ = pa.date32()
+        else:
+            typ = pa.string()
+        fields.append(pa.field(name, typ))
+        arrays.append(_column_array([r.get(name) for r in rows], typ))
+    return pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+def write_voucher_parquet(path: str, voucher_data: Mapping[str, dict], compression: str = "zstd") -> str:
+    table = voucher_data_to_table(voucher_data)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = f"{path}.tmp"
+    pq.write_table(table, tmp, compression=compression)
+    os.replace(tmp, path)
+    return path
@@ -0,0 +1,181 @@
+"""
+대용량 분개 내보내기(XLSX/CSV 스트리밍).
+
+to_excel_bytes 는 DataFrame 전체를 BytesIO 워크북으로 만들고 모든 셀 길이를 계산해서
+10만 라인 이상에서는 느리고 메모리를 많이 사용합니다.
+- XLSX: openpyxl write-only 모드로 행을 순서대로 기록(셀 객체를 메모리에 유지하지 않음)
+- 컬럼 너비: 앞쪽 sample_size 행만 보고 추정
+- CSV: chunk_size 행 단위로 인코딩된 bytes 를 생성(HTTP 스트리밍 응답에 그대로 사용 가능)
+"""
+import csv
+import io
+import itertools
+import math
+import os
+import sys
+import uuid
+from typing import IO, Iterable, Iterator, Union
+
+DEFAULT_SAMPLE_SIZE = 500
+DEFAULT_CHUNK_SIZE = 5000
+MAX_COLUMN_WIDTH = 60
+
+Dest = Union[str, "os.PathLike[str]", IO[bytes]]
+
+
+def _clean(value):
+    # NaN/NaT 는 빈 셀로
+    if value is None:
+        return None
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    # pandas 가 로드되지 않았다면 NaT 일 수 없으므로 import 하지 않음(API 기동 시간)
+    pd = sys.modules.get("pandas")
+    if pd is not None and value is pd.NaT:
+        return None
+    return value
+
+def _columns_from_sample(sample: list[dict]) -> list[str]:
+    columns: list[str] = []
+    seen = set()
+    for row in sample:
+        for key in row:
+            if key not in seen:
+                seen.add(key)
+                columns.append(key)
+    return columns
+
+def estimate_column_widths(sample: list[dict], columns: list[str], max_width: int = MAX_COLUMN_WIDTH) -> list[int]:
+    """헤더와 샘플 행의 문자열 길이 최대값 + 여백(상한 max_width)"""
+    widths = []
+    for col in columns:
+        longest = len(str(col))
+        for row in sample:
+            v = _clean(row.get(col))
+            if v is not None:
+                longest = max(longest, len(str(v)))
+        widths.append(min(longest + 2, max_width))
+    return widths
+
+def _tmp_path(dest: Union[str, os.PathLike]) -> str:
+    """dest 와 같은 디렉터리의 고유 임시 파일 경로(동시 요청이 서로의 임시 파일을 덮어쓰지 않도록)"""
+    head, tail = os.path.split(os.path.abspath(dest))
+    return os.path.join(head, f".{tail}.{uuid.uuid4().hex[:8]}.tmp")
+
+
+def _peek(rows: Iterable[dict], sample_size: int) -> tuple[list[dict], Iterator[dict]]:
+    it = iter(rows)
+    sample = list(itertools.islice(it, sample_size))
+    return sample, itertools.chain(sample, it)
+
+
+def write_xlsx_stream(
+    rows: Iterable[dict],
+    dest: Dest,
+    columns: list[str] | None = None,
+    sheet_name: str = "Results",
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+) -> int:
+    """
+    rows(dict 이터러블)를 write-only 워크북으로 dest(경로 또는 바이너리 파일 객체)에 기록.
+    columns 미지정 시 샘플 행의 키 순서를 사용. 기록한 데이터 행 수 반환
+    """
+    sample, all_rows = _peek(rows, sample_size)
+    columns = columns or _columns_from_sample(sample)
+
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+    from openpyxl.utils import get_column_letter
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(sheet_name)
+    # write-only 시트는 첫 행을 쓰기 전에 너비를 지정해야 함
+    for idx, width in enumerate(estimate_column_widths(sample, columns), start=1):
+        ws.column_dimensions[get_column_letter(idx)].width = width
+
+    header_font = Font(bold=True)
+    header = []
+    for col in columns:
+        cell = WriteOnlyCell(ws, value=str(col))
+        cell.font = header_font
+        header.append(cell)
+    ws.append(header)
+
+    count = 0
+    for row in all_rows:
+        ws.append([_clean(row.get(col)) for col in columns])
+        count += 1
+
+    if isinstance(dest, (str, os.PathLike)):
+        os.makedirs(os.path.dirname(os.path.abspath(dest)), exist_ok=True)
+        tmp = _tmp_path(dest)
+        try:
+            wb.save(tmp)
+            os.replace(tmp, dest)
+        finally:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+    else:
+        wb.save(dest)
+    return count
+
+def iter_csv_chunks(
+    rows: Iterable[dict],
+    columns: list[str] | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    encoding: str = "utf-8-sig",
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+) -> Iterator[bytes]:
+    """
+    헤더 포함 CSV 를 chunk_size 행 단위 bytes 로 생성.
+    기본 인코딩 utf-8-sig(BOM) → 엑셀에서 한글이 깨지지 않음
+    """
+    sample, all_rows = _peek(rows, sample_size)
+    columns = columns or _columns_from_sample(sample)
+
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(columns)
+    first = True
+    pending = 1
+    for row in all_rows:
+        writer.writerow(["" if (v := _clean(row.get(col))) is None else v for col in columns])
+        pending += 1
+        if pending >= chunk_size:
+            yield _encode_chunk(buf, encoding, first)
+            first = False
+            pending = 0
+    if pending or first:
+        yield _encode_chunk(buf, encoding, first)
+
+def _encode_chunk(buf: io.StringIO, encoding: str, first: bool) -> bytes:
+    text = buf.getvalue()
+    buf.seek(0)
+    buf.truncate(0)
+    # BOM 은 첫 chunk 에만
+    if encoding == "utf-8-sig" and not first:
+        return text.encode("utf-8")
+    return text.encode(encoding)
+
+def write_csv_stream(
+    rows: Iterable[dict],
+    dest: Dest,
+    columns: list[str] | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    encoding: str = "utf-8-sig",
+) -> None:
+    if isinstance(dest, (str, os.PathLike)):
+        os.makedirs(os.path.dirname(os.path.abspath(dest)), exist_ok=True)
+        tmp = _tmp_path(dest)
+        try:
+            with open(tmp, "wb") as f:
+                for chunk in iter_csv_chunks(rows, columns, chunk_size, encoding):
+                    f.write(chunk)
+            os.replace(tmp, dest)
+        finally:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+    else:
+        for chunk in iter_csv_chunks(rows, columns, chunk_size, encoding):
+            dest.write(chunk)
@@ -1,6 +1,8 @@
-import pandas as pd
+from __future__ import annotations
+
 import io, os
-from openpyxl.utils import get_column_letter
+from typing import TYPE_CHECKING
+from src.entjournal.export import write_xlsx_stream
 from src.entjournal.constants import (AP_ACCOUNT_NAME, 
                                       AP_ACCOUNT_CODE, 
                                       COMPANY_NAME, 
@@ -12,10 +14,13 @@ import datetime
 from decimal import Decimal, ROUND_HALF_UP
 import json
 from src.entjournal.constants import COLUMN_RULES_PATH
-from src.entjournal.utils import load_field_schema
+from src.entjournal.projection import project_journal
 from loguru import logger
 from src.api.upload import _normalize_rel
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 def get_json_wt_one_value_from_extract_invoice_fields(extract_invoice_fields_results):
     """
     [Note] 현재는 LLM이 한개의 결과를 반환하지만, 추후 후보를 반환한 후 사용자가 선택하는 기능으로의 확장을 고려하여 VALUE를 리스트 형태로 반환하고 있습니다.
@@ -79,6 +84,7 @@ def get_json_wt_one_value_from_extract_invoice_fields(extract_invoice_fields_res
 
 def create_dataframe_from_json(json_data: dict):
     # json 전처리
+    import pandas as pd
     df = pd.DataFrame(json_data)
     return df
 
@@ -100,29 +106,11 @@ def drop_source_id_from_json(json_results):
     return json_results
 
 def to_excel_bytes(df: pd.DataFrame, sheet_name: str = "Results") -> bytes:
+    # write-only 워크북으로 기록, 컬럼 너비는 앞쪽 샘플 행 기준으로 추정
     buffer = io.BytesIO()
-    with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
-        df.to_excel(writer, index=False, sheet_name=sheet_name)
-
-        ws = writer.sheets[sheet_name]
-
-        # 각 컬럼 너비 자동 맞춤(대략적인 문자폭 기준)
-        for idx, col in enumerate(df.columns, start=1):  # 1-based
-            # 헤더/데이터 길이 최대값 계산
-            if df.empty:
-                max_len = len(str(col))
-            else:
-                # NaN 포함 대비해 문자열화 후 길이 측정
-                series_lens = df[col].astype(str).map(len)
-                max_len = max(series_lens.max(), len(str(col)))
-
-            # 엑셀 열문자 (A, B, ...)
-            col_letter = get_column_letter(idx)
-            # 가독성 위한 여백 + 상한
-            width = min(max_len + 2, 60)
-            ws.column_dimensions[col_letter].width = width
-
-    buffer.seek(0)
+    columns = list(df.columns)
+    rows = (dict(zip(columns, r)) for r in df.itertuples(index=False, name=None))
+    write_xlsx_stream(rows, buffer, columns=columns, sheet_name=sheet_name)
     return buffer.getvalue()
 
 def to_csv_bytes(df: pd.DataFrame) -> bytes:
@@ -248,28 +236,10 @@ def make_journal_entry(json_data: list, erp: str = 'dz') -> dict:
     return journal_entries
 
 def sap_view(journal_entries: list):
-    field_schema = load_field_schema()
-    sap_journal_entries = []
-    for journal_entry in journal_entries:
-        sap_journal_entry = {}
-        for field, value in journal_entry.items():
-            sap_field = field_schema.get(field,{}).get("SAP",{})
-            if sap_field:
-                sap_journal_entry[sap_field] = value
-        sap_journal_entries.append(sap_journal_entry)
-    return sap_journal_entries
-    
+    return project_journal(journal_entries, "sap")
+
 def dzone_view(journal_entries: list):
-    field_schema = load_field_schema()
-    dzone_journal_entries = []
-    for journal_entry in journal_entries:
-        dzone_journal_entry = {}
-        for field, value in journal_entry.items():
-            dzone_field = field_schema.get(field,{}).get("DZ",{})
-            if dzone_field:
-                dzone_journal_entry[dzone_field] = value
-        dzone_journal_entries.append(dzone_journal_entry)
-    return dzone_journal_entries
+    return project_journal(journal_entries, "dz")
 
 def make_journal_line(voucher_data, journal_no, line_number, now, artist_code, artist_name, amount, file_id, dorc = "credit"):
     
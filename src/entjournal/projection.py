@@ -0,0 +1,96 @@
+"""
+ERP 별 분개 컬럼 매핑(projection).
+
+field_schema.json 의 {원본필드: {ERP키: 대상필드}} 를 ERP 마다 (원본 → 대상) 순서 리스트로
+미리 컴파일해 두고, 분개 라인을 일괄 변환합니다.
+- 스키마는 utils.load_field_schema() 캐시를 사용(파일이 바뀌면 다시 컴파일)
+- 대상 필드가 비어 있거나 "null" 이면 해당 ERP 로 내보내지 않음
+- 여러 원본이 같은 대상으로 매핑되면 스키마 순서상 마지막 원본 값이 남음(기존 sap_view/dzone_view 와 동일)
+- 새 ERP 는 field_schema.json 에 키를 추가한 뒤 register_erp() 로 등록
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+from src.entjournal.utils import load_field_schema
+
+_UNMAPPED = (None, "", "null")
+
+
+class ErpProjection:
+    def __init__(self, name: str, mapping: list[tuple[str, str]]):
+        self.name = name
+        # 스키마 순서의 (원본, 대상) 목록
+        self.mapping = mapping
+        # 대상별로 실제 값을 가져올 원본(마지막 매핑) - DataFrame 변환용
+        resolved: dict[str, str] = {}
+        for src, tgt in mapping:
+            resolved[tgt] = src
+        self.target_fields = list(resolved)
+
+    def project(self, journal_entries: Iterable[dict]) -> list[dict]:
+        mapping = self.mapping
+        return [{tgt: line[src] for src, tgt in mapping if src in line} for line in journal_entries]
+
+    def project_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """컬럼 선택 + 이름 변경만 수행(행 단위 루프 없음)"""
+        import pandas as pd
+
+        columns = set(df.columns)
+        picked = {}
+        for tgt in self.target_fields:
+            # 마지막 원본이 없으면 같은 대상으로 매핑된 다른 원본 중 마지막 것
+            srcs = [s for s, t in self.mapping if t == tgt and s in columns]
+            if srcs:
+                picked[tgt] = df[srcs[-1]]
+        return pd.DataFrame(picked, index=df.index)
+
+
+# ERP 이름 → field_schema.json 의 키, 대상 필드 덮어쓰기
+_ERP_TARGETS: dict[str, dict] = {
+    "sap": {"schema_key": "SAP", "overrides": {}},
+    "dz": {"schema_key": "DZ", "overrides": {}},
+}
+_compiled: dict[str, tuple[dict, ErpProjection]] = {}
+
+
+def register_erp(name: str, schema_key: str | None = None, overrides: dict[str, str | None] | None = None) -> None:
+    """
+    ERP 대상 등록.
+    schema_key: field_schema.json 의 ERP 키(기본값 name.upper())
+    overrides: {원본필드: 대상필드} 로 스키마 값을 덮어씀(None 이면 제외)
+    """
+    _ERP_TARGETS[name] = {"schema_key": schema_key or name.upper(), "overrides": dict(overrides or {})}
+    _compiled.pop(name, None)
+
+def list_erps() -> list[str]:
+    return list(_ERP_TARGETS)
+
+def compile_projection(name: str, field_schema: dict) -> ErpProjection:
+    target = _ERP_TARGETS[name]
+    key, overrides = target["schema_key"], target["overrides"]
+    mapping = []
+    for field, per_erp in field_schema.items():
+        tgt = overrides[field] if field in overrides else per_erp.get(key)
+        if tgt not in _UNMAPPED:
+            mapping.append((field, tgt))
+    for field, tgt in overrides.items():
+        if field not in field_schema and tgt not in _UNMAPPED:
+            mapping.append((field, tgt))
+    return ErpProjection(name, mapping)
+
+def get_projection(name: str) -> ErpProjection:
+    if name not in _ERP_TARGETS:
+        raise KeyError(f"Unknown ERP target: {name}")
+    schema = load_field_schema()
+    hit = _compiled.get(name)
+    if hit is None or hit[0] is not schema:
+        hit = (schema, compile_projection(name, schema))
+        _compiled[name] = hit
+    return hit[1]
+
+def project_journal(journal_entries: Iterable[dict], erp: str) -> list[dict]:
+    return get_projection(erp).project(journal_entries)
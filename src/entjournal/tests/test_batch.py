@@ -0,0 +1,36 @@
+from src.entjournal.batch import make_journal_entries_batch
+from src.entjournal.journal_main import make_journal_entry
+
+
+def _voucher(i, project, account, amount):
+    return {
+        "file_id": f"input/{i}.png", "날짜": f"2025-12-{i % 28 + 1:02d}", "거래처": f"거래처{i}",
+        "금액": amount, "계정과목": account, "계정코드": 80000 + i, "유형": "기타",
+        "증빙유형": "영수증", "프로젝트명": project,
+    }
+
+
+def _strip_ts(lines):
+    return [{k: v for k, v in l.items() if k != "입력일시"} for l in lines]
+
+
+def test_batch_matches_make_journal_entry():
+    vouchers = [
+        _voucher(0, "HUNTRIX", "연예보조_기타", 10000),       # 3인 분할 (3333.33 → 3333)
+        _voucher(1, "루미", "연예보조_기타", "26700"),        # 그룹 아님
+        _voucher(2, "HUNTRIX", "복리후생비_식대", 5000),      # 분할 대상 계정 아님
+        _voucher(3, "HUNTRIX", "연예보조_촬영ㆍ영상", 20000), # 6666.67 → 6667
+    ]
+
+    expected = make_journal_entry(vouchers)
+    actual = make_journal_entries_batch(vouchers)
+
+    assert _strip_ts(actual) == _strip_ts(expected)
+    assert [list(l) for l in actual] == [list(l) for l in expected]
+
+
+def test_batch_remainder_allocation():
+    lines = make_journal_entries_batch([_voucher(0, "HUNTRIX", "연예보조_기타", 10000)], allocate_remainder=True)
+
+    debit = [l["차변"] for l in lines if l["차변/대변구분"] == "차변"]
+    assert debit == [3333, 3333, 3334]
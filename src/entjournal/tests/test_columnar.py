@@ -0,0 +1,54 @@
+from decimal import Decimal
+
+import datetime
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from src.entjournal.columnar import read_journal_parquet, write_journal_parquet, write_voucher_parquet
+
+
+def _line(no, amount, project):
+    return {
+        "전표번호": no, "라인번호": 1, "전표일자": "2025-12-01", "입력일시": "2025-12-02 10:00:00",
+        "계정코드": 25300, "계정과목명": "미지급금", "금액(원화)": amount, "차변": 0, "대변": amount,
+        "프로젝트코드": project, "거래처명": "거래처A", "file_id": f"{no}.png",
+    }
+
+
+def test_journal_parquet_round_trip_with_pruning(tmp_path):
+    path = str(tmp_path / "journal.parquet")
+    write_journal_parquet(path, {
+        "ws1": [_line(0, 1000, "HUNTRIX001"), _line(1, 2500, "HUNTRIX002")],
+        "ws2": [_line(0, 700, "HUNTRIX001")],
+    })
+
+    df = read_journal_parquet(path, columns=["workspace", "금액(원화)", "프로젝트코드", "전표일자"], workspaces=["ws1"])
+
+    assert list(df.columns) == ["workspace", "금액(원화)", "프로젝트코드", "전표일자"]
+    assert df["금액(원화)"].tolist() == [Decimal(1000), Decimal(2500)]
+    assert str(df["프로젝트코드"].dtype) == "category"
+    assert str(df["전표일자"].iloc[0]) == "2025-12-01"
+
+
+def test_voucher_parquet_types(tmp_path):
+    import pyarrow.parquet as pq
+
+    path = str(tmp_path / "voucher.parquet")
+    write_voucher_parquet(path, {"a.png": {"날짜": "2025-12-01", "금액": "26,700", "거래처": "A"}})
+
+    table = pq.read_table(path)
+    assert table.column_names == ["file_id", "날짜", "금액", "거래처"]
+    assert table.column("금액").to_pylist() == [Decimal(26700)]
+
+
+def test_voucher_dates_in_entered_formats(tmp_path):
+    import pyarrow.parquet as pq
+
+    dates = ["2025-12-01", "25.12.01", "2025/12/1", "20251201", "251201", "2025년 12월 1일", "12월 초"]
+    path = str(tmp_path / "voucher.parquet")
+    write_voucher_parquet(path, {f"{i}.png": {"날짜": d} for i, d in enumerate(dates)})
+
+    parsed = pq.read_table(path).column("날짜").to_pylist()
+    assert parsed == [datetime.date(2025, 12, 1)] * 6 + [None]
@@ -0,0 +1,57 @@
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+from openpyxl import load_workbook
+
+from src.entjournal.export import iter_csv_chunks, write_csv_stream, write_xlsx_stream
+from src.entjournal.journal_main import to_excel_bytes
+
+
+def _rows(n):
+    for i in range(n):
+        yield {"전표번호": i, "거래처명": "거래처" + "A" * (i % 5), "금액(원화)": i * 10, "비고": None}
+
+
+def test_write_xlsx_stream_widths_from_sample(tmp_path):
+    out = tmp_path / "journal_entries.xlsx"
+
+    count = write_xlsx_stream(_rows(1200), str(out), sample_size=10)
+
+    assert count == 1200
+    ws = load_workbook(out).active
+    assert [c.value for c in ws[1]] == ["전표번호", "거래처명", "금액(원화)", "비고"]
+    assert ws.max_row == 1201
+    assert ws.cell(row=1201, column=3).value == 11990
+    assert ws.column_dimensions["B"].width == len("거래처AAAA") + 2
+
+
+def test_iter_csv_chunks_matches_pandas():
+    chunks = list(iter_csv_chunks(_rows(25), chunk_size=10))
+
+    assert len(chunks) == 3
+    assert chunks[0].startswith(b"\xef\xbb\xbf") and not chunks[1].startswith(b"\xef\xbb\xbf")
+    df = pd.read_csv(io.BytesIO(b"".join(chunks)), encoding="utf-8-sig")
+    assert df["금액(원화)"].tolist() == [i * 10 for i in range(25)]
+
+
+def test_to_excel_bytes_keeps_nan_cells_empty():
+    df = pd.DataFrame({"a": [1.0, float("nan")], "b": [None, "y"]})
+
+    ws = load_workbook(io.BytesIO(to_excel_bytes(df))).active
+
+    assert [[c.value for c in row] for row in ws.iter_rows()] == [["a", "b"], [1, None], [None, "y"]]
+
+
+def test_concurrent_writes_to_same_dest(tmp_path):
+    # 동시 내보내기 요청이 같은 파일에 써도 임시 파일이 겹치지 않음
+    xlsx, csv_out = tmp_path / "journal_entries.xlsx", tmp_path / "journal_entries.csv"
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        counts = list(pool.map(lambda _: write_xlsx_stream(_rows(300), str(xlsx)), range(4)))
+        list(pool.map(lambda _: write_csv_stream(_rows(300), str(csv_out)), range(4)))
+
+    assert counts == [300] * 4
+    assert load_workbook(xlsx).active.max_row == 301
+    assert len(csv_out.read_text(encoding="utf-8-sig").splitlines()) == 301
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["journal_entries.csv", "journal_entries.xlsx"]
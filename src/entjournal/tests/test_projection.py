@@ -0,0 +1,47 @@
+import json
+import os
+
+import pandas as pd
+
+from src.entjournal import projection, utils
+
+
+def _legacy_view(lines, erp_key, schema):
+    out = []
+    for line in lines:
+        row = {}
+        for field, value in line.items():
+            tgt = schema.get(field, {}).get(erp_key, {})
+            if tgt and tgt != "null":
+                row[tgt] = value
+        out.append(row)
+    return out
+
+
+LINE = {"회사코드": "001", "전표번호": 0, "자동기표여부": "N", "금액(원화)": 1000, "금액(외화)": 1000,
+        "계정과목명": "미지급금", "증빙일": "2025-12-01", "참조번호": None, "file_id": "a.png"}
+
+
+def test_projection_matches_per_field_lookup():
+    schema = utils.load_field_schema()
+    for erp, key in (("sap", "SAP"), ("dz", "DZ")):
+        proj = projection.get_projection(erp)
+        assert proj.project([LINE]) == _legacy_view([LINE], key, schema)
+        frame = proj.project_frame(pd.DataFrame([LINE]))
+        assert frame.to_dict("records") == proj.project([LINE])
+
+
+def test_schema_change_recompiles_and_new_erp(tmp_path, monkeypatch):
+    path = tmp_path / "field_schema.json"
+    path.write_text(json.dumps({"회사코드": {"SAP": "BUKRS", "XERP": "COMP"}}), encoding="utf-8")
+    monkeypatch.setattr(utils, "FIELD_SCHEMA_PATH", str(path))
+    monkeypatch.setattr(projection, "_ERP_TARGETS", dict(projection._ERP_TARGETS))
+    monkeypatch.setattr(projection, "_compiled", {})
+    projection.register_erp("xerp", overrides={"file_id": "DOC_REF"})
+
+    assert projection.project_journal([LINE], "xerp") == [{"COMP": "001", "DOC_REF": "a.png"}]
+
+    path.write_text(json.dumps({"회사코드": {"XERP": "COMPANY_CODE"}}), encoding="utf-8")
+    os.utime(path, ns=(1, 1))
+    assert projection.project_journal([LINE], "xerp") == [{"COMPANY_CODE": "001", "DOC_REF": "a.png"}]
+    assert utils.get_field_sap("회사코드") is None
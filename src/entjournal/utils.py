@@ -1,19 +1,34 @@
 import json
+import os
 from src.entjournal.constants import FIELD_SCHEMA_PATH
 
+# data/field_schema.json 이 없으면 패키지에 포함된 기본 스키마 사용
+_PACKAGED_FIELD_SCHEMA_PATH = os.path.join(os.path.dirname(__file__), "field_schema.json")
+
+def get_field_schema_path() -> str:
+    return FIELD_SCHEMA_PATH if os.path.exists(FIELD_SCHEMA_PATH) else _PACKAGED_FIELD_SCHEMA_PATH
+
+_schema_cache: dict = {}
+
 def load_field_schema():
-    with open(FIELD_SCHEMA_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+    """
+    field_schema.json 을 한 번만 읽고, 파일이 바뀌면(mtime/size) 다시 읽음.
+    반환 dict 는 공유 객체이므로 수정하지 말 것
+    """
+    path = get_field_schema_path()
+    st = os.stat(path)
+    stamp = (path, st.st_mtime_ns, st.st_size)
+    if _schema_cache.get("stamp") != stamp:
+        with open(path, "r", encoding="utf-8") as f:
+            _schema_cache["schema"] = json.load(f)
+        _schema_cache["stamp"] = stamp
+    return _schema_cache["schema"]
 
 def get_field_list():
-    field_schema = load_field_schema()
-    field_list = [key for key in field_schema.keys()]
-    return field_list
+    return list(load_field_schema().keys())
 
 def get_field_sap(fieldname:str):
-    field_schema = load_field_schema()
-    return field_schema.get(fieldname, None)["SAP"]
+    return load_field_schema().get(fieldname, {}).get("SAP")
 
 def get_field_dzone(fieldname:str):
-    field_schema = load_field_schema()
-    return field_schema.get(fieldname, None)["DZ"]
+    return load_field_schema().get(fieldname, {}).get("DZ")
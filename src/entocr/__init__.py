@@ -4,20 +4,47 @@ __version__ = "0.1.0"
 __author__ = "Your Name"
 __email__ = "your.email@example.com"
 
-from .extractor import ImageDataExtractor
-from .models import ExtractionResult, OCRResult, TextBox
-from .ocr_service import OCRService
-from .pdf_converter import PDFConverter, convert_pdf_to_png, get_pdf_page_count
-from .jpg_converter import convert_jpg_to_png
-
-__all__ = [
-    "ImageDataExtractor",
-    "OCRService", 
-    "ExtractionResult",
-    "OCRResult",
-    "TextBox",
-    "PDFConverter",
-    "convert_pdf_to_png",
-    "get_pdf_page_count",
-    "convert_jpg_to_png",
-]
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+# Public names are resolved on first access (PEP 562) so that importing a
+# submodule such as ``src.entocr.cli`` does not load OpenCV, PaddleOCR or PyMuPDF.
+_LAZY_EXPORTS = {
+    "ImageDataExtractor": ".extractor",
+    "OCRService": ".ocr_service",
+    "ExtractionResult": ".models",
+    "OCRResult": ".models",
+    "TextBox": ".models",
+    "PDFConverter": ".pdf_converter",
+    "convert_pdf_to_png": ".pdf_converter",
+    "get_pdf_page_count": ".pdf_converter",
+    "convert_jpg_to_png": ".jpg_converter",
+    "extract_text_layer": ".pdf_text",
+    "ReplayOCRBackend": ".backends",
+    "create_ocr_backend": ".backends",
+    "register_ocr_backend": ".backends",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+if TYPE_CHECKING:
+    from .backends import ReplayOCRBackend, create_ocr_backend, register_ocr_backend
+    from .extractor import ImageDataExtractor
+    from .jpg_converter import convert_jpg_to_png
+    from .models import ExtractionResult, OCRResult, TextBox
+    from .ocr_service import OCRService
+    from .pdf_converter import PDFConverter, convert_pdf_to_png, get_pdf_page_count
+    from .pdf_text import extract_text_layer
+
+
+def __getattr__(name: str):
+    """Import the module that defines a public name on first access."""
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,55 @@
+"""Adaptive render resolution for scanned PDF pages.
+
+Pages are rendered at a low DPI first and only re-rendered at the next
+higher DPI while the OCR result looks poor (low average confidence or too
+few characters for the page area). Every attempt is recorded so the
+thresholds can be tuned from the per-page metadata.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from config.settings import settings
+from .models import OCRResult
+
+
+def adaptive_dpi_steps(dpi: int, adaptive: Optional[bool] = None) -> List[int]:
+    """Get the render resolutions to try for a page, lowest first.
+
+    Args:
+        dpi: Target (highest) DPI
+        adaptive: Try lower DPIs first (defaults to settings.pdf_adaptive_dpi)
+
+    Returns:
+        The configured lower DPI steps below ``dpi``, followed by ``dpi``
+    """
+    adaptive = settings.pdf_adaptive_dpi if adaptive is None else adaptive
+    if not adaptive:
+        return [dpi]
+    lower = sorted({int(step) for step in settings.pdf_adaptive_dpi_steps.split(",") if step.strip()})
+    return [step for step in lower if step < dpi] + [dpi]
+
+
+def page_quality(ocr_result: OCRResult, dpi: int) -> Dict[str, Any]:
+    """Summarize OCR quality of a rendered page.
+
+    Text density is characters per square inch of the page, so it does not
+    depend on the render DPI.
+    """
+    width, height = ocr_result.image_size
+    area_in2 = (width / dpi) * (height / dpi) if dpi else 0.0
+    chars = sum(len(box.text) for box in ocr_result.text_boxes)
+    return {
+        "dpi": dpi,
+        "text_boxes": ocr_result.text_count,
+        "avg_confidence": round(ocr_result.average_confidence, 4),
+        "text_density": round(chars / area_in2, 3) if area_in2 else 0.0,
+    }
+
+
+def retry_reason(quality: Dict[str, Any]) -> Optional[str]:
+    """Get why a page should be re-rendered at a higher DPI, or None if it is good enough."""
+    if quality["avg_confidence"] < settings.pdf_adaptive_min_confidence:
+        return "low_confidence"
+    if quality["text_density"] < settings.pdf_adaptive_min_text_density:
+        return "low_text_density"
+    return None
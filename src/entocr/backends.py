@@ -0,0 +1,152 @@
+"""Pluggable OCR backends used behind OCRService.
+
+A backend is any object exposing ``predict(image_path)`` that returns a list of
+PaddleX-style result dicts (``rec_texts``/``rec_scores``/``rec_polys``). The
+PaddleOCR engine already satisfies this, so OCRService parses every backend the
+same way.
+
+Backends may also expose ``recognize(crops)`` (line image arrays in, one
+``(text, confidence)`` pair per crop out) to take part in the low-confidence
+refinement pass; backends without it simply skip that pass.
+
+Backends that only accept image file paths set ``supports_tiling = False``
+and ``supports_array_input = False``; OCRService then skips the stages that
+would hand them image arrays (tiling, document crop, orientation rotation).
+
+The ``replay`` backend serves recorded OCR JSON outputs (the ``text_boxes``
+format written by ImageDataExtractor) with configurable latency and error
+rate, so the API and pipeline can be load-tested without models or GPUs.
+"""
+
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Protocol, Union
+
+from loguru import logger
+
+from src.utils.replay import RecordingPicker, ReplayFaults, load_recordings, recording_key
+
+DEFAULT_OCR_RECORDINGS = Path(__file__).resolve().parents[2] / "test" / "2. LLM" / "INPUT"
+
+
+class OCRBackend(Protocol):
+    """Interface every OCR backend implements."""
+
+    def predict(self, image_path: str) -> List[Dict[str, Any]]:
+        """Run OCR on an image file and return PaddleX-style result dicts."""
+        ...
+
+
+def ocr_json_to_paddlex(ocr_json: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a recorded OCR JSON document into a PaddleX result dict.
+
+    Args:
+        ocr_json: Output of ImageDataExtractor (must contain ``text_boxes``)
+
+    Returns:
+        Dict with ``rec_texts``, ``rec_scores`` and ``rec_polys``
+    """
+    boxes = ocr_json.get("text_boxes", [])
+    return {
+        "rec_texts": [b["text"] for b in boxes],
+        "rec_scores": [b["confidence"] for b in boxes],
+        "rec_polys": [b["coordinates"] for b in boxes],
+    }
+
+
+class ReplayOCRBackend:
+    """OCR backend that replays recorded OCR outputs.
+
+    Recordings are matched to the requested image by file stem (the recording's
+    file name or its ``source_image``); unmatched images cycle through the
+    recordings in order.
+    """
+
+    # 녹화는 원본 이미지 경로로 매칭되므로 타일(배열)·크롭/회전한 이미지 입력은 받지 않음
+    supports_tiling = False
+    supports_array_input = False
+
+    def __init__(
+        self,
+        source: Union[str, Path] = DEFAULT_OCR_RECORDINGS,
+        latency: Any = 0.0,
+        error_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ) -> None:
+        """Initialize the replay backend.
+
+        Args:
+            source: Recorded OCR JSON file or directory of JSON files
+            latency: Latency spec (see src.utils.replay.LatencyModel)
+            error_rate: Probability of an injected failure per call
+            seed: Random seed for reproducible latency/failure sequences
+        """
+        recordings = {}
+        for name, ocr_json in load_recordings(source).items():
+            result = ocr_json_to_paddlex(ocr_json)
+            recordings[name] = result
+            source_key = recording_key(ocr_json.get("source_image"))
+            if source_key:
+                recordings.setdefault(source_key, result)
+        self._picker = RecordingPicker(recordings)
+        self.faults = ReplayFaults(latency, error_rate, seed)
+        logger.info(
+            f"Replay OCR backend: {len(recordings)} recordings from {source} "
+            f"(latency={self.faults.latency}, error_rate={self.faults.error_rate})"
+        )
+
+    def predict(self, image_path: str) -> List[Dict[str, Any]]:
+        """Return the recorded result for an image after simulated latency.
+
+        Raises:
+            ReplayInjectedError: With probability ``error_rate``
+        """
+        self.faults.apply(str(image_path))
+        result = self._picker.pick(recording_key(image_path))
+        return [{key: list(values) for key, values in result.items()}]
+
+    def stats(self) -> Dict[str, Any]:
+        """Get call/error/latency counters."""
+        return self.faults.stats()
+
+
+_BACKENDS: Dict[str, Callable[..., OCRBackend]] = {
+    "replay": ReplayOCRBackend,
+}
+
+
+def register_ocr_backend(name: str, factory: Callable[..., OCRBackend]) -> None:
+    """Register an OCR backend factory under a name usable in settings.ocr_backend."""
+    _BACKENDS[name] = factory
+
+
+def list_ocr_backends() -> List[str]:
+    """Get names of selectable OCR backends (``paddle`` is built into OCRService)."""
+    return ["paddle", *_BACKENDS]
+
+
+def create_ocr_backend(name: str, **kwargs: Any) -> OCRBackend:
+    """Create a registered OCR backend.
+
+    Args:
+        name: Backend name
+        **kwargs: Backend-specific options
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    if name not in _BACKENDS:
+        raise ValueError(f"Unknown OCR backend: {name}. Available: {list_ocr_backends()}")
+    return _BACKENDS[name](**kwargs)
+
+
+def create_ocr_backend_from_settings(settings: Any) -> OCRBackend:
+    """Create the non-paddle backend selected in settings."""
+    if settings.ocr_backend == "replay":
+        return create_ocr_backend(
+            "replay",
+            source=settings.ocr_replay_path or DEFAULT_OCR_RECORDINGS,
+            latency=settings.ocr_replay_latency,
+            error_rate=settings.ocr_replay_error_rate,
+            seed=settings.ocr_replay_seed,
+        )
+    return create_ocr_backend(settings.ocr_backend)
@@ -1,14 +1,18 @@
 """Command line interface for the OCR data extraction tool."""
 
+from __future__ import annotations
+
 import argparse
 import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 from loguru import logger
 
 from config.settings import settings
-from .extractor import ImageDataExtractor
+
+if TYPE_CHECKING:
+    from .extractor import ImageDataExtractor
 
 
 def setup_logging(log_level: str, log_file: Optional[str] = None) -> None:
@@ -46,9 +50,10 @@ def process_single_file(
     file_path: str,
     output_path: Optional[str] = None,
     extractor: Optional[ImageDataExtractor] = None,
-    pdf_dpi: int = 300,
+    pdf_dpi: Optional[int] = None,
     pdf_max_pages: Optional[int] = None,
-    keep_images: bool = False
+    keep_images: bool = False,
+    pdf_adaptive_dpi: Optional[bool] = None
 ) -> bool:
     """Process a single file (image or PDF).
     
@@ -56,14 +61,16 @@ def process_single_file(
         file_path: Path to the file (image or PDF)
         output_path: Optional output path for JSON file
         extractor: Optional extractor instance
-        pdf_dpi: DPI for PDF conversion
+        pdf_dpi: DPI for PDF conversion (defaults to settings.pdf_dpi)
         pdf_max_pages: Maximum pages to process from PDF
         keep_images: Keep converted images from PDF
+        pdf_adaptive_dpi: OCR scanned pages at lower DPIs first
         
     Returns:
         True if processing was successful, False otherwise
     """
     if extractor is None:
+        from .extractor import ImageDataExtractor
         extractor = ImageDataExtractor()
     
     try:
@@ -81,7 +88,8 @@ def process_single_file(
                 output_path,
                 dpi=pdf_dpi,
                 max_pages=pdf_max_pages,
-                keep_images=keep_images
+                keep_images=keep_images,
+                adaptive=pdf_adaptive_dpi
             )
         else:
             json_result = extractor.extract_to_json(file_path, output_path)
@@ -102,9 +110,10 @@ def process_multiple_files(
     file_paths: List[str],
     output_dir: str,
     extractor: Optional[ImageDataExtractor] = None,
-    pdf_dpi: int = 300,
+    pdf_dpi: Optional[int] = None,
     pdf_max_pages: Optional[int] = None,
-    keep_images: bool = False
+    keep_images: bool = False,
+    pdf_adaptive_dpi: Optional[bool] = None
 ) -> int:
     """Process multiple files (images or PDFs).
     
@@ -112,19 +121,24 @@ def process_multiple_files(
         file_paths: List of file paths (images or PDFs)
         output_dir: Output directory for JSON files
         extractor: Optional extractor instance
-        pdf_dpi: DPI for PDF conversion
+        pdf_dpi: DPI for PDF conversion (defaults to settings.pdf_dpi)
         pdf_max_pages: Maximum pages to process from PDF
         keep_images: Keep converted images from PDF
+        pdf_adaptive_dpi: OCR scanned pages at lower DPIs first
         
     Returns:
         Number of successfully processed images
     """
     if extractor is None:
+        from .extractor import ImageDataExtractor
         extractor = ImageDataExtractor()
     
     try:
         logger.info(f"Processing {len(file_paths)} files to directory: {output_dir}")
         successful = 0
+        # 이미지 파일들은 인식을 모아서 한 번에 수행 (cross-page batching 설정 시)
+        image_files = [f for f in file_paths if not extractor.is_pdf_file(f)]
+        ocr_results = dict(zip(image_files, extractor.ocr_batch(image_files)))
         
         for file_path in file_paths:
             try:
@@ -138,10 +152,11 @@ def process_multiple_files(
                         output_path,
                         dpi=pdf_dpi,
                         max_pages=pdf_max_pages,
-                        keep_images=keep_images
+                        keep_images=keep_images,
+                        adaptive=pdf_adaptive_dpi
                     )
                 else:
-                    extractor.extract_to_json(file_path, output_path)
+                    extractor.extract_to_json(file_path, output_path, ocr_result=ocr_results.get(file_path))
                 
                 successful += 1
                 logger.info(f"Processed: {file_path}")
@@ -206,17 +221,19 @@ Examples:
   
   # Set custom log level
   python -m entocr image.jpg --log-level DEBUG
+  
+  # Profile a run (flamegraph-compatible output in logs/)
+  python -m entocr image.jpg --profile
         """
     )
     
-    # Input options
-    input_group = parser.add_mutually_exclusive_group(required=True)
-    input_group.add_argument(
+    # Input options (positional files cannot join a mutually exclusive group on Python 3.11+)
+    parser.add_argument(
         "files",
         nargs="*",
         help="Image or PDF file(s) to process"
     )
-    input_group.add_argument(
+    parser.add_argument(
         "-d", "--directory",
         help="Directory containing images to process"
     )
@@ -252,27 +269,115 @@ Examples:
         action="store_true",
         help="Disable GPU acceleration"
     )
+    parser.add_argument(
+        "--backend",
+        default=settings.ocr_backend,
+        help="OCR backend: paddle, or replay (serves recorded OCR JSON, see OCR_REPLAY_* settings)"
+    )
+    parser.add_argument(
+        "--tile",
+        action="store_true",
+        default=settings.ocr_tiling,
+        help="Recognize images larger than MAX_IMAGE_SIZE in overlapping full-resolution tiles instead of downscaling"
+    )
+    parser.add_argument(
+        "--refine",
+        action="store_true",
+        default=settings.ocr_refine_low_confidence,
+        help="Re-recognize boxes below OCR_REFINE_THRESHOLD confidence from upsampled full-resolution crops"
+    )
+    parser.add_argument(
+        "--cross-page-batching",
+        action="store_true",
+        default=settings.ocr_cross_page_batching,
+        help="Detect text page by page but recognize the lines of all pages/images in large pooled batches"
+    )
+    parser.add_argument(
+        "--orientation-prepass",
+        action="store_true",
+        default=settings.ocr_orientation_prepass,
+        help="Settle page orientation once (EXIF or whole-page classifier) and skip per-line angle classification"
+    )
+    parser.add_argument(
+        "--document-crop",
+        action="store_true",
+        default=settings.ocr_document_crop,
+        help="Detect the page in photos and OCR only the perspective-corrected page (boxes map back to the photo)"
+    )
+    parser.add_argument(
+        "--grayscale",
+        action="store_true",
+        default=settings.ocr_grayscale,
+        help="Convert images to grayscale before OCR"
+    )
     
     # PDF-specific options
     parser.add_argument(
         "--pdf-dpi",
         type=int,
-        default=300,
-        help="DPI for PDF to image conversion (default: 300)"
+        default=settings.pdf_dpi,
+        help=f"DPI for PDF to image conversion (default: {settings.pdf_dpi})"
+    )
+    parser.add_argument(
+        "--pdf-adaptive-dpi",
+        action="store_true",
+        default=settings.pdf_adaptive_dpi,
+        help="OCR scanned pages at lower DPIs first and re-render at --pdf-dpi only when confidence is low"
     )
     parser.add_argument(
         "--pdf-max-pages",
         type=int,
         help="Maximum number of PDF pages to process"
     )
+    parser.add_argument(
+        "--pdf-workers",
+        type=int,
+        default=settings.pdf_render_workers,
+        help="Processes for rasterizing large PDFs (default: one per CPU core)"
+    )
+    parser.add_argument(
+        "--pdf-grayscale",
+        action="store_true",
+        default=settings.pdf_render_grayscale,
+        help="Rasterize PDF pages in grayscale to reduce memory"
+    )
     parser.add_argument(
         "--keep-images",
         action="store_true",
         help="Keep converted PNG files from PDF processing"
     )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="logs",
+        metavar="DIR",
+        help="Run under the sampling profiler and write a collapsed-stack profile to DIR (default: logs)"
+    )
     
     args = parser.parse_args()
+    if bool(args.files) == bool(args.directory):
+        parser.error("specify either input files or --directory")
     
+    if args.profile:
+        from src.utils.profiling import profile_session
+
+        with profile_session(args.profile, "entocr.cli") as prof:
+            exit_code = run(args)
+        if prof is not None and prof.path:
+            logger.info(f"Profile written to: {prof.path}")
+        return exit_code
+    return run(args)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the CLI with parsed arguments.
+    
+    Args:
+        args: Parsed command line arguments
+        
+    Returns:
+        Process exit code
+    """
     # Setup logging
     setup_logging(args.log_level, args.log_file)
     
@@ -297,12 +402,22 @@ Examples:
     
     # Initialize extractor
     try:
+        from .extractor import ImageDataExtractor
         from .ocr_service import OCRService
         ocr_service = OCRService(
             language=args.language,
-            use_gpu=not args.no_gpu if hasattr(args, 'no_gpu') else False
+            use_gpu=not args.no_gpu if hasattr(args, 'no_gpu') else False,
+            backend=args.backend,
+            tiling=args.tile,
+            refine=args.refine,
+            cross_page_batching=args.cross_page_batching,
+            orientation_prepass=args.orientation_prepass,
+            document_crop=args.document_crop,
+            grayscale=args.grayscale
         )
         extractor = ImageDataExtractor(ocr_service)
+        extractor.pdf_converter.workers = args.pdf_workers
+        extractor.pdf_converter.grayscale = args.pdf_grayscale
     except Exception as e:
         logger.error(f"Failed to initialize OCR service: {e}")
         return 1
@@ -316,7 +431,8 @@ Examples:
             extractor,
             pdf_dpi=args.pdf_dpi,
             pdf_max_pages=args.pdf_max_pages,
-            keep_images=args.keep_images
+            keep_images=args.keep_images,
+            pdf_adaptive_dpi=args.pdf_adaptive_dpi
         )
         return 0 if success else 1
     else:
@@ -328,7 +444,8 @@ Examples:
             extractor,
             pdf_dpi=args.pdf_dpi,
             pdf_max_pages=args.pdf_max_pages,
-            keep_images=args.keep_images
+            keep_images=args.keep_images,
+            pdf_adaptive_dpi=args.pdf_adaptive_dpi
         )
         
         total = len(file_paths)
@@ -0,0 +1,144 @@
+"""Document boundary detection and cropping.
+
+Phone photos of receipts often show more table than paper. The background
+costs detection time and produces junk boxes, so the page quadrilateral is
+found on a small copy of the photo, and the full-resolution photo is
+perspective-corrected to it before OCR.
+
+The crop is recorded as a homography from the cropped image back to the
+original photo, so box coordinates can be mapped back for overlays.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from .models import TextBox
+
+
+def order_corners(points: np.ndarray) -> np.ndarray:
+    """Order four points as top-left, top-right, bottom-right, bottom-left."""
+    points = np.asarray(points, dtype=np.float32).reshape(4, 2)
+    sums = points.sum(axis=1)
+    diffs = np.diff(points, axis=1).ravel()  # y - x
+    return np.array(
+        [points[np.argmin(sums)], points[np.argmin(diffs)], points[np.argmax(sums)], points[np.argmax(diffs)]],
+        dtype=np.float32,
+    )
+
+
+def _candidate_masks(gray: np.ndarray) -> List[np.ndarray]:
+    # 1) 가장자리(배경과 종이 경계), 2) 밝기(어두운 책상 위 흰 영수증)
+    edges = cv2.Canny(gray, 50, 150)
+    edges = cv2.dilate(edges, np.ones((3, 3), np.uint8), iterations=2)
+    _, bright = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    bright = cv2.morphologyEx(bright, cv2.MORPH_CLOSE, np.ones((9, 9), np.uint8))
+    return [edges, bright]
+
+
+def find_document(
+    image: np.ndarray,
+    min_area: float = 0.2,
+    max_area: float = 0.95,
+    max_side: int = 640,
+) -> Optional[np.ndarray]:
+    """Find the page quadrilateral in a photo.
+
+    Args:
+        image: Photo (BGR or grayscale)
+        min_area: Smallest page area, relative to the photo
+        max_area: Largest page area worth cropping to, relative to the photo
+        max_side: Side length the photo is downscaled to for the search
+
+    Returns:
+        Page corners (TL, TR, BR, BL) in ``image`` pixels, or None if no
+        convex quadrilateral of a useful size was found
+    """
+    height, width = image.shape[:2]
+    scale = min(1.0, max_side / max(height, width))
+    small = cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA) if scale < 1 else image
+    gray = small if small.ndim == 2 else cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+    gray = cv2.GaussianBlur(gray, (5, 5), 0)
+    total = gray.shape[0] * gray.shape[1]
+
+    for mask in _candidate_masks(gray):
+        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        for contour in sorted(contours, key=cv2.contourArea, reverse=True)[:5]:
+            hull = cv2.convexHull(contour)
+            area = cv2.contourArea(hull)
+            if area < min_area * total:
+                break
+            if area > max_area * total:
+                continue
+            approx = cv2.approxPolyDP(hull, 0.02 * cv2.arcLength(hull, True), True)
+            if len(approx) == 4:
+                return order_corners(approx.reshape(4, 2) / scale)
+    return None
+
+
+def crop_document(image: np.ndarray, quad: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Perspective-correct the page inside a quadrilateral.
+
+    Args:
+        image: Photo
+        quad: Page corners (TL, TR, BR, BL) in ``image`` pixels
+
+    Returns:
+        (upright page, homography from page pixels back to ``image`` pixels)
+    """
+    tl, tr, br, bl = quad
+    width = int(round(max(np.linalg.norm(tr - tl), np.linalg.norm(br - bl))))
+    height = int(round(max(np.linalg.norm(bl - tl), np.linalg.norm(br - tr))))
+    target = np.array([[0, 0], [width, 0], [width, height], [0, height]], dtype=np.float32)
+    matrix = cv2.getPerspectiveTransform(quad.astype(np.float32), target)
+    page = cv2.warpPerspective(image, matrix, (width, height), flags=cv2.INTER_CUBIC, borderMode=cv2.BORDER_REPLICATE)
+    return page, np.linalg.inv(matrix)
+
+
+def map_boxes(text_boxes: List[TextBox], matrix: np.ndarray, image_size: Tuple[int, int]) -> List[TextBox]:
+    """Map text box corners through a homography.
+
+    Args:
+        text_boxes: Boxes in the source frame
+        matrix: 3x3 homography from the source frame to the target frame
+        image_size: Target image size (width, height) the corners are clipped to
+
+    Returns:
+        Boxes with corners in the target frame
+    """
+    if not text_boxes:
+        return text_boxes
+    points = np.array([box.coordinates for box in text_boxes], dtype=np.float64).reshape(-1, 1, 2)
+    mapped = cv2.perspectiveTransform(points, np.asarray(matrix, dtype=np.float64)).reshape(-1, 4, 2)
+    width, height = image_size
+    mapped[..., 0] = mapped[..., 0].clip(0, width)
+    mapped[..., 1] = mapped[..., 1].clip(0, height)
+    return [
+        TextBox(coordinates=np.rint(corners).astype(int).tolist(), text=box.text, confidence=box.confidence)
+        for box, corners in zip(text_boxes, mapped)
+    ]
+
+
+def crop_info(
+    quad: np.ndarray,
+    matrix: np.ndarray,
+    page_size: Tuple[int, int],
+    image_size: Tuple[int, int],
+) -> Dict[str, Any]:
+    """Describe a document crop for OCRResult.document_crop.
+
+    Args:
+        quad: Page corners in original photo pixels
+        matrix: Homography from page pixels (as fed to OCR) to photo pixels
+        page_size: Size (width, height) of the page image fed to OCR
+        image_size: Size (width, height) of the original photo
+    """
+    page_area = cv2.contourArea(quad.astype(np.float32))
+    return {
+        "quad": np.rint(quad).astype(int).tolist(),
+        "page_size": list(page_size),
+        "source_size": list(image_size),
+        "area_ratio": round(float(page_area / (image_size[0] * image_size[1])), 4),
+        "matrix": np.asarray(matrix, dtype=float).round(8).tolist(),
+    }
@@ -2,6 +2,7 @@
 
 import json
 import re
+import shutil
 import tempfile
 from datetime import datetime
 from pathlib import Path
@@ -10,9 +11,12 @@ from typing import Any, Dict, List, Optional, Union
 from loguru import logger
 
 from config.settings import settings
-from .models import ExtractionResult, TextBox
+from .adaptive import adaptive_dpi_steps, page_quality, retry_reason
+from .models import ExtractionResult, OCRResult, TextBox
 from .ocr_service import OCRService
 from .pdf_converter import PDFConverter
+from .pdf_render import iter_render_pages
+from .pdf_text import extract_text_layer
 
 
 class ImageDataExtractor:
@@ -217,16 +221,137 @@ class ImageDataExtractor:
         
         return layout_info
 
+    def ocr_batch(self, image_paths: List[Union[str, Path]]) -> List[Optional[OCRResult]]:
+        """OCR several images with recognition pooled across them, if enabled.
+        
+        Returns:
+            One OCRResult per image; None where the image is to be OCR'd on its own
+            (cross-page batching disabled or unavailable, or the image failed)
+        """
+        if len(image_paths) < 2 or not self.ocr_service.pools_recognition:
+            return [None] * len(image_paths)
+        return self.ocr_service.extract_text_batch(image_paths)
+
+    def _build_extraction_result(
+        self,
+        source: Union[str, Path],
+        ocr_result: OCRResult,
+        custom_processors: Optional[List[callable]] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> ExtractionResult:
+        """Derive structured data and metadata from recognized text boxes.
+        
+        Args:
+            source: Source image (or PDF) path
+            ocr_result: Recognized text boxes
+            custom_processors: Optional list of custom processing functions
+            metadata: Extra extraction metadata (e.g. text source, page number)
+            
+        Returns:
+            ExtractionResult containing OCR results and structured data
+        """
+        if ocr_result.orientation:
+            metadata = {'orientation': ocr_result.orientation, **(metadata or {})}
+        if ocr_result.document_crop:
+            metadata = {'document_crop': ocr_result.document_crop, **(metadata or {})}
+        
+        if not ocr_result.text_boxes:
+            logger.warning(f"No text detected in image: {source}")
+            return ExtractionResult(
+                source_image=str(source),
+                ocr_result=ocr_result,
+                structured_data={},
+                extraction_metadata={
+                    'extraction_time': datetime.now().isoformat(),
+                    'processing_successful': False,
+                    'error': 'No text detected',
+                    **(metadata or {})
+                }
+            )
+        
+        # Extract structured data
+        structured_data = {
+            'key_value_pairs': self._extract_key_value_pairs(ocr_result.text_boxes),
+            'tables': self._extract_tables(ocr_result.text_boxes),
+            'numbers_and_amounts': self._extract_numbers_and_amounts(ocr_result.text_boxes),
+            'dates': self._extract_dates(ocr_result.text_boxes),
+            'raw_text_lines': [box.text for box in ocr_result.text_boxes],
+            'layout_analysis': self._analyze_layout(ocr_result.text_boxes)
+        }
+        
+        # Apply custom processors if provided
+        if custom_processors:
+            for processor in custom_processors:
+                try:
+                    custom_data = processor(ocr_result.text_boxes)
+                    if isinstance(custom_data, dict):
+                        structured_data.update(custom_data)
+                except Exception as e:
+                    logger.warning(f"Custom processor failed: {e}")
+        
+        # Create extraction metadata
+        extraction_metadata = {
+            'extraction_time': datetime.now().isoformat(),
+            'processing_successful': True,
+            'text_boxes_count': len(ocr_result.text_boxes),
+            'total_characters': sum(len(box.text) for box in ocr_result.text_boxes),
+            'avg_confidence': ocr_result.average_confidence,
+            'processing_time': ocr_result.processing_time,
+            'image_size': ocr_result.image_size,
+            **(metadata or {})
+        }
+        
+        return ExtractionResult(
+            source_image=str(source),
+            ocr_result=ocr_result,
+            structured_data=structured_data,
+            extraction_metadata=extraction_metadata
+        )
+
+    def extract_from_text_layer(
+        self,
+        pdf_path: Union[str, Path],
+        dpi: int = 300,
+        max_pages: Optional[int] = None,
+        custom_processors: Optional[List[callable]] = None
+    ) -> List[Optional[ExtractionResult]]:
+        """Extract born-digital PDF pages from their text layer without OCR.
+        
+        Args:
+            pdf_path: Path to PDF file
+            dpi: Render DPI the box coordinates are scaled to
+            max_pages: Maximum number of pages to read
+            custom_processors: Optional list of custom processing functions
+            
+        Returns:
+            One entry per page: an ExtractionResult whose source_image is the
+            PDF itself, or None for pages that need OCR. Empty when the text
+            layer is disabled (settings.pdf_text_layer) or unreadable.
+        """
+        if not settings.pdf_text_layer:
+            return []
+        return [
+            None if ocr_result is None else self._build_extraction_result(
+                pdf_path,
+                ocr_result,
+                custom_processors,
+                {'text_source': 'pdf_text_layer', 'page_number': i + 1, 'render_dpi': dpi}
+            )
+            for i, ocr_result in enumerate(extract_text_layer(pdf_path, dpi, max_pages))
+        ]
+
     def extract_from_image(
         self, 
         image_path: Union[str, Path],
-        custom_processors: Optional[List[callable]] = None
+        custom_processors: Optional[List[callable]] = None,
+        ocr_result: Optional[OCRResult] = None
     ) -> ExtractionResult:
         """Extract structured data from an image.
         
         Args:
             image_path: Path to the image file
             custom_processors: Optional list of custom processing functions
+            ocr_result: OCR result of the image if already computed (cross-page batching)
             
         Returns:
             ExtractionResult containing OCR results and structured data
@@ -236,58 +361,9 @@ class ImageDataExtractor:
         
         try:
             # Perform OCR
-            ocr_result = self.ocr_service.extract_text(image_path)
-            
-            if not ocr_result.text_boxes:
-                logger.warning(f"No text detected in image: {image_path}")
-                return ExtractionResult(
-                    source_image=str(image_path),
-                    ocr_result=ocr_result,
-                    structured_data={},
-                    extraction_metadata={
-                        'extraction_time': datetime.now().isoformat(),
-                        'processing_successful': False,
-                        'error': 'No text detected'
-                    }
-                )
-            
-            # Extract structured data
-            structured_data = {
-                'key_value_pairs': self._extract_key_value_pairs(ocr_result.text_boxes),
-                'tables': self._extract_tables(ocr_result.text_boxes),
-                'numbers_and_amounts': self._extract_numbers_and_amounts(ocr_result.text_boxes),
-                'dates': self._extract_dates(ocr_result.text_boxes),
-                'raw_text_lines': [box.text for box in ocr_result.text_boxes],
-                'layout_analysis': self._analyze_layout(ocr_result.text_boxes)
-            }
-            
-            # Apply custom processors if provided
-            if custom_processors:
-                for processor in custom_processors:
-                    try:
-                        custom_data = processor(ocr_result.text_boxes)
-                        if isinstance(custom_data, dict):
-                            structured_data.update(custom_data)
-                    except Exception as e:
-                        logger.warning(f"Custom processor failed: {e}")
-            
-            # Create extraction metadata
-            extraction_metadata = {
-                'extraction_time': datetime.now().isoformat(),
-                'processing_successful': True,
-                'text_boxes_count': len(ocr_result.text_boxes),
-                'total_characters': sum(len(box.text) for box in ocr_result.text_boxes),
-                'avg_confidence': ocr_result.average_confidence,
-                'processing_time': ocr_result.processing_time,
-                'image_size': ocr_result.image_size
-            }
-            
-            result = ExtractionResult(
-                source_image=str(image_path),
-                ocr_result=ocr_result,
-                structured_data=structured_data,
-                extraction_metadata=extraction_metadata
-            )
+            if ocr_result is None:
+                ocr_result = self.ocr_service.extract_text(image_path)
+            result = self._build_extraction_result(image_path, ocr_result, custom_processors)
             
             logger.info(f"Data extraction completed successfully for: {image_path}")
             return result
@@ -300,7 +376,8 @@ class ImageDataExtractor:
         self, 
         image_path: Union[str, Path],
         output_path: Optional[Union[str, Path]] = None,
-        custom_processors: Optional[List[callable]] = None
+        custom_processors: Optional[List[callable]] = None,
+        ocr_result: Optional[OCRResult] = None
     ) -> str:
         """Extract data from image and save as JSON.
         
@@ -308,12 +385,13 @@ class ImageDataExtractor:
             image_path: Path to the image file
             output_path: Optional output path for JSON file
             custom_processors: Optional list of custom processing functions
+            ocr_result: OCR result of the image if already computed (cross-page batching)
             
         Returns:
             JSON string of extracted data
         """
         # Extract data
-        result = self.extract_from_image(image_path, custom_processors)
+        result = self.extract_from_image(image_path, custom_processors, ocr_result)
         
         # Convert to JSON
         json_data = result.to_json_dict()
@@ -355,8 +433,9 @@ class ImageDataExtractor:
         output_dir.mkdir(parents=True, exist_ok=True)
         
         json_results = []
+        ocr_results = self.ocr_batch(image_paths)
         
-        for image_path in image_paths:
+        for image_path, ocr_result in zip(image_paths, ocr_results):
             try:
                 image_path = Path(image_path)
                 output_path = output_dir / f"{image_path.stem}_extracted.json"
@@ -364,7 +443,8 @@ class ImageDataExtractor:
                 json_string = self.extract_to_json(
                     image_path, 
                     output_path, 
-                    custom_processors
+                    custom_processors,
+                    ocr_result
                 )
                 json_results.append(json_string)
                 
@@ -374,6 +454,62 @@ class ImageDataExtractor:
         
         return json_results
     
+    def extract_from_pdf_page(
+        self,
+        pdf_path: Union[str, Path],
+        page_num: int,
+        image_path: Union[str, Path],
+        dpi_steps: List[int],
+        filename_prefix: str = "page",
+        custom_processors: Optional[List[callable]] = None,
+        ocr_result: Optional[OCRResult] = None
+    ) -> ExtractionResult:
+        """OCR a rendered PDF page, re-rendering at higher DPI while quality is low.
+        
+        ``image_path`` must be the page rendered at ``dpi_steps[0]``. Each
+        following step is only rendered (next to ``image_path``) if the
+        previous OCR result fails the adaptive thresholds (see
+        src.entocr.adaptive). With a single step this is plain OCR.
+        
+        Args:
+            pdf_path: Path to PDF file
+            page_num: 0-based page index
+            image_path: The page rendered at dpi_steps[0]
+            dpi_steps: Render resolutions to try, lowest first
+            filename_prefix: Filename prefix for re-rendered pages
+            custom_processors: Optional list of custom processing functions
+            ocr_result: OCR result of ``image_path`` if already computed
+                (cross-page batching)
+            
+        Returns:
+            ExtractionResult of the last attempt; extraction_metadata records
+            ``render_dpi`` and every attempt in ``dpi_attempts``
+        """
+        image_path = Path(image_path)
+        attempts = []
+        for step, dpi in enumerate(dpi_steps):
+            if step > 0:
+                [(_, rendered)] = iter_render_pages(
+                    str(pdf_path), [page_num], dpi, self.pdf_converter.grayscale,
+                    str(image_path.parent), f"{filename_prefix}_{dpi}dpi"
+                )
+                image_path = Path(rendered)
+            if step > 0 or ocr_result is None:
+                ocr_result = self.ocr_service.extract_text(image_path)
+            quality = page_quality(ocr_result, dpi)
+            reason = retry_reason(quality) if step < len(dpi_steps) - 1 else None
+            attempts.append({**quality, 'retry_reason': reason})
+            if reason is None:
+                break
+            logger.info(f"Page {page_num + 1}: {reason} at {dpi} DPI, re-rendering at {dpi_steps[step + 1]} DPI")
+        
+        return self._build_extraction_result(
+            image_path,
+            ocr_result,
+            custom_processors,
+            {'text_source': 'ocr', 'page_number': page_num + 1, 'render_dpi': dpi, 'dpi_attempts': attempts}
+        )
+
 #-----------------------------------------------------------------------------------------------------------------------
 #pdf 변환 관련 코드 
     # 이미지 전처리를 별도로 일괄 수행한 후 OCR 처리할 것이므로 아래 코드 사용하지 않을 예정임
@@ -383,18 +519,24 @@ class ImageDataExtractor:
         output_dir: Optional[Union[str, Path]] = None,
         custom_processors: Optional[List] = None,
         keep_images: bool = False,
-        dpi: int = 300,
-        max_pages: Optional[int] = None
+        dpi: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        adaptive: Optional[bool] = None
     ) -> Dict[str, Any]:
-        """Extract data from PDF by converting to images first.
+        """Extract data from PDF, converting scanned pages to images for OCR.
+        
+        Pages with a usable text layer are read directly (see
+        extract_from_text_layer) and are not rasterized.
         
         Args:
             pdf_path: Path to PDF file
             output_dir: Directory to save results (None for same as PDF)
             custom_processors: Custom data processing functions
             keep_images: Whether to keep converted PNG files
-            dpi: DPI for PDF to image conversion
+            dpi: DPI for PDF to image conversion (defaults to settings.pdf_dpi)
             max_pages: Maximum number of pages to process
+            adaptive: OCR scanned pages at lower DPIs first and re-render up to
+                ``dpi`` only when quality is low (defaults to settings.pdf_adaptive_dpi)
             
         Returns:
             Dictionary with extraction results for all pages
@@ -408,6 +550,8 @@ class ImageDataExtractor:
             raise ValueError(f"PDF file not found: {pdf_path}")
         
         logger.info(f"Starting PDF extraction from: {pdf_path}")
+        dpi = dpi or settings.pdf_dpi
+        dpi_steps = adaptive_dpi_steps(dpi, adaptive)
         
         # Set up output directory
         if output_dir is None:
@@ -418,20 +562,29 @@ class ImageDataExtractor:
         
         # Create temporary directory for images
         temp_dir = Path(tempfile.mkdtemp(prefix="pdf_extract_"))
+        image_paths = []
         
         try:
+            # Born-digital pages are read from the text layer; only scanned pages are rasterized
+            text_pages = self.extract_from_text_layer(pdf_path, dpi, max_pages, custom_processors)
+            scanned_pages = [i for i, page in enumerate(text_pages) if page is None]
+            
             # Convert PDF to images
-            self.pdf_converter.dpi = dpi
-            self.pdf_converter.max_pages = max_pages
-            
-            logger.info(f"Converting PDF to images at {dpi} DPI...")
-            image_paths = self.pdf_converter.convert_pdf_to_images(
-                pdf_path, 
-                temp_dir if not keep_images else output_dir / "pages",
-                filename_prefix=f"{pdf_path.stem}_page"
-            )
+            if not text_pages or scanned_pages:
+                self.pdf_converter.dpi = dpi_steps[0]
+                self.pdf_converter.max_pages = max_pages
+                
+                logger.info(f"Converting PDF to images at {dpi_steps[0]} DPI...")
+                image_paths = self.pdf_converter.convert_pdf_to_images(
+                    pdf_path, 
+                    temp_dir if not keep_images else output_dir / "pages",
+                    filename_prefix=f"{pdf_path.stem}_page",
+                    pages=scanned_pages if text_pages else None
+                )
+            page_images = dict(zip(scanned_pages if text_pages else range(len(image_paths)), image_paths))
+            page_count = len(text_pages) or len(image_paths)
             
-            if not image_paths:
+            if not page_count:
                 logger.error("No images were generated from PDF")
                 return {
                     "pdf_info": {
@@ -452,14 +605,18 @@ class ImageDataExtractor:
                     }
                 }
             
-            logger.info(f"Converted {len(image_paths)} pages to images")
+            logger.info(
+                f"Converted {len(image_paths)} pages to images, "
+                f"{page_count - len(page_images)} pages read from the text layer"
+            )
             
             # Process each page
             results = {
                 "pdf_info": {
                     "source_file": str(pdf_path),
-                    "total_pages": len(image_paths),
+                    "total_pages": page_count,
                     "conversion_dpi": dpi,
+                    "dpi_steps": dpi_steps,
                     "processed_at": datetime.now().isoformat()
                 },
                 "pages": [],
@@ -473,13 +630,26 @@ class ImageDataExtractor:
             total_boxes = 0
             total_confidence = 0.0
             total_time = 0.0
+            # 교차 페이지 배칭: 스캔 페이지들의 인식을 한 번에 모아서 수행 (첫 DPI 단계)
+            batch_results = dict(zip(page_images, self.ocr_batch(list(page_images.values()))))
             
-            for i, image_path in enumerate(image_paths):
-                logger.info(f"Processing page {i+1}/{len(image_paths)}: {image_path.name}")
+            for i in range(page_count):
+                image_path = page_images.get(i)
+                text_page = text_pages[i] if text_pages else None
                 
                 try:
                     # Extract data from this page
-                    page_result = self.extract_from_image(image_path, custom_processors)
+                    if text_page is not None:
+                        logger.info(f"Page {i+1}/{page_count}: using PDF text layer")
+                        page_result = text_page
+                    elif image_path is None:
+                        raise RuntimeError("Page was not converted to an image")
+                    else:
+                        logger.info(f"Processing page {i+1}/{page_count}: {image_path.name}")
+                        page_result = self.extract_from_pdf_page(
+                            pdf_path, i, image_path, dpi_steps, f"{pdf_path.stem}_page", custom_processors,
+                            batch_results.get(i)
+                        )
                     
                     # Add page info (convert ExtractionResult to dict)
                     if hasattr(page_result, 'model_dump'):
@@ -494,7 +664,8 @@ class ImageDataExtractor:
                     
                     page_data = {
                         "page_number": i + 1,
-                        "image_file": str(image_path.name),
+                        "image_file": str(image_path.name) if image_path else None,
+                        "text_source": "pdf_text_layer" if text_page is not None else "ocr",
                         "extraction_result": result_dict
                     }
                     results["pages"].append(page_data)
@@ -512,7 +683,7 @@ class ImageDataExtractor:
                     logger.error(f"Failed to process page {i+1}: {e}")
                     page_data = {
                         "page_number": i + 1,
-                        "image_file": str(image_path.name),
+                        "image_file": str(image_path.name) if image_path else None,
                         "error": str(e),
                         "extraction_result": None
                     }
@@ -526,10 +697,10 @@ class ImageDataExtractor:
                     "average_confidence": total_confidence / valid_pages,
                     "processing_time": total_time,
                     "successful_pages": valid_pages,
-                    "failed_pages": len(image_paths) - valid_pages
+                    "failed_pages": page_count - valid_pages
                 })
             
-            logger.info(f"PDF extraction completed: {valid_pages}/{len(image_paths)} pages processed")
+            logger.info(f"PDF extraction completed: {valid_pages}/{page_count} pages processed")
             
             return results
             
@@ -537,10 +708,8 @@ class ImageDataExtractor:
             # Clean up temporary files if not keeping them
             if not keep_images:
                 self.pdf_converter.cleanup_temp_files(image_paths)
-                try:
-                    temp_dir.rmdir()
-                except Exception as e:
-                    logger.debug(f"Could not remove temp directory: {e}")
+                # 적응형 DPI 로 다시 렌더링한 페이지 파일까지 함께 삭제
+                shutil.rmtree(temp_dir, ignore_errors=True)
 
     # 이미지 전처리를 별도로 일괄 수행한 후 OCR 처리할 것이므로 아래 코드 사용하지 않을 예정임
     def extract_pdf_to_json(
@@ -549,8 +718,9 @@ class ImageDataExtractor:
         output_path: Optional[Union[str, Path]] = None,
         custom_processors: Optional[List] = None,
         keep_images: bool = False,
-        dpi: int = 300,
-        max_pages: Optional[int] = None
+        dpi: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        adaptive: Optional[bool] = None
     ) -> str:
         """Extract data from PDF and save as JSON.
         
@@ -559,8 +729,9 @@ class ImageDataExtractor:
             output_path: Path for output JSON file (None for auto-generated)
             custom_processors: Custom data processing functions
             keep_images: Whether to keep converted PNG files
-            dpi: DPI for PDF to image conversion
+            dpi: DPI for PDF to image conversion (defaults to settings.pdf_dpi)
             max_pages: Maximum number of pages to process
+            adaptive: Try lower DPIs first for scanned pages (see extract_from_pdf)
             
         Returns:
             JSON string with extraction results
@@ -579,7 +750,8 @@ class ImageDataExtractor:
             custom_processors,
             keep_images,
             dpi,
-            max_pages
+            max_pages,
+            adaptive
         )
         
         # Save to JSON file
@@ -0,0 +1,73 @@
+"""On-disk cache of PaddleOCR constructor parameters rejected by the installed version.
+
+PaddleOCR 2.x and 3.x accept different constructor arguments, so OCRService
+retries without each argument the installed version reports as unknown. The
+reported names are stored per package version, so later cold starts (in
+every worker process) drop them up front and build the engine in a single
+attempt. A stale entry only costs extra attempts: newly reported arguments
+are dropped the same way and the entry is rewritten.
+"""
+
+import json
+import os
+import uuid
+from importlib import metadata
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, Union
+
+from loguru import logger
+
+
+def paddleocr_version() -> Optional[str]:
+    """Get the cache key for the installed PaddleOCR (and PaddleX) version."""
+    versions = []
+    for package in ("paddleocr", "paddlex"):
+        try:
+            versions.append(f"{package}=={metadata.version(package)}")
+        except metadata.PackageNotFoundError:
+            continue
+    return ",".join(versions) or None
+
+
+def _read(path: Path) -> Dict[str, list]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable PaddleOCR init cache {path}: {e}")
+        return {}
+
+
+def load_rejected_params(path: Union[str, Path], version: Optional[str]) -> Optional[Set[str]]:
+    """Get the parameter names rejected by this PaddleOCR version.
+
+    Returns:
+        The rejected names, or None if nothing is cached for the version
+    """
+    if not path or not version:
+        return None
+    rejected = _read(Path(path)).get(version)
+    return set(rejected) if isinstance(rejected, list) else None
+
+
+def save_rejected_params(path: Union[str, Path], version: Optional[str], rejected: Iterable[str]) -> None:
+    """Record the parameter names rejected by this PaddleOCR version (atomic replace)."""
+    if not path or not version:
+        return
+    path = Path(path)
+    data = _read(path)
+    data[version] = sorted(rejected)
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        # 여러 워커가 동시에 써도 파일이 깨지지 않도록 교체 방식으로 저장
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning(f"Could not write PaddleOCR init cache {path}: {e}")
+    finally:
+        tmp.unlink(missing_ok=True)
@@ -1,5 +1,7 @@
 import os
-from PIL import Image
+from PIL import Image, ImageOps
+
+EXIF_ORIENTATION_TAG = 0x0112
 
 def convert_jpg_to_png(jpg_path: str, output_dir: str) -> str:
     """
@@ -21,12 +23,21 @@ def convert_jpg_to_png(jpg_path: str, output_dir: str) -> str:
 
     # JPG → PNG 변환
     with Image.open(jpg_path) as img:
+        # EXIF 방향은 PNG 로 넘어가지 않으므로 픽셀을 바로 세우고, 방향 태그는 1(정방향)로 남김
+        # → OCR 방향 사전 처리가 분류기 없이 EXIF 로 방향을 확정할 수 있음
+        has_orientation = img.getexif().get(EXIF_ORIENTATION_TAG) in range(1, 9)
+        img = ImageOps.exif_transpose(img)
         # RGB 변환 (투명 배경 불필요시)
         if img.mode in ("RGBA", "P"):
             img = img.convert("RGBA")
         else:
             img = img.convert("RGB")
-        img.save(png_path, "PNG")
+        if has_orientation:
+            exif = Image.Exif()
+            exif[EXIF_ORIENTATION_TAG] = 1
+            img.save(png_path, "PNG", exif=exif)
+        else:
+            img.save(png_path, "PNG")
 
     return png_path
 
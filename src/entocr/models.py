@@ -46,6 +46,14 @@ class OCRResult(BaseModel):
     text_boxes: List[TextBox] = Field(default_factory=list, description="Detected text boxes")
     processing_time: float = Field(..., ge=0.0, description="Processing time in seconds")
     image_size: Tuple[int, int] = Field(..., description="Original image size (width, height)")
+    orientation: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="Orientation pre-pass result (source, rotation, confidence, known); None if not run"
+    )
+    document_crop: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="Document crop (page quad, page/source size, page-to-source homography); None if not cropped"
+    )
     
     @property
     def total_text(self) -> str:
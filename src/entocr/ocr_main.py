@@ -6,6 +6,7 @@ PDF/JPG/PNG 파일을 입력하면, 결과 JSON을 반환합니다.
 import sys
 import os
 import tempfile
+import threading
 from pathlib import Path
 from typing import List, Union
 
@@ -14,10 +15,34 @@ src_path = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_path))
 
 from src.entocr import ImageDataExtractor
+from src.entocr.adaptive import adaptive_dpi_steps
 from config.settings import settings
 from loguru import logger
 from src.utils.constants import EXTRACTED_JSON_DIR
+from src.utils.tracing import span, traced
 import datetime
+import json
+
+# OCR 엔진(PaddleOCR 모델 로드)은 비싸므로 프로세스 안에서 한 번만 만들고 재사용
+_shared_extractor = None
+_shared_extractor_lock = threading.Lock()
+# 같은 엔진을 여러 요청 스레드가 동시에 호출하지 않도록 직렬화
+ocr_engine_lock = threading.Lock()
+
+def get_shared_extractor() -> ImageDataExtractor:
+    global _shared_extractor
+    if _shared_extractor is None:
+        with _shared_extractor_lock:
+            if _shared_extractor is None:
+                _shared_extractor = ImageDataExtractor()
+    return _shared_extractor
+
+# OCR_WORKERS 설정 시 재활용되는 워커 프로세스에서, 아니면 현재 프로세스에서 파일을 OCR 합니다.
+def ocr_file(image_path: str) -> dict:
+    if settings.ocr_workers > 0:
+        from src.entocr.ocr_workers import get_ocr_worker_pool, ocr_file_task
+        return get_ocr_worker_pool().run(ocr_file_task, str(image_path))
+    return ocr_image_and_save_json_by_extension(image_path)
 
 # 이미지 파일을 추출합니다.
 def ocr_image_and_save_json(image_path: str, output_path: str) -> None:
@@ -27,6 +52,7 @@ def ocr_image_and_save_json(image_path: str, output_path: str) -> None:
     return json_result
 
 # 확장자 검사 후 임시 폴더에 변환을 수행한 뒤에, 이미지 파일을 추출합니다.
+@traced("ocr.file")
 def ocr_image_and_save_json_by_extension(image_path: str) -> str:
     """
     파일 확장자에 따라 변환 후 OCR을 수행합니다.
@@ -53,20 +79,34 @@ def ocr_image_and_save_json_by_extension(image_path: str) -> str:
         
         # 확장자 변환 수행
         try:
+            text_pages, scanned_pages = [], []
+            # 적응형 DPI: 낮은 해상도로 먼저 OCR 하고 품질이 낮은 페이지만 settings.pdf_dpi 까지 다시 렌더링
+            dpi_steps = adaptive_dpi_steps(settings.pdf_dpi)
             if extension == ".pdf":
-                from src.entocr import convert_pdf_to_png
-                logger.info("Converting PDF to PNG images...")
-                converted_files = convert_pdf_to_png(
-                    image_path, 
-                    temp_path, 
-                    dpi=300
-                )
-                logger.info(f"Converted {len(converted_files)} pages")
+                # 텍스트 레이어가 있는 페이지(전자세금계산서, 카드명세서 등)는 래스터화/OCR 없이 바로 추출
+                with span("ocr.pdf_text_layer") as sp:
+                    text_pages = get_shared_extractor().extract_from_text_layer(image_path, dpi=settings.pdf_dpi)
+                    scanned_pages = [i for i, page in enumerate(text_pages) if page is None]
+                    sp.set(pages=len(text_pages), text_pages=len(text_pages) - len(scanned_pages))
+                
+                if not text_pages or scanned_pages:
+                    from src.entocr import convert_pdf_to_png
+                    logger.info("Converting PDF to PNG images...")
+                    with span("ocr.convert_pdf") as sp:
+                        converted_files = convert_pdf_to_png(
+                            image_path, 
+                            temp_path, 
+                            dpi=dpi_steps[0],
+                            pages=scanned_pages if text_pages else None
+                        )
+                        sp.set(pages=len(converted_files))
+                    logger.info(f"Converted {len(converted_files)} pages")
                 
             elif extension in [".jpg", ".jpeg"]:
                 from src.entocr import convert_jpg_to_png
                 logger.info("Converting JPG/JPEG to PNG...")
-                converted_file = convert_jpg_to_png(image_path, str(temp_path))
+                with span("ocr.convert_jpg"):
+                    converted_file = convert_jpg_to_png(image_path, str(temp_path))
                 converted_files = [Path(converted_file)]
                 logger.info(f"Converted to: {converted_file}")
                 
@@ -79,27 +119,53 @@ def ocr_image_and_save_json_by_extension(image_path: str) -> str:
                 raise ValueError(f"Unsupported file extension: {extension}")
             
             # OCR 처리
-            extractor = ImageDataExtractor()
+            extractor = get_shared_extractor()
             processed_time = datetime.datetime.now().isoformat()
+            # 페이지 번호(0부터) → 변환된 이미지. 텍스트 레이어로 추출한 페이지는 이미지가 없음
+            page_images = dict(zip(scanned_pages if text_pages else range(len(converted_files)), converted_files))
+            page_count = len(text_pages) or len(converted_files)
+            
+            # 교차 페이지 배칭(OCR_CROSS_PAGE_BATCHING): 스캔 페이지들의 인식을 모아서 한 번에 수행
+            with ocr_engine_lock:
+                batch_results = dict(zip(page_images, extractor.ocr_batch(list(page_images.values()))))
+            
+            def ocr_page(i: int, img_path: Path):
+                with ocr_engine_lock:
+                    if extension == ".pdf":
+                        return extractor.extract_from_pdf_page(
+                            image_path, i, img_path, dpi_steps, ocr_result=batch_results.get(i)
+                        )
+                    return extractor.extract_from_image(img_path, ocr_result=batch_results.get(i))
             
-            if len(converted_files) == 1:
+            if page_count == 1:
                 # 단일 이미지 처리
-                result = extractor.extract_to_json(str(converted_files[0]), output_path)
+                if text_pages and text_pages[0] is not None:
+                    result = text_pages[0]
+                else:
+                    result = ocr_page(0, page_images[0])
+                Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+                with open(output_path, "w", encoding="utf-8") as f:
+                    json.dump(result.to_json_dict(), f, indent=settings.output_indent, ensure_ascii=settings.output_ensure_ascii)
                 return result.to_json_dict()
                 logger.info(f"Single image processed successfully: {output_path}")
             else:
                 # 여러 이미지 처리 (PDF의 경우)
-                logger.info(f"Processing {len(converted_files)} images...")
+                logger.info(f"Processing {page_count} pages ({len(page_images)} by OCR)...")
                 all_results = []
                 
-                for i, img_path in enumerate(converted_files, 1):
-                    logger.info(f"Processing page {i}/{len(converted_files)}: {img_path.name}")
-                    page_result = extractor.extract_from_image(img_path)
+                for i in range(page_count):
+                    img_path = page_images.get(i)
+                    if text_pages and text_pages[i] is not None:
+                        page_result = text_pages[i]
+                    else:
+                        logger.info(f"Processing page {i + 1}/{page_count}: {img_path.name}")
+                        page_result = ocr_page(i, img_path)
                     
                     # 페이지 정보 추가
                     page_data = {
-                        "page_number": i,
-                        "image_file": img_path.name,
+                        "page_number": i + 1,
+                        "image_file": img_path.name if img_path else None,
+                        "text_source": "ocr" if img_path else "pdf_text_layer",
                         "extraction_result": page_result.model_dump() if hasattr(page_result, 'model_dump') else page_result.__dict__
                     }
                     all_results.append(page_data)
@@ -107,7 +173,7 @@ def ocr_image_and_save_json_by_extension(image_path: str) -> str:
                 # 통합 결과 생성
                 combined_result = {
                     "source_file": str(file_path),
-                    "total_pages": len(converted_files),
+                    "total_pages": page_count,
                     "processed_at": processed_time,
                     "pages": all_results,
                     "summary": {
@@ -1,17 +1,30 @@
 """OCR service using PaddleOCR for text detection and recognition."""
 
+import re
 import time
 from pathlib import Path
-from typing import List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import cv2
 import numpy as np
 from loguru import logger
-from paddleocr import PaddleOCR
 from PIL import Image
 
 from config.settings import settings
+from src.utils.tracing import span, traced
+from .batching import line_crop, recognize_batched
+from .document import crop_document, crop_info, find_document, map_boxes
+from .init_cache import load_rejected_params, paddleocr_version, save_rejected_params
 from .models import OCRResult, TextBox
+from .orientation import OrientationClassifier, detect_orientation, rotate, unrotate_matrix
+from .refine import Recognizer, refine_boxes
+from .tiling import merge_tile_boxes, plan_tiles
+
+
+def _unknown_argument(error: Exception) -> Optional[str]:
+    """Get the argument name from PaddleOCR's "Unknown argument: <name>" error, or None."""
+    match = re.search(r"unknown argument:?\s*['\"]?(\w+)", str(error), re.IGNORECASE)
+    return match.group(1) if match else None
 
 
 class OCRService:
@@ -24,6 +37,18 @@ class OCRService:
         use_gpu: Optional[bool] = None,
         det_limit_side_len: Optional[int] = None,
         rec_batch_num: Optional[int] = None,
+        backend: Optional[Any] = None,
+        tiling: Optional[bool] = None,
+        tile_size: Optional[int] = None,
+        tile_overlap: Optional[int] = None,
+        refine: Optional[bool] = None,
+        refine_threshold: Optional[float] = None,
+        cross_page_batching: Optional[bool] = None,
+        inference_engine: Optional[str] = None,
+        cpu_threads: Optional[int] = None,
+        orientation_prepass: Optional[bool] = None,
+        document_crop: Optional[bool] = None,
+        grayscale: Optional[bool] = None,
     ) -> None:
         """Initialize OCR service with configuration.
         
@@ -33,20 +58,86 @@ class OCRService:
             use_gpu: Whether to use GPU acceleration (defaults to settings value)
             det_limit_side_len: Detection limit side length (defaults to settings value)
             rec_batch_num: Recognition batch number (defaults to settings value)
+            backend: OCR backend name or instance (defaults to settings.ocr_backend).
+                Anything other than "paddle" is created via src.entocr.backends.
+            tiling: Recognize oversized images in overlapping full-resolution
+                tiles instead of downscaling them (defaults to settings value)
+            tile_size: Tile side length in pixels (defaults to settings value)
+            tile_overlap: Overlap between tiles in pixels (defaults to settings value)
+            refine: Re-recognize low-confidence boxes from full-resolution crops
+                (defaults to settings value)
+            refine_threshold: Boxes below this confidence are re-recognized
+                (defaults to settings value)
+            cross_page_batching: Pool recognition crops of all images passed to
+                batch_extract_text into large batches (defaults to settings value)
+            inference_engine: PaddleOCR inference runtime, "paddle" or "onnxruntime"
+                (defaults to settings value)
+            cpu_threads: Inference threads on CPU, 0 for the runtime default
+                (defaults to settings value)
+            orientation_prepass: Settle page orientation once (EXIF or a whole-page
+                classifier) and skip angle classification when it is known
+                (defaults to settings value)
+            document_crop: Crop photos to the detected page quadrilateral before
+                OCR (defaults to settings value)
+            grayscale: Convert images to grayscale before OCR (defaults to settings value)
+            
+        Raises:
+            ValueError: If the inference engine is not supported
         """
         self.language = language or settings.ocr_language
         self.use_angle_cls = use_angle_cls if use_angle_cls is not None else settings.ocr_use_angle_cls
         self.use_gpu = use_gpu if use_gpu is not None else settings.ocr_use_gpu
         self.det_limit_side_len = det_limit_side_len or settings.ocr_det_limit_side_len
         self.rec_batch_num = rec_batch_num or settings.ocr_rec_batch_num
+        self.tiling = tiling if tiling is not None else settings.ocr_tiling
+        self.tile_size = tile_size or settings.ocr_tile_size
+        self.tile_overlap = tile_overlap if tile_overlap is not None else settings.ocr_tile_overlap
+        self.refine = refine if refine is not None else settings.ocr_refine_low_confidence
+        self.refine_threshold = refine_threshold if refine_threshold is not None else settings.ocr_refine_threshold
+        self.cross_page_batching = (
+            cross_page_batching if cross_page_batching is not None else settings.ocr_cross_page_batching
+        )
+        self.rec_pool_size = settings.ocr_rec_pool_size
+        self.inference_engine = (inference_engine or settings.ocr_inference_engine).lower()
+        self.cpu_threads = cpu_threads if cpu_threads is not None else settings.ocr_cpu_threads
+        if self.inference_engine not in ("paddle", "onnxruntime"):
+            raise ValueError(f"Unsupported OCR inference engine: {self.inference_engine}")
+        self.orientation_prepass = (
+            orientation_prepass if orientation_prepass is not None else settings.ocr_orientation_prepass
+        )
+        self.document_crop = document_crop if document_crop is not None else settings.ocr_document_crop
+        self.grayscale = grayscale if grayscale is not None else settings.ocr_grayscale
+        # 방향 사전 판별 통계 (페이지 수, 판별 근거별 수, 회전/각도 분류 생략 수)
+        self.orientation_stats = {
+            "pages": 0, "exif": 0, "classifier": 0, "unknown": 0, "rotated": 0, "angle_cls_skipped": 0
+        }
         
-        self._ocr_engine: Optional[PaddleOCR] = None
-        logger.info(f"OCR Service initialized with language: {self.language}")
+        self._ocr_engine: Optional[Any] = None
+        self._text_recognizer: Any = None
+        self._text_detector: Any = None
+        self._orientation_classifier: Any = None
+        if backend is not None and not isinstance(backend, str):
+            # 이미 생성된 백엔드 인스턴스 주입
+            self._ocr_engine = backend
+            self.backend = type(backend).__name__
+        else:
+            self.backend = backend or settings.ocr_backend
+        logger.info(f"OCR Service initialized with language: {self.language}, backend: {self.backend}")
 
     @property
-    def ocr_engine(self) -> PaddleOCR:
-        """Lazy initialization of PaddleOCR engine."""
+    def ocr_engine(self) -> Any:
+        """Lazy initialization of the OCR engine (PaddleOCR or a pluggable backend)."""
+        if self._ocr_engine is None and self.backend != "paddle":
+            from .backends import create_ocr_backend, create_ocr_backend_from_settings
+
+            if self.backend == settings.ocr_backend:
+                self._ocr_engine = create_ocr_backend_from_settings(settings)
+            else:
+                self._ocr_engine = create_ocr_backend(self.backend)
         if self._ocr_engine is None:
+            # paddleocr/paddlex import 는 수백 ms~수 초 → 엔진이 실제로 필요할 때만
+            from paddleocr import PaddleOCR
+
             logger.info("Initializing PaddleOCR engine...")
             
             # 기본 파라미터만 사용 (호환성을 위해)
@@ -66,40 +157,231 @@ class OCRService:
             if self.use_gpu:
                 optional_params["use_gpu"] = True
             
-            # PaddleOCR 초기화 (점진적으로 파라미터 제거하면서 시도)
-            initialization_attempts = [
-                {**base_params, **optional_params},  # 모든 파라미터 포함
-                {**base_params, **{k: v for k, v in optional_params.items() if k != "show_log"}},  # show_log 제외
-                {**base_params, **{k: v for k, v in optional_params.items() if k not in ["show_log", "use_gpu"]}},  # show_log, use_gpu 제외
-                {**base_params, **{k: v for k, v in optional_params.items() if k not in ["show_log", "use_gpu", "rec_batch_num"]}},  # 더 많은 파라미터 제외
-                base_params,  # 기본 파라미터만
-            ]
+            # 추론 런타임 옵션(MKLDNN/스레드 수/ONNX 모델)은 PaddleOCR 3.x 전용
+            runtime_params = self._runtime_params()
+            if self.inference_engine == "onnxruntime":
+                runtime_params.update(self._onnx_model_dirs())
+                # ONNX 런타임은 선택 사항이 아니므로 축소 시도에서도 빼지 않음
+                required_params = runtime_params
+            else:
+                required_params = {}
             
-            last_error = None
-            for i, params in enumerate(initialization_attempts):
+            # 설치된 버전이 거부한 인자는 디스크 캐시에서 읽어 첫 시도부터 제외 (워커마다 반복되는 재시도 방지)
+            full_params = {**base_params, **optional_params, **runtime_params}
+            version = paddleocr_version()
+            rejected = load_rejected_params(settings.ocr_init_cache_file, version) or set()
+            params = {k: v for k, v in full_params.items() if k not in rejected}
+            
+            # PaddleOCR 초기화 (거부된 인자만 하나씩 빼면서 재시도)
+            reported = set()
+            for attempt in range(1, len(full_params) + 2):
                 try:
                     self._ocr_engine = PaddleOCR(**params)
-                    if i > 0:
-                        logger.warning(f"PaddleOCR initialized with reduced parameters (attempt {i+1})")
-                    else:
-                        logger.info("PaddleOCR engine initialized successfully with all parameters")
                     break
                 except Exception as e:
-                    last_error = e
-                    error_msg = str(e).lower()
-                    if "unknown argument" in error_msg:
-                        logger.warning(f"Attempt {i+1} failed: {e}")
-                        continue
-                    else:
+                    name = _unknown_argument(e)
+                    if name is None:
                         # 다른 종류의 오류는 즉시 중단
                         logger.error(f"PaddleOCR initialization failed: {e}")
                         raise
+                    if name not in params or name in base_params or name in required_params:
+                        logger.error(f"PaddleOCR rejected a required argument: {e}")
+                        raise RuntimeError(f"PaddleOCR initialization failed: {e}") from e
+                    logger.warning(f"Attempt {attempt} failed: {e}")
+                    reported.add(name)
+                    params = {k: v for k, v in params.items() if k != name}
+            
+            # 실제로 거부된 인자 이름만 캐시에 기록
+            if reported - rejected:
+                save_rejected_params(settings.ocr_init_cache_file, version, rejected | reported)
+            if reported:
+                logger.warning(f"PaddleOCR initialized without rejected parameters: {sorted(reported)}")
+            elif rejected:
+                logger.info(f"PaddleOCR initialized with cached parameter set (without: {sorted(rejected)})")
             else:
-                # 모든 시도가 실패한 경우
-                logger.error(f"Failed to initialize PaddleOCR after all attempts. Last error: {last_error}")
-                raise RuntimeError(f"PaddleOCR initialization failed: {last_error}")
+                logger.info(
+                    f"PaddleOCR engine initialized successfully with all parameters "
+                    f"(inference engine: {self.inference_engine}, cpu threads: {self.cpu_threads or 'default'})"
+                )
         return self._ocr_engine
 
+    def _runtime_params(self) -> Dict[str, Any]:
+        """Get PaddleOCR 3.x inference runtime options (shared by all models)."""
+        if self.inference_engine == "onnxruntime":
+            return {
+                "engine": "onnxruntime",
+                "engine_config": {"intra_op_num_threads": self.cpu_threads} if self.cpu_threads else {},
+            }
+        params = {"enable_mkldnn": settings.ocr_enable_mkldnn}
+        if self.cpu_threads:
+            params["cpu_threads"] = self.cpu_threads
+        return params
+
+    def _onnx_model_dirs(self) -> Dict[str, str]:
+        """Get the exported ONNX model directories for ONNX Runtime inference.
+        
+        Raises:
+            FileNotFoundError: If an exported model directory is missing
+        """
+        suffix = "_int8" if settings.ocr_onnx_int8 else ""
+        model_dir = Path(settings.ocr_onnx_model_dir)
+        model_dirs = {
+            "text_detection_model_dir": model_dir / f"det{suffix}",
+            "text_recognition_model_dir": model_dir / f"rec{suffix}",
+        }
+        if self.use_angle_cls:
+            model_dirs["textline_orientation_model_dir"] = model_dir / f"cls{suffix}"
+        for path in model_dirs.values():
+            if not path.is_dir():
+                raise FileNotFoundError(f"ONNX model directory not found: {path} (see OCR_ONNX_MODEL_DIR)")
+        return {name: str(path) for name, path in model_dirs.items()}
+
+    @property
+    def text_recognizer(self) -> Optional[Recognizer]:
+        """Batch line recognizer for the refinement pass (None if the backend has none).
+        
+        Backends provide it as ``recognize(crops)`` returning ``(text, confidence)``
+        pairs; for PaddleOCR a recognition-only model is loaded on first use.
+        """
+        if self._text_recognizer is None:
+            engine = self.ocr_engine
+            if hasattr(engine, 'recognize'):
+                self._text_recognizer = engine.recognize
+            elif self.backend == "paddle":
+                self._text_recognizer = self._create_paddle_recognizer(engine)
+            else:
+                logger.info(f"OCR backend {self.backend} has no recognizer, low-confidence refinement disabled")
+                self._text_recognizer = False
+        return self._text_recognizer or None
+
+    def _create_paddle_recognizer(self, engine: Any) -> Recognizer:
+        """Create a recognition-only callable using the same model as the PaddleOCR engine."""
+        params = getattr(engine, '_params', None) or {}
+        if params.get("text_recognition_model_name") or params.get("text_recognition_model_dir"):
+            # PaddleOCR 3.x: 파이프라인과 같은 인식 모델을 단독으로 로드해 배치 인식
+            from paddleocr import TextRecognition
+
+            model = TextRecognition(
+                model_name=params.get("text_recognition_model_name"),
+                model_dir=params.get("text_recognition_model_dir"),
+                **self._runtime_params(),
+            )
+
+            def recognize(crops: List[np.ndarray]) -> List[Tuple[str, float]]:
+                # 호출자가 배치 크기를 정함 (rec_pool_size 단위로 나눠서 호출)
+                results = model.predict(crops, batch_size=len(crops))
+                return [(r["rec_text"], r["rec_score"]) for r in results]
+        else:
+            # PaddleOCR 2.x: det=False 로 검출 없이 인식만 수행
+            def recognize(crops: List[np.ndarray]) -> List[Tuple[str, float]]:
+                return [tuple(engine.ocr(crop, det=False, cls=False)[0][0]) for crop in crops]
+        return recognize
+
+    @property
+    def text_detector(self) -> Optional[Any]:
+        """Batch line detector for cross-page batching (None if the backend has none).
+        
+        Backends provide it as ``detect(images)`` returning the box polygons
+        of every image; for PaddleOCR a detection-only model is loaded on first use.
+        """
+        if self._text_detector is None:
+            engine = self.ocr_engine
+            params = getattr(engine, '_params', None) or {}
+            if hasattr(engine, 'detect'):
+                self._text_detector = engine.detect
+            elif self.backend == "paddle" and (
+                params.get("text_detection_model_name") or params.get("text_detection_model_dir")
+            ):
+                from paddleocr import TextDetection
+
+                model = TextDetection(
+                    model_name=params.get("text_detection_model_name"),
+                    model_dir=params.get("text_detection_model_dir"),
+                    limit_side_len=self.det_limit_side_len,
+                    **self._runtime_params(),
+                )
+
+                def detect(images: List[np.ndarray]) -> List[List[Any]]:
+                    return [list(r["dt_polys"]) for r in model.predict(images)]
+
+                self._text_detector = detect
+            else:
+                logger.info(f"OCR backend {self.backend} has no detector, cross-page batching disabled")
+                self._text_detector = False
+        return self._text_detector or None
+
+    @property
+    def orientation_classifier(self) -> Optional[OrientationClassifier]:
+        """Whole-page 0/90/180/270 classifier for the orientation pre-pass (None if unavailable).
+        
+        Backends provide it as ``classify_orientation(images)`` returning
+        ``(rotation, confidence)`` pairs; for PaddleOCR the document orientation
+        model is loaded on first use.
+        """
+        if self._orientation_classifier is None:
+            engine = self.ocr_engine
+            if hasattr(engine, 'classify_orientation'):
+                self._orientation_classifier = engine.classify_orientation
+            elif self.backend == "paddle" and getattr(engine, '_params', None) is not None:
+                # PaddleOCR 3.x 의 문서 방향 분류 모델 (페이지당 한 번, 작은 썸네일로 실행)
+                from paddleocr import DocImgOrientationClassification
+
+                model = DocImgOrientationClassification(**self._runtime_params())
+
+                def classify(images: List[np.ndarray]) -> List[Tuple[int, float]]:
+                    return [(int(r["label_names"][0]), float(r["scores"][0])) for r in model.predict(images)]
+
+                self._orientation_classifier = classify
+            else:
+                logger.info(f"OCR backend {self.backend} has no page orientation classifier, EXIF only")
+                self._orientation_classifier = False
+        return self._orientation_classifier or None
+
+    def _orient_page(self, image_path: Path, image: np.ndarray) -> Tuple[np.ndarray, Optional[Dict[str, Any]]]:
+        """Run the orientation pre-pass and rotate the page upright.
+        
+        Args:
+            image_path: Image file (for the EXIF tag)
+            image: Decoded page
+            
+        Returns:
+            (upright image, orientation info) or (image, None) if the pre-pass is off
+        """
+        if not self.orientation_prepass or not self._array_input_supported():
+            return image, None
+        with span("ocr.orientation", backend=self.backend) as sp:
+            try:
+                orientation = detect_orientation(
+                    image_path, image, self.orientation_classifier, settings.ocr_orientation_min_confidence
+                )
+            except Exception as e:
+                logger.warning(f"Orientation pre-pass failed for {image_path}: {e}")
+                orientation = {"source": "unknown", "rotation": 0, "confidence": 0.0, "known": False}
+            sp.set(**orientation)
+        
+        stats = self.orientation_stats
+        stats["pages"] += 1
+        stats[orientation["source"] if orientation["known"] else "unknown"] += 1
+        stats["rotated"] += bool(orientation["rotation"])
+        stats["angle_cls_skipped"] += orientation["known"]
+        logger.info(
+            f"Orientation of {image_path.name}: {orientation['source']}, rotation {orientation['rotation']}, "
+            f"angle classification {'skipped' if orientation['known'] else 'kept'} "
+            f"({stats['angle_cls_skipped']}/{stats['pages']} pages skipped so far)"
+        )
+        return rotate(image, orientation["rotation"]), orientation
+
+    def _predict_kwargs(self, orientation: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Get predict() options that turn off orientation classification for known pages."""
+        if orientation and orientation["known"] and self.backend == "paddle":
+            return {"use_doc_orientation_classify": False, "use_textline_orientation": False}
+        return {}
+
+    @property
+    def pools_recognition(self) -> bool:
+        """Check whether batch_extract_text pools recognition across images."""
+        return bool(self.cross_page_batching and self.text_detector and self.text_recognizer)
+
     def _validate_image_file(self, image_path: Union[str, Path]) -> Path:
         """Validate image file exists and has supported format.
         
@@ -125,14 +407,24 @@ class OCRService:
         
         return path
 
-    def _preprocess_image(self, image_path: Path) -> np.ndarray:
+    def _preprocess_image(
+        self, image_path: Path, keep_full_size: bool = False
+    ) -> Tuple[np.ndarray, Optional[Dict[str, Any]], Tuple[int, int], float]:
         """Preprocess image for OCR.
         
+        With document cropping the page quadrilateral is perspective-corrected
+        and cropped out of the full-resolution image before downscaling.
+        
         Args:
             image_path: Path to image file
+            keep_full_size: Skip downscaling of oversized images (tiled OCR)
             
         Returns:
-            Preprocessed image as numpy array
+            (preprocessed image, document crop info or None if not cropped,
+            file image size (width, height), downscale factor from the
+            (cropped) full-resolution page to the preprocessed image, 1.0 if
+            not downscaled). The crop info maps preprocessed-image pixels back
+            to the file.
             
         Raises:
             ValueError: If image cannot be loaded or is too large
@@ -142,11 +434,26 @@ class OCRService:
         if image is None:
             raise ValueError(f"Could not load image: {image_path}")
         
+        source_size = (image.shape[1], image.shape[0])
+        quad = matrix = None
+        if self.document_crop and self._array_input_supported():
+            with span("ocr.document_crop") as sp:
+                quad = find_document(image, min_area=settings.ocr_document_min_area)
+                if quad is not None:
+                    image, matrix = crop_document(image, quad)
+                    logger.info(
+                        f"Cropped document from {source_size[0]}x{source_size[1]} "
+                        f"to {image.shape[1]}x{image.shape[0]}"
+                    )
+                kept = image.shape[0] * image.shape[1] / (source_size[0] * source_size[1])
+                sp.set(found=quad is not None, pixels_kept=round(kept, 4))
+        
         # Check image size
         height, width = image.shape[:2]
         max_size = settings.max_image_size
+        downscale = 1.0
         
-        if max(height, width) > max_size:
+        if max(height, width) > max_size and not keep_full_size:
             # Resize image while maintaining aspect ratio
             if height > width:
                 new_height = max_size
@@ -157,8 +464,72 @@ class OCRService:
             
             image = cv2.resize(image, (new_width, new_height), interpolation=cv2.INTER_AREA)
             logger.info(f"Resized image from {width}x{height} to {new_width}x{new_height}")
+            # 긴 변은 정확히 max_size 가 되므로 그 비율을 사용 (짧은 변은 int 로 잘림)
+            downscale = max(height, width) / max_size
+            if matrix is not None:
+                matrix = matrix @ np.diag([width / new_width, height / new_height, 1.0])
+        
+        if self.grayscale and image.ndim == 3:
+            # 검출/인식 모델은 3채널 입력을 받으므로 회색조 3채널로 유지
+            image = cv2.cvtColor(cv2.cvtColor(image, cv2.COLOR_BGR2GRAY), cv2.COLOR_GRAY2BGR)
         
-        return image
+        if quad is None:
+            return image, None, source_size, downscale
+        return image, crop_info(quad, matrix, (image.shape[1], image.shape[0]), source_size), source_size, downscale
+
+    def _load_full_image(self, image_path: Path, document_crop: Optional[Dict[str, Any]], rotation: int) -> np.ndarray:
+        """Read an image at full resolution with the page crop and rotation of the first pass."""
+        image = cv2.imread(str(image_path))
+        if document_crop:
+            image, _ = crop_document(image, np.array(document_crop["quad"], dtype=np.float32))
+        return rotate(image, rotation)
+
+    def _result_size(
+        self,
+        image: np.ndarray,
+        document_crop: Optional[Dict[str, Any]],
+        source_size: Tuple[int, int],
+        rotation: int,
+    ) -> Tuple[int, int]:
+        """Get the image size (width, height) reported in OCRResult (the file's size if cropped or rotated)."""
+        if document_crop or rotation:
+            return tuple(source_size)
+        return (image.shape[1], image.shape[0])
+
+    def _to_source_frame(
+        self,
+        text_boxes: List[TextBox],
+        image: np.ndarray,
+        document_crop: Optional[Dict[str, Any]],
+        source_size: Tuple[int, int],
+        rotation: int,
+    ) -> List[TextBox]:
+        """Map boxes of a cropped or rotated page back to original file pixels.
+        
+        Args:
+            text_boxes: Boxes in pixels of the image fed to OCR
+            image: Image fed to OCR (after the orientation pre-pass)
+            document_crop: Document crop info from _preprocess_image, or None
+            source_size: File image size (width, height)
+            rotation: Rotation the orientation pre-pass applied after preprocessing
+            
+        Returns:
+            Boxes in original file pixels (unchanged if the page was neither
+            cropped nor rotated)
+        """
+        if document_crop:
+            width, height = document_crop["page_size"]
+            matrix = np.array(document_crop["matrix"]) @ unrotate_matrix(rotation, width, height)
+        elif rotation:
+            # 회전 해제 후 _preprocess_image 의 축소 배율만큼 되돌림
+            height, width = image.shape[:2]
+            if rotation in (90, 270):
+                width, height = height, width
+            scale = np.diag([source_size[0] / width, source_size[1] / height, 1.0])
+            matrix = scale @ unrotate_matrix(rotation, width, height)
+        else:
+            return text_boxes
+        return map_boxes(text_boxes, matrix, tuple(source_size))
 
     def _parse_ocr_results(self, raw_results: List, image_shape: Tuple[int, int]) -> List[TextBox]:
         """Parse raw PaddleOCR results into TextBox objects.
@@ -302,6 +673,129 @@ class OCRService:
         
         return text_boxes
 
+    def _parse_raw_results(self, raw_results: Any, image_shape: Tuple[int, int]) -> List[TextBox]:
+        """Parse raw engine output of a single image into TextBox objects.
+        
+        Args:
+            raw_results: Raw results from predict() or ocr()
+            image_shape: Image shape (height, width)
+            
+        Returns:
+            List of TextBox objects
+        """
+        # Parse results (다양한 결과 구조 처리)
+        if isinstance(raw_results, list) and len(raw_results) > 0:
+            first_result = raw_results[0]
+            if hasattr(first_result, 'get') or isinstance(first_result, dict):
+                # PaddleX 결과 구조 (딕셔너리 형태 또는 객체)
+                return self._parse_paddlex_results(first_result, image_shape)
+            # 기존 PaddleOCR 결과 구조
+            return self._parse_ocr_results(raw_results[0] or [], image_shape)
+        if isinstance(raw_results, dict):
+            # 단일 딕셔너리 PaddleX 결과
+            return self._parse_paddlex_results(raw_results, image_shape)
+        logger.warning("Unknown OCR result format")
+        return []
+
+    def _array_input_supported(self) -> bool:
+        """Check whether the backend accepts image arrays (cropped or rotated pages)."""
+        return getattr(self.ocr_engine, "supports_array_input", True)
+
+    def _tiling_enabled(self) -> bool:
+        """Check whether oversized images should be recognized in tiles."""
+        return self.tiling and getattr(self.ocr_engine, "supports_tiling", True)
+
+    def _extract_tiled(self, image: np.ndarray, orientation: Optional[Dict[str, Any]] = None) -> List[TextBox]:
+        """Run OCR on overlapping tiles of a full-size image and merge the boxes.
+        
+        All tiles are submitted to predict() in one call so the engine can batch
+        them; engines with only ocr() are called tile by tile.
+        
+        Args:
+            image: Full-resolution image
+            orientation: Orientation pre-pass result of the page
+            
+        Returns:
+            Merged text boxes in image coordinates
+        """
+        height, width = image.shape[:2]
+        tiles = plan_tiles(width, height, self.tile_size, self.tile_overlap)
+        crops = [tile.crop(image) for tile in tiles]
+        logger.info(
+            f"Tiled OCR: {width}x{height} image split into {len(tiles)} tiles "
+            f"({self.tile_size}px, overlap {self.tile_overlap}px)"
+        )
+        with span("ocr.predict_tiles", backend=self.backend, tiles=len(tiles)) as sp:
+            if hasattr(self.ocr_engine, 'predict'):
+                raw_per_tile = [[raw] for raw in self.ocr_engine.predict(crops, **self._predict_kwargs(orientation))]
+            else:
+                raw_per_tile = [self.ocr_engine.ocr(crop) for crop in crops]
+            if len(raw_per_tile) != len(tiles):
+                raise ValueError(f"OCR engine returned {len(raw_per_tile)} results for {len(tiles)} tiles")
+            tile_boxes = [
+                (tile, self._parse_raw_results(raw, crop.shape[:2]))
+                for tile, crop, raw in zip(tiles, crops, raw_per_tile)
+            ]
+            text_boxes = merge_tile_boxes(tile_boxes, (width, height))
+            sp.set(
+                boxes_raw=sum(len(boxes) for _, boxes in tile_boxes),
+                boxes_merged=len(text_boxes),
+            )
+        return text_boxes
+
+    def _refine_low_confidence(
+        self,
+        text_boxes: List[TextBox],
+        image_path: Path,
+        image: np.ndarray,
+        boxes_on_image: bool,
+        rotation: int = 0,
+        document_crop: Optional[Dict[str, Any]] = None,
+        downscale: float = 1.0,
+    ) -> List[TextBox]:
+        """Re-recognize low-confidence boxes from full-resolution crops.
+        
+        Args:
+            text_boxes: Boxes from the first pass
+            image_path: Original image file (read again if ``image`` was downscaled)
+            image: Image used for the first pass
+            boxes_on_image: Box coordinates are in ``image`` pixels (ocr() path)
+                rather than in original-file pixels (predict() path)
+            rotation: Rotation the orientation pre-pass applied to ``image``
+            document_crop: Document crop applied to ``image`` by _preprocess_image
+            downscale: Downscale factor applied to ``image`` by _preprocess_image
+            
+        Returns:
+            Text boxes with improved reads replaced; the first-pass boxes on failure
+        """
+        if not self.refine or all(box.confidence >= self.refine_threshold for box in text_boxes):
+            return text_boxes
+        try:
+            recognize = self.text_recognizer
+            if recognize is None:
+                return text_boxes
+            full_image = image
+            if downscale != 1.0:
+                # _preprocess_image 에서 축소됨 → 원본 해상도로 다시 읽음
+                full_image = self._load_full_image(image_path, document_crop, rotation)
+            scale = downscale if boxes_on_image else 1.0
+            with span("ocr.refine", backend=self.backend) as sp:
+                text_boxes, refined, improved = refine_boxes(
+                    full_image,
+                    text_boxes,
+                    lambda crops: recognize_batched(crops, recognize, self.rec_pool_size)[0],
+                    self.refine_threshold,
+                    scale=scale,
+                    padding=settings.ocr_refine_padding,
+                    target_height=settings.ocr_refine_target_height,
+                )
+                sp.set(boxes_refined=refined, boxes_improved=improved)
+            logger.info(f"Refinement: {improved}/{refined} low-confidence boxes improved")
+        except Exception as e:
+            logger.warning(f"Low-confidence refinement failed, keeping first-pass results: {e}")
+        return text_boxes
+
+    @traced("ocr.extract_text")
     def extract_text(self, image_path: Union[str, Path]) -> OCRResult:
         """Extract text from image using OCR.
         
@@ -319,25 +813,60 @@ class OCRService:
         
         # Validate and preprocess image
         validated_path = self._validate_image_file(image_path)
-        image = self._preprocess_image(validated_path)
+        tiling = self._tiling_enabled()
+        image, document_crop, source_size, downscale = self._preprocess_image(validated_path, keep_full_size=tiling)
+        image, orientation = self._orient_page(validated_path, image)
+        rotation = orientation["rotation"] if orientation else 0
         
         logger.info(f"Starting OCR extraction for: {validated_path}")
         
         try:
+            if tiling and max(image.shape[:2]) > settings.max_image_size:
+                text_boxes = self._extract_tiled(image, orientation)
+                text_boxes = self._refine_low_confidence(
+                    text_boxes, validated_path, image, boxes_on_image=True, rotation=rotation,
+                    document_crop=document_crop, downscale=downscale
+                )
+                processing_time = time.time() - start_time
+                result = OCRResult(
+                    text_boxes=self._to_source_frame(text_boxes, image, document_crop, source_size, rotation),
+                    processing_time=processing_time,
+                    image_size=self._result_size(image, document_crop, source_size, rotation),
+                    orientation=orientation,
+                    document_crop=document_crop
+                )
+                logger.info(
+                    f"Tiled OCR completed: {len(text_boxes)} text boxes found in {processing_time:.2f}s "
+                    f"(avg confidence: {result.average_confidence:.3f})"
+                )
+                return result
+            
             # Perform OCR (새로운 PaddleX 방식)
+            # 회전/크롭/회색조 변환한 페이지는 파일 대신 처리된 이미지를 넘김 (좌표는 image 기준이 됨)
+            boxes_on_image = bool(rotation or document_crop or (self.grayscale and self._array_input_supported()))
+            # 방향이 확정된 페이지는 각도 분류 생략 (PaddleOCR 2.x 는 cls=False)
+            ocr_kwargs = {"cls": False} if self._predict_kwargs(orientation) else {}
             try:
                 # PaddleX 3.x 방식
                 if hasattr(self.ocr_engine, 'predict'):
-                    raw_results = self.ocr_engine.predict(str(validated_path))
+                    with span("ocr.predict", backend=self.backend):
+                        raw_results = self.ocr_engine.predict(
+                            image if boxes_on_image else str(validated_path), **self._predict_kwargs(orientation)
+                        )
                     logger.debug("Using PaddleX predict method")
                 else:
                     # 기존 PaddleOCR 방식
-                    raw_results = self.ocr_engine.ocr(image)
+                    raw_results = self.ocr_engine.ocr(image, **ocr_kwargs)
+                    boxes_on_image = True
                     logger.debug("Using PaddleOCR ocr method")
             except Exception as e:
+                if not hasattr(self.ocr_engine, 'ocr'):
+                    # predict 전용 백엔드(replay 등)는 대체 경로 없음
+                    raise
                 logger.warning(f"First OCR method failed: {e}, trying alternative")
                 try:
-                    raw_results = self.ocr_engine.ocr(image)
+                    raw_results = self.ocr_engine.ocr(image, **ocr_kwargs)
+                    boxes_on_image = True
                 except Exception as e2:
                     logger.error(f"All OCR methods failed: {e2}")
                     raise
@@ -366,28 +895,19 @@ class OCRService:
             except Exception as debug_e:
                 logger.warning(f"Debug logging failed: {debug_e}")
             
-            # Parse results (다양한 결과 구조 처리)
-            if isinstance(raw_results, list) and len(raw_results) > 0:
-                first_result = raw_results[0]
-                if hasattr(first_result, 'get') or isinstance(first_result, dict):
-                    # PaddleX 결과 구조 (딕셔너리 형태 또는 객체)
-                    text_boxes = self._parse_paddlex_results(first_result, image.shape[:2])
-                else:
-                    # 기존 PaddleOCR 결과 구조
-                    text_boxes = self._parse_ocr_results(raw_results[0], image.shape[:2])
-            elif isinstance(raw_results, dict):
-                # 단일 딕셔너리 PaddleX 결과
-                text_boxes = self._parse_paddlex_results(raw_results, image.shape[:2])
-            else:
-                logger.warning("Unknown OCR result format")
-                text_boxes = []
+            text_boxes = self._parse_raw_results(raw_results, image.shape[:2])
+            text_boxes = self._refine_low_confidence(
+                text_boxes, validated_path, image, boxes_on_image, rotation, document_crop, downscale
+            )
             
             processing_time = time.time() - start_time
             
             result = OCRResult(
-                text_boxes=text_boxes,
+                text_boxes=self._to_source_frame(text_boxes, image, document_crop, source_size, rotation),
                 processing_time=processing_time,
-                image_size=(image.shape[1], image.shape[0])  # (width, height)
+                image_size=self._result_size(image, document_crop, source_size, rotation),  # (width, height)
+                orientation=orientation,
+                document_crop=document_crop
             )
             
             logger.info(
@@ -401,18 +921,104 @@ class OCRService:
             logger.error(f"OCR extraction failed for {validated_path}: {e}")
             raise ValueError(f"OCR extraction failed: {e}") from e
 
+    @traced("ocr.extract_text_batch")
+    def extract_text_batch(self, image_paths: List[Union[str, Path]]) -> List[Optional[OCRResult]]:
+        """Extract text from several images with recognition pooled across them.
+        
+        Detection runs image by image; the line crops of all images are then
+        recognized together in batches of ``rec_pool_size`` and routed back to
+        their image. Images that need tiled OCR go through extract_text.
+        Requires a backend with a detector and recognizer (see pools_recognition).
+        
+        Args:
+            image_paths: List of paths to image files
+            
+        Returns:
+            One OCRResult per image, None for images that failed. processing_time
+            is the batch time divided evenly across the images.
+        """
+        start_time = time.time()
+        results: List[Optional[OCRResult]] = [None] * len(image_paths)
+        tiling = self._tiling_enabled()
+        images = {}
+        for i, image_path in enumerate(image_paths):
+            try:
+                path = self._validate_image_file(image_path)
+                image, document_crop, source_size, downscale = self._preprocess_image(path, keep_full_size=tiling)
+                if tiling and max(image.shape[:2]) > settings.max_image_size:
+                    results[i] = self.extract_text(path)
+                else:
+                    images[i] = (path, *self._orient_page(path, image), document_crop, source_size, downscale)
+            except Exception as e:
+                logger.error(f"Failed to process {image_path}: {e}")
+        if not images:
+            return results
+        
+        try:
+            with span("ocr.detect_batch", backend=self.backend, images=len(images)):
+                polys_per_image = self.text_detector([image for _, image, *_ in images.values()])
+            
+            routes, crops = [], []
+            for i, polys in zip(images, polys_per_image):
+                for poly in polys:
+                    coordinates = [[int(point[0]), int(point[1])] for point in list(poly)[:4]]
+                    crop = line_crop(images[i][1], coordinates) if len(coordinates) == 4 else None
+                    if crop is not None:
+                        routes.append((i, coordinates))
+                        crops.append(crop)
+            
+            with span("ocr.recognize_pooled", backend=self.backend, crops=len(crops)) as sp:
+                reads, batches = recognize_batched(crops, self.text_recognizer, self.rec_pool_size)
+                sp.set(batches=batches)
+        except Exception as e:
+            logger.error(f"Pooled OCR failed for {len(images)} images: {e}")
+            return results
+        
+        text_boxes = {i: [] for i in images}
+        for (i, coordinates), (text, confidence) in zip(routes, reads):
+            if text.strip():
+                text_boxes[i].append(TextBox(coordinates=coordinates, text=text.strip(), confidence=confidence))
+        
+        processing_time = (time.time() - start_time) / len(images)
+        for i, (path, image, orientation, document_crop, source_size, downscale) in images.items():
+            rotation = orientation["rotation"] if orientation else 0
+            boxes = sorted(text_boxes[i], key=lambda box: (box.bbox[1], box.bbox[0]))
+            boxes = self._refine_low_confidence(
+                boxes, path, image, boxes_on_image=True, rotation=rotation, document_crop=document_crop,
+                downscale=downscale
+            )
+            results[i] = OCRResult(
+                text_boxes=self._to_source_frame(boxes, image, document_crop, source_size, rotation),
+                processing_time=processing_time,
+                image_size=self._result_size(image, document_crop, source_size, rotation),
+                orientation=orientation,
+                document_crop=document_crop
+            )
+        logger.info(
+            f"Pooled OCR completed: {len(images)} images, {len(crops)} lines "
+            f"in {batches} recognition batches ({time.time() - start_time:.2f}s)"
+        )
+        return results
+
     def batch_extract_text(self, image_paths: List[Union[str, Path]]) -> List[OCRResult]:
         """Extract text from multiple images.
         
+        With cross-page batching (see pools_recognition) recognition is pooled
+        across all images; images that fail there are retried one by one.
+        
         Args:
             image_paths: List of paths to image files
             
         Returns:
             List of OCRResult objects, one per image
         """
+        pooled = self.extract_text_batch(image_paths) if self.pools_recognition else [None] * len(image_paths)
         results = []
         
         for i, image_path in enumerate(image_paths, 1):
+            if pooled[i - 1] is not None:
+                results.append(pooled[i - 1])
+                continue
             try:
                 logger.info(f"Processing image {i}/{len(image_paths)}: {image_path}")
                 result = self.extract_text(image_path)
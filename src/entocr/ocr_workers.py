@@ -0,0 +1,305 @@
+"""Recycled OCR worker processes.
+
+A process that keeps a PaddleOCR engine loaded grows in RSS over a day of
+requests. With ``OCR_WORKERS`` set, files are OCR'd in spawned worker
+processes instead. Each worker handles one task at a time and is replaced
+after ``OCR_WORKER_MAX_PAGES`` pages or once its RSS exceeds
+``OCR_WORKER_MAX_RSS_MB``:
+
+* a worker is only replaced between tasks, so in-flight work always finishes,
+* the replacement is started before the old worker is stopped, so the model
+  load overlaps the shutdown,
+* recycle events, tasks, pages and worker RSS are exported through the
+  metrics registry (``/metrics``).
+
+Spans recorded inside a worker stay in that process; the calling process
+records one ``ocr.worker_task`` span per task.
+"""
+
+import multiprocessing
+import threading
+import time
+from typing import Any, Callable, List, Optional, Tuple
+
+from loguru import logger
+
+from config.settings import settings
+from src.utils.tracing import REGISTRY, peak_rss_bytes, span
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+# Task functions run in the worker and return (result, pages processed)
+Task = Callable[..., Tuple[Any, int]]
+
+
+def _rss_bytes() -> Optional[int]:
+    if PSUTIL_AVAILABLE:
+        return psutil.Process().memory_info().rss
+    # psutil 이 없으면 최대 RSS(high-water mark)로 대신 판단
+    return peak_rss_bytes()
+
+
+def _worker_main(conn: Any, initializer: Optional[Callable[[], None]]) -> None:
+    """Worker process loop: run tasks from the pipe until told to stop."""
+    if initializer is not None:
+        try:
+            initializer()
+        except Exception as e:
+            logger.warning(f"OCR worker initializer failed: {e}")
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            break
+        if task is None:
+            break
+        fn, args = task
+        try:
+            result, pages = fn(*args)
+            conn.send(("ok", result, pages, _rss_bytes()))
+        except Exception as e:
+            try:
+                conn.send(("error", e, 0, _rss_bytes()))
+            except Exception:
+                # 예외 객체를 pickle 할 수 없는 경우
+                conn.send(("error", RuntimeError(f"{type(e).__name__}: {e}"), 0, _rss_bytes()))
+    conn.close()
+
+
+class _Worker:
+    """A worker process and its usage since it was started."""
+
+    def __init__(self, slot: int, context: Any, initializer: Optional[Callable[[], None]]) -> None:
+        self.slot = slot
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main, args=(child_conn, initializer), name=f"ocr-worker-{slot}", daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.started = time.monotonic()
+        self.pages = 0
+        self.tasks = 0
+        self.rss: Optional[int] = None
+
+    def stop(self, timeout: float) -> None:
+        """Ask the worker to exit, and terminate it if it does not within the timeout."""
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            logger.warning(f"OCR worker {self.process.pid} did not exit in {timeout}s, terminating")
+            self.process.terminate()
+            self.process.join(5)
+        self.conn.close()
+
+
+class OCRWorkerPool:
+    """Pool of OCR worker processes recycled by page count and RSS."""
+
+    def __init__(
+        self,
+        workers: int,
+        max_pages: Optional[int] = None,
+        max_rss_mb: Optional[int] = None,
+        initializer: Optional[Callable[[], None]] = None,
+        stop_timeout: Optional[float] = None,
+    ) -> None:
+        """Start the worker processes.
+
+        Args:
+            workers: Number of worker processes
+            max_pages: Pages after which a worker is replaced, 0 for no limit
+                (defaults to settings value)
+            max_rss_mb: RSS in MB above which a worker is replaced, 0 for no limit
+                (defaults to settings value)
+            initializer: Picklable function run once in each new worker,
+                e.g. to load the OCR engine before the first task
+            stop_timeout: Seconds to wait for a worker to exit before terminating it
+                (defaults to settings value)
+
+        Raises:
+            ValueError: If workers is less than 1
+        """
+        if workers < 1:
+            raise ValueError(f"OCR worker pool needs at least one worker, got {workers}")
+        self.max_pages = max_pages if max_pages is not None else settings.ocr_worker_max_pages
+        max_rss_mb = max_rss_mb if max_rss_mb is not None else settings.ocr_worker_max_rss_mb
+        self.max_rss_bytes = max_rss_mb * 1024 * 1024
+        self.stop_timeout = stop_timeout or settings.ocr_worker_stop_timeout
+        self.initializer = initializer
+        # API 서버처럼 스레드가 있는 프로세스에서 fork 하지 않도록 spawn 사용
+        self._context = multiprocessing.get_context("spawn")
+        self._cond = threading.Condition()
+        self._closed = False
+        self._workers = [_Worker(slot, self._context, initializer) for slot in range(workers)]
+        self._idle: List[_Worker] = list(self._workers)
+        self.recycles = {"pages": 0, "rss": 0, "crashed": 0}
+        logger.info(
+            f"OCR worker pool started: {workers} workers, max {self.max_pages or 'unlimited'} pages, "
+            f"max RSS {f'{max_rss_mb}MB' if max_rss_mb else 'unlimited'}"
+        )
+
+    def _checkout(self) -> _Worker:
+        with self._cond:
+            self._cond.wait_for(lambda: self._idle or self._closed)
+            if self._closed:
+                raise RuntimeError("OCR worker pool is shut down")
+            return self._idle.pop()
+
+    def _checkin(self, worker: _Worker) -> None:
+        with self._cond:
+            self._idle.append(worker)
+            self._cond.notify_all()
+
+    def _recycle_reason(self, worker: _Worker) -> Optional[str]:
+        if self.max_pages and worker.pages >= self.max_pages:
+            return "pages"
+        if self.max_rss_bytes and worker.rss is not None and worker.rss >= self.max_rss_bytes:
+            return "rss"
+        return None
+
+    def _replace(self, worker: _Worker, reason: str) -> _Worker:
+        """Start a new worker in the slot of an idle (or dead) one and stop the old one."""
+        with span("ocr.worker_recycle", reason=reason, slot=worker.slot):
+            new_worker = _Worker(worker.slot, self._context, self.initializer)
+            with self._cond:
+                self._workers[self._workers.index(worker)] = new_worker
+                self.recycles[reason] += 1
+            worker.stop(self.stop_timeout)
+        REGISTRY.inc("ocr_worker_recycles_total", help="OCR worker processes replaced, by reason.", reason=reason)
+        logger.info(
+            f"Recycled OCR worker {worker.process.pid} -> {new_worker.process.pid} ({reason}): "
+            f"{worker.tasks} tasks, {worker.pages} pages, "
+            f"RSS {worker.rss / 1024 / 1024 if worker.rss else 0:.0f}MB, "
+            f"up {time.monotonic() - worker.started:.0f}s"
+        )
+        return new_worker
+
+    def run(self, fn: Task, *args: Any) -> Any:
+        """Run a task in a worker process and return its result.
+
+        Blocks until a worker is free. The worker is replaced after the task
+        if it reached the page or RSS limit.
+
+        Args:
+            fn: Picklable module-level function returning (result, pages)
+            *args: Picklable arguments of fn
+
+        Returns:
+            The result of fn
+
+        Raises:
+            RuntimeError: If the pool is shut down or the worker died during the task
+            Exception: Whatever fn raised in the worker
+        """
+        worker = self._checkout()
+        try:
+            with span("ocr.worker_task", slot=worker.slot, pid=worker.process.pid) as sp:
+                try:
+                    worker.conn.send((fn, args))
+                    status, payload, pages, rss = worker.conn.recv()
+                except (EOFError, OSError) as e:
+                    REGISTRY.inc("ocr_worker_tasks_total", help="Tasks run in OCR workers, by outcome.", outcome="crashed")
+                    worker.process.join(1)
+                    pid, exitcode = worker.process.pid, worker.process.exitcode
+                    if not self._closed:
+                        worker = self._replace(worker, "crashed")
+                    raise RuntimeError(f"OCR worker {pid} exited during the task (exit code {exitcode})") from e
+
+                worker.tasks += 1
+                worker.pages += pages
+                worker.rss = rss
+                sp.set(pages=pages, rss_bytes=rss, worker_pages=worker.pages)
+                REGISTRY.inc("ocr_worker_tasks_total", help="Tasks run in OCR workers, by outcome.", outcome=status)
+                REGISTRY.inc("ocr_worker_pages_total", pages, help="Pages processed in OCR workers.")
+                if rss is not None:
+                    REGISTRY.set_gauge("ocr_worker_rss_bytes", rss, help="RSS of OCR workers after their last task.",
+                                       slot=worker.slot)
+
+                reason = self._recycle_reason(worker)
+                # 종료 중(drain)에는 새 워커를 띄우지 않음
+                if reason and not self._closed:
+                    worker = self._replace(worker, reason)
+            if status == "error":
+                raise payload
+            return payload
+        finally:
+            self._checkin(worker)
+
+    def stats(self) -> dict:
+        """Get the current workers' usage and the recycle counts."""
+        with self._cond:
+            workers = list(self._workers)
+            idle = len(self._idle)
+        return {
+            "workers": [
+                {"slot": w.slot, "pid": w.process.pid, "tasks": w.tasks, "pages": w.pages, "rss_bytes": w.rss}
+                for w in workers
+            ],
+            "idle": idle,
+            "recycles": dict(self.recycles),
+        }
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """Stop accepting tasks, wait for in-flight tasks to finish and stop the workers.
+
+        Args:
+            timeout: Seconds to wait for in-flight tasks (None waits indefinitely);
+                workers still busy after that are terminated
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            drained = self._cond.wait_for(lambda: len(self._idle) == len(self._workers), timeout)
+            workers = list(self._workers)
+        if not drained:
+            logger.warning(f"OCR worker pool shutdown: {len(workers) - len(self._idle)} tasks still running")
+        for worker in workers:
+            worker.stop(self.stop_timeout)
+        logger.info(f"OCR worker pool stopped (recycles: {self.recycles})")
+
+
+def warm_ocr_engine() -> None:
+    """Load the OCR engine in a new worker before its first task."""
+    from .ocr_main import get_shared_extractor
+
+    get_shared_extractor().ocr_service.ocr_engine
+
+
+def ocr_file_task(image_path: str) -> Tuple[Any, int]:
+    """OCR a file in a worker (see ocr_main.ocr_image_and_save_json_by_extension)."""
+    from .ocr_main import ocr_image_and_save_json_by_extension
+
+    result = ocr_image_and_save_json_by_extension(image_path)
+    pages = result.get("total_pages", 1) if isinstance(result, dict) else 1
+    return result, pages
+
+
+_shared_pool: Optional[OCRWorkerPool] = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_ocr_worker_pool() -> OCRWorkerPool:
+    """Get the process-wide OCR worker pool (started on first use with OCR_WORKERS workers)."""
+    global _shared_pool
+    if _shared_pool is None:
+        with _shared_pool_lock:
+            if _shared_pool is None:
+                _shared_pool = OCRWorkerPool(settings.ocr_workers, initializer=warm_ocr_engine)
+    return _shared_pool
+
+
+def shutdown_ocr_worker_pool(timeout: Optional[float] = None) -> None:
+    """Drain and stop the process-wide OCR worker pool if it was started."""
+    global _shared_pool
+    with _shared_pool_lock:
+        pool, _shared_pool = _shared_pool, None
+    if pool is not None:
+        pool.shutdown(timeout)
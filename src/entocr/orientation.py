@@ -0,0 +1,106 @@
+"""Page orientation pre-pass.
+
+Most scans are upright, yet with ``use_angle_cls`` every text crop goes
+through the angle classifier (and PaddleOCR 3.x also runs its own page
+classifier). The pre-pass settles the orientation of the whole page once:
+
+* JPEGs with an EXIF orientation tag are already turned upright by the image
+  decoder, so their orientation is known (JPG uploads converted to PNG are
+  turned upright by the converter, which leaves the tag as 1),
+* otherwise a whole-page 0/90/180/270 classifier runs on a small thumbnail.
+
+When the orientation is known with enough confidence the page is rotated
+once and OCR runs without per-crop angle classification.
+
+Rotations are counterclockwise degrees that make the page upright (the
+convention of PaddleOCR's document orientation labels).
+"""
+
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import cv2
+import numpy as np
+from PIL import Image
+
+EXIF_ORIENTATION_TAG = 0x0112
+# cv2.imread 는 거울상을 포함한 8가지 EXIF 방향을 모두 적용해서 읽음
+_EXIF_ORIENTATIONS = range(1, 9)
+_CV2_ROTATIONS = {90: cv2.ROTATE_90_COUNTERCLOCKWISE, 180: cv2.ROTATE_180, 270: cv2.ROTATE_90_CLOCKWISE}
+
+# images -> [(rotation, confidence), ...] in the same order
+OrientationClassifier = Callable[[List[np.ndarray]], Sequence[Tuple[int, float]]]
+
+
+def exif_orientation(image_path: Union[str, Path]) -> Optional[int]:
+    """Get the EXIF orientation tag of an image file, or None if it has no usable tag."""
+    try:
+        with Image.open(image_path) as image:
+            value = image.getexif().get(EXIF_ORIENTATION_TAG)
+    except Exception:
+        return None
+    return value if value in _EXIF_ORIENTATIONS else None
+
+
+def rotate(image: np.ndarray, rotation: int) -> np.ndarray:
+    """Rotate an image counterclockwise by a multiple of 90 degrees."""
+    return cv2.rotate(image, _CV2_ROTATIONS[rotation]) if rotation else image
+
+
+def unrotate_matrix(rotation: int, width: int, height: int) -> np.ndarray:
+    """Get the 3x3 matrix mapping points of a rotated image back to the unrotated one.
+
+    Args:
+        rotation: Counterclockwise rotation that was applied (0, 90, 180 or 270)
+        width: Width of the image before rotation
+        height: Height of the image before rotation
+    """
+    return np.array({
+        0: [[1, 0, 0], [0, 1, 0]],
+        90: [[0, -1, width], [1, 0, 0]],
+        180: [[-1, 0, width], [0, -1, height]],
+        270: [[0, 1, 0], [-1, 0, height]],
+    }[rotation] + [[0, 0, 1]], dtype=np.float64)
+
+
+def thumbnail(image: np.ndarray, max_side: int = 448) -> np.ndarray:
+    """Downscale a page for the whole-page classifier."""
+    scale = max_side / max(image.shape[:2])
+    if scale >= 1:
+        return image
+    return cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+
+def detect_orientation(
+    image_path: Union[str, Path],
+    image: np.ndarray,
+    classify: Optional[OrientationClassifier],
+    min_confidence: float,
+) -> Dict[str, Any]:
+    """Settle the orientation of a page.
+
+    Args:
+        image_path: Image file (for the EXIF tag)
+        image: Decoded page (EXIF orientation already applied by the decoder)
+        classify: Whole-page classifier, or None if the backend has none
+        min_confidence: Minimum classifier score to trust its result
+
+    Returns:
+        Dict with ``source`` ("exif", "classifier" or "unknown"), ``rotation``
+        still to apply to ``image``, ``confidence`` and ``known``
+    """
+    tag = exif_orientation(image_path)
+    if tag is not None:
+        # cv2.imread 가 이미 EXIF 회전을 적용하므로 추가 회전은 없음
+        return {"source": "exif", "exif_orientation": tag, "rotation": 0, "confidence": 1.0, "known": True}
+    if classify is None:
+        return {"source": "unknown", "rotation": 0, "confidence": 0.0, "known": False}
+
+    [(rotation, confidence)] = classify([thumbnail(image)])
+    known = confidence >= min_confidence and rotation in (0, 90, 180, 270)
+    return {
+        "source": "classifier",
+        "rotation": int(rotation) if known else 0,
+        "confidence": round(float(confidence), 4),
+        "known": known,
+    }
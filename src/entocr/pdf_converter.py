@@ -4,29 +4,34 @@ This module provides functionality to convert PDF documents to PNG images
 that can be processed by the ImageDataExtractor.
 """
 
+import math
+import multiprocessing
+import os
 import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from importlib.util import find_spec
 from pathlib import Path
-from typing import List, Union, Optional, Tuple
+from typing import Iterator, List, Union, Optional, Sequence, Tuple
 import shutil
 
 from loguru import logger
 from PIL import Image
 
-try:
-    import fitz  # PyMuPDF
-    PYMUPDF_AVAILABLE = True
-except ImportError:
-    PYMUPDF_AVAILABLE = False
+from config.settings import settings
+from .pdf_render import iter_render_pages, render_pages
+
+# PyMuPDF/pdf2image are only located here and imported on first conversion,
+# so importing this module (and entocr) stays cheap.
+PYMUPDF_AVAILABLE = find_spec("fitz") is not None
+if not PYMUPDF_AVAILABLE:
     logger.warning("PyMuPDF not available. PDF conversion may be limited.")
 
-try:
-    from pdf2image import convert_from_path
-    PDF2IMAGE_AVAILABLE = True
-except ImportError:
-    PDF2IMAGE_AVAILABLE = False
+PDF2IMAGE_AVAILABLE = find_spec("pdf2image") is not None
+if not PDF2IMAGE_AVAILABLE:
     logger.warning("pdf2image not available. PDF conversion may be limited.")
 
 
+
 class PDFConverter:
     """Converts PDF documents to PNG images for OCR processing.
     
@@ -39,7 +44,9 @@ class PDFConverter:
         dpi: int = 300,
         output_format: str = "PNG",
         max_pages: Optional[int] = None,
-        temp_dir: Optional[Union[str, Path]] = None
+        temp_dir: Optional[Union[str, Path]] = None,
+        workers: Optional[int] = None,
+        grayscale: Optional[bool] = None
     ) -> None:
         """Initialize PDF converter.
         
@@ -48,19 +55,52 @@ class PDFConverter:
             output_format: Output image format (PNG, JPEG, etc.)
             max_pages: Maximum number of pages to convert (None for all)
             temp_dir: Temporary directory for intermediate files
+            workers: Render processes for large PDFs (defaults to settings value;
+                0 uses one per CPU core)
+            grayscale: Render single-channel images (defaults to settings value)
         """
         self.dpi = dpi
         self.output_format = output_format.upper()
         self.max_pages = max_pages
         self.temp_dir = Path(temp_dir) if temp_dir else None
+        self.workers = settings.pdf_render_workers if workers is None else workers
+        self.grayscale = settings.pdf_render_grayscale if grayscale is None else grayscale
         
         logger.info(f"PDFConverter initialized with DPI={dpi}, format={output_format}")
     
+    def _resolve_output_dir(self, output_dir: Optional[Union[str, Path]]) -> Path:
+        """Determine and create the output directory."""
+        if output_dir is None:
+            if self.temp_dir:
+                output_dir = self.temp_dir
+            else:
+                output_dir = Path(tempfile.mkdtemp(prefix="pdf_convert_"))
+        else:
+            output_dir = Path(output_dir)
+        
+        output_dir.mkdir(parents=True, exist_ok=True)
+        return output_dir
+
+    def _page_numbers(self, page_count: int, pages: Optional[Sequence[int]]) -> List[int]:
+        """Select 0-based page indices, honouring max_pages and a page selection."""
+        max_pages = min(page_count, self.max_pages) if self.max_pages else page_count
+        if pages is None:
+            return list(range(max_pages))
+        return sorted({p for p in pages if 0 <= p < max_pages})
+
+    def _worker_count(self, page_count: int) -> int:
+        """Number of render processes for a document of page_count pages."""
+        if page_count < settings.pdf_parallel_min_pages:
+            return 1
+        workers = self.workers or os.cpu_count() or 1
+        return max(1, min(workers, page_count))
+
     def convert_pdf_to_images(
         self,
         pdf_path: Union[str, Path],
         output_dir: Optional[Union[str, Path]] = None,
-        filename_prefix: str = "page"
+        filename_prefix: str = "page",
+        pages: Optional[Sequence[int]] = None
     ) -> List[Path]:
         """Convert PDF to PNG images.
         
@@ -68,9 +108,10 @@ class PDFConverter:
             pdf_path: Path to input PDF file
             output_dir: Directory to save converted images (None for temp dir)
             filename_prefix: Prefix for output filenames
+            pages: 0-based page indices to convert (None for all, up to max_pages)
             
         Returns:
-            List of paths to converted PNG files
+            List of paths to converted PNG files, in page order
             
         Raises:
             ValueError: If PDF file doesn't exist or conversion fails
@@ -80,41 +121,71 @@ class PDFConverter:
         if not pdf_path.exists():
             raise ValueError(f"PDF file not found: {pdf_path}")
         
-        # Determine output directory
-        if output_dir is None:
-            if self.temp_dir:
-                output_dir = self.temp_dir
-            else:
-                output_dir = Path(tempfile.mkdtemp(prefix="pdf_convert_"))
-        else:
-            output_dir = Path(output_dir)
-        
-        output_dir.mkdir(parents=True, exist_ok=True)
+        output_dir = self._resolve_output_dir(output_dir)
         
         logger.info(f"Converting PDF to images: {pdf_path} -> {output_dir}")
         
         # Try PyMuPDF first (faster and more reliable)
         if PYMUPDF_AVAILABLE:
             try:
-                return self._convert_with_pymupdf(pdf_path, output_dir, filename_prefix)
+                return self._convert_with_pymupdf(pdf_path, output_dir, filename_prefix, pages)
             except Exception as e:
                 logger.warning(f"PyMuPDF conversion failed: {e}. Trying pdf2image...")
         
         # Fall back to pdf2image
         if PDF2IMAGE_AVAILABLE:
             try:
-                return self._convert_with_pdf2image(pdf_path, output_dir, filename_prefix)
+                return self._convert_with_pdf2image(pdf_path, output_dir, filename_prefix, pages)
             except Exception as e:
                 logger.error(f"pdf2image conversion failed: {e}")
                 raise RuntimeError(f"PDF conversion failed with all available methods") from e
         
         raise RuntimeError("No PDF conversion libraries available. Install PyMuPDF or pdf2image.")
+
+    def iter_pdf_images(
+        self,
+        pdf_path: Union[str, Path],
+        output_dir: Optional[Union[str, Path]] = None,
+        filename_prefix: str = "page",
+        pages: Optional[Sequence[int]] = None
+    ) -> Iterator[Tuple[int, Path]]:
+        """Convert PDF pages and yield each image as soon as it is ready.
+        
+        Pages are yielded in page order, so OCR of the first pages can start
+        while later pages are still being rendered by the worker processes.
+        Unlike convert_pdf_to_images there is no fallback between libraries.
+        
+        Args:
+            pdf_path: Path to input PDF file
+            output_dir: Directory to save converted images (None for temp dir)
+            filename_prefix: Prefix for output filenames
+            pages: 0-based page indices to convert (None for all, up to max_pages)
+            
+        Yields:
+            (0-based page index, path to PNG file)
+            
+        Raises:
+            ValueError: If PDF file doesn't exist
+            RuntimeError: If no PDF conversion libraries are available
+        """
+        pdf_path = Path(pdf_path)
+        if not pdf_path.exists():
+            raise ValueError(f"PDF file not found: {pdf_path}")
+        output_dir = self._resolve_output_dir(output_dir)
+        
+        if PYMUPDF_AVAILABLE:
+            yield from self._iter_with_pymupdf(pdf_path, output_dir, filename_prefix, pages)
+        elif PDF2IMAGE_AVAILABLE:
+            yield from self._iter_with_pdf2image(pdf_path, output_dir, filename_prefix, pages)
+        else:
+            raise RuntimeError("No PDF conversion libraries available. Install PyMuPDF or pdf2image.")
     
     def _convert_with_pymupdf(
         self,
         pdf_path: Path,
         output_dir: Path,
-        filename_prefix: str
+        filename_prefix: str,
+        pages: Optional[Sequence[int]] = None
     ) -> List[Path]:
         """Convert PDF using PyMuPDF (fitz).
         
@@ -122,40 +193,66 @@ class PDFConverter:
             pdf_path: Path to PDF file
             output_dir: Output directory
             filename_prefix: Filename prefix
+            pages: 0-based page indices to convert (None for all)
             
         Returns:
             List of converted image paths
         """
-        image_paths = []
-        
-        with fitz.open(pdf_path) as doc:
-            page_count = len(doc)
-            max_pages = min(page_count, self.max_pages) if self.max_pages else page_count
-            
-            logger.info(f"Converting {max_pages} pages from PDF with PyMuPDF")
-            
-            for page_num in range(max_pages):
-                page = doc[page_num]
-                
-                # Create transformation matrix for DPI
-                mat = fitz.Matrix(self.dpi / 72, self.dpi / 72)
-                pix = page.get_pixmap(matrix=mat)
-                
-                # Save directly as PNG using PyMuPDF
-                output_path = output_dir / f"{filename_prefix}_{page_num + 1:03d}.png"
-                pix.save(str(output_path))
-                image_paths.append(output_path)
-                
-                logger.debug(f"Converted page {page_num + 1} -> {output_path}")
-        
+        image_paths = [path for _, path in self._iter_with_pymupdf(pdf_path, output_dir, filename_prefix, pages)]
         logger.info(f"PyMuPDF conversion completed: {len(image_paths)} images")
         return image_paths
+
+    def _iter_with_pymupdf(
+        self,
+        pdf_path: Path,
+        output_dir: Path,
+        filename_prefix: str,
+        pages: Optional[Sequence[int]] = None
+    ) -> Iterator[Tuple[int, Path]]:
+        """Render pages with PyMuPDF, in worker processes for large documents."""
+        import fitz  # PyMuPDF
+
+        with fitz.open(pdf_path) as doc:
+            page_nums = self._page_numbers(len(doc), pages)
+        workers = self._worker_count(len(page_nums))
+        
+        logger.info(
+            f"Converting {len(page_nums)} pages from PDF with PyMuPDF "
+            f"({workers} process{'es' if workers > 1 else ''}{', grayscale' if self.grayscale else ''})"
+        )
+        
+        if workers <= 1:
+            for page_num, path in iter_render_pages(
+                str(pdf_path), page_nums, self.dpi, self.grayscale, str(output_dir), filename_prefix
+            ):
+                yield page_num, Path(path)
+            return
+        
+        # 연속된 페이지 구간으로 나눠 프로세스마다 문서를 따로 열어 렌더링.
+        # 워커당 2개 이상 구간을 주어 부하를 고르게 하고, 앞 구간부터 순서대로 내보냄
+        chunk_size = max(1, math.ceil(len(page_nums) / (workers * 2)))
+        chunks = [page_nums[i:i + chunk_size] for i in range(0, len(page_nums), chunk_size)]
+        # API 서버처럼 스레드가 있는 프로세스에서 fork 하지 않도록 spawn 사용
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        try:
+            futures = [
+                pool.submit(
+                    render_pages, str(pdf_path), chunk, self.dpi, self.grayscale, str(output_dir), filename_prefix
+                )
+                for chunk in chunks
+            ]
+            for future in futures:
+                for page_num, path in future.result():
+                    yield page_num, Path(path)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
     
     def _convert_with_pdf2image(
         self,
         pdf_path: Path,
         output_dir: Path,
-        filename_prefix: str
+        filename_prefix: str,
+        pages: Optional[Sequence[int]] = None
     ) -> List[Path]:
         """Convert PDF using pdf2image.
         
@@ -163,30 +260,54 @@ class PDFConverter:
             pdf_path: Path to PDF file
             output_dir: Output directory
             filename_prefix: Filename prefix
+            pages: 0-based page indices to convert (None for all)
             
         Returns:
             List of converted image paths
         """
-        logger.info(f"Converting PDF with pdf2image at {self.dpi} DPI")
+        image_paths = [path for _, path in self._iter_with_pdf2image(pdf_path, output_dir, filename_prefix, pages)]
+        logger.info(f"pdf2image conversion completed: {len(image_paths)} images")
+        return image_paths
+
+    def _iter_with_pdf2image(
+        self,
+        pdf_path: Path,
+        output_dir: Path,
+        filename_prefix: str,
+        pages: Optional[Sequence[int]] = None
+    ) -> Iterator[Tuple[int, Path]]:
+        """Render pages with pdf2image one page per call.
+        
+        Each call runs its own pdftoppm process, so pages are rendered on a
+        thread pool, and only the pages in flight are held as PIL images.
+        """
+        from pdf2image import convert_from_path, pdfinfo_from_path
+
+        page_count = pdfinfo_from_path(str(pdf_path))["Pages"]
+        page_nums = self._page_numbers(page_count, pages)
+        workers = self._worker_count(len(page_nums))
         
-        # Convert PDF to images
-        images = convert_from_path(
-            pdf_path,
-            dpi=self.dpi,
-            fmt=self.output_format.lower(),
-            first_page=1,
-            last_page=self.max_pages
-        )
+        logger.info(f"Converting PDF with pdf2image at {self.dpi} DPI ({workers} workers)")
         
-        image_paths = []
-        for i, image in enumerate(images):
-            output_path = output_dir / f"{filename_prefix}_{i + 1:03d}.png"
+        def render(page_num: int) -> Path:
+            [image] = convert_from_path(
+                pdf_path,
+                dpi=self.dpi,
+                fmt=self.output_format.lower(),
+                first_page=page_num + 1,
+                last_page=page_num + 1,
+                grayscale=self.grayscale
+            )
+            output_path = output_dir / f"{filename_prefix}_{page_num + 1:03d}.png"
             image.save(output_path, self.output_format)
-            image_paths.append(output_path)
-            logger.debug(f"Converted page {i + 1} -> {output_path}")
+            image.close()
+            logger.debug(f"Converted page {page_num + 1} -> {output_path}")
+            return output_path
         
-        logger.info(f"pdf2image conversion completed: {len(image_paths)} images")
-        return image_paths
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # map 은 입력 순서대로 결과를 내보내고, 앞서 나가는 페이지는 최대 workers 장
+            for page_num, path in zip(page_nums, pool.map(render, page_nums)):
+                yield page_num, path
     
     def get_pdf_info(self, pdf_path: Union[str, Path]) -> dict:
         """Get information about PDF file.
@@ -216,6 +337,8 @@ class PDFConverter:
         
         if PYMUPDF_AVAILABLE:
             try:
+                import fitz  # PyMuPDF
+
                 with fitz.open(pdf_path) as doc:
                     info["pages"] = len(doc)
                     metadata = doc.metadata
@@ -262,7 +385,8 @@ def convert_pdf_to_png(
     pdf_path: Union[str, Path],
     output_dir: Optional[Union[str, Path]] = None,
     dpi: int = 300,
-    max_pages: Optional[int] = None
+    max_pages: Optional[int] = None,
+    pages: Optional[Sequence[int]] = None
 ) -> List[Path]:
     """Convenience function to convert PDF to PNG images.
     
@@ -271,12 +395,13 @@ def convert_pdf_to_png(
         output_dir: Directory to save converted images
         dpi: DPI resolution for images
         max_pages: Maximum number of pages to convert
+        pages: 0-based page indices to convert (None for all)
         
     Returns:
         List of paths to converted PNG files
     """
     converter = PDFConverter(dpi=dpi, max_pages=max_pages)
-    return converter.convert_pdf_to_images(pdf_path, output_dir)
+    return converter.convert_pdf_to_images(pdf_path, output_dir, pages=pages)
 
 
 def get_pdf_page_count(pdf_path: Union[str, Path]) -> int:
@@ -0,0 +1,50 @@
+"""PyMuPDF page rendering used by PDFConverter, in-process or in worker processes.
+
+Kept free of heavy imports (settings, logging, PIL) because every render
+worker process imports this module on start-up.
+"""
+
+from pathlib import Path
+from typing import Iterator, List, Sequence, Tuple
+
+
+def iter_render_pages(
+    pdf_path: str,
+    page_nums: Sequence[int],
+    dpi: int,
+    grayscale: bool,
+    output_dir: str,
+    filename_prefix: str
+) -> Iterator[Tuple[int, str]]:
+    """Render the given pages of a PDF to PNG files.
+    
+    Pixmaps are rendered without alpha (and in one channel when grayscale)
+    and released after each page, so memory stays at one page.
+    
+    Args:
+        pdf_path: Path to PDF file
+        page_nums: 0-based page indices, in output order
+        dpi: Render resolution
+        grayscale: Render single-channel images
+        output_dir: Output directory
+        filename_prefix: Filename prefix
+        
+    Yields:
+        (0-based page index, path to PNG file)
+    """
+    import fitz  # PyMuPDF
+
+    matrix = fitz.Matrix(dpi / 72, dpi / 72)
+    colorspace = fitz.csGRAY if grayscale else fitz.csRGB
+    with fitz.open(pdf_path) as doc:
+        for page_num in page_nums:
+            pix = doc[page_num].get_pixmap(matrix=matrix, colorspace=colorspace, alpha=False)
+            output_path = Path(output_dir) / f"{filename_prefix}_{page_num + 1:03d}.png"
+            pix.save(str(output_path))
+            del pix
+            yield page_num, str(output_path)
+
+
+def render_pages(*args) -> List[Tuple[int, str]]:
+    """Process-pool entry point: render a range of pages (see iter_render_pages)."""
+    return list(iter_render_pages(*args))
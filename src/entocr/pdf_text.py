@@ -0,0 +1,134 @@
+"""Text-layer extraction for born-digital PDFs.
+
+E-tax invoices and card statements are usually generated PDFs that already
+carry their text. For such pages the words are read directly with PyMuPDF
+and returned as the same line-level ``TextBox``/``OCRResult`` structure the
+OCR engine produces (confidence 1.0, pixel coordinates of the page rendered
+at ``dpi``), so rasterization and OCR are only needed for scanned pages.
+"""
+
+import time
+from pathlib import Path
+from typing import Any, List, Optional, Union
+
+from loguru import logger
+
+from config.settings import settings
+from .models import OCRResult, TextBox
+from .pdf_converter import PYMUPDF_AVAILABLE
+
+# A word gap wider than this many line heights starts a new box, so that
+# table cells sharing a PDF text line come out as separate boxes like OCR.
+WORD_GAP_RATIO = 1.0
+
+
+def has_text_layer(page: Any, min_chars: Optional[int] = None) -> bool:
+    """Check whether a PyMuPDF page carries a usable text layer.
+
+    Args:
+        page: PyMuPDF page
+        min_chars: Minimum number of non-whitespace characters
+            (defaults to settings.pdf_text_min_chars)
+
+    Returns:
+        True if the page text can replace OCR
+    """
+    min_chars = settings.pdf_text_min_chars if min_chars is None else min_chars
+    chars = [c for c in page.get_text("text") if not c.isspace()]
+    if len(chars) < max(1, min_chars):
+        return False
+    # 폰트 매핑이 깨진 PDF 는 U+FFFD 로 채워짐 → OCR 로 처리
+    return chars.count("\ufffd") / len(chars) < 0.05
+
+
+def page_text_boxes(page: Any, dpi: int = 300) -> List[TextBox]:
+    """Group the words of a page into line-level text boxes.
+
+    Args:
+        page: PyMuPDF page
+        dpi: Render DPI the coordinates are scaled to
+
+    Returns:
+        Text boxes in reading order, in pixels of the page rendered at dpi
+    """
+    import fitz  # PyMuPDF
+
+    to_pixels = page.rotation_matrix * fitz.Matrix(dpi / 72, dpi / 72)
+    lines = {}
+    for x0, y0, x1, y1, word, block_no, line_no, _ in page.get_text("words", sort=True):
+        if word.strip():
+            lines.setdefault((block_no, line_no), []).append((fitz.Rect(x0, y0, x1, y1), word))
+
+    text_boxes = []
+    for words in lines.values():
+        words.sort(key=lambda w: w[0].x0)
+        group = [words[0]]
+        for rect, word in words[1:]:
+            prev = group[-1][0]
+            if rect.x0 - prev.x1 > WORD_GAP_RATIO * max(prev.height, rect.height):
+                text_boxes.append(_line_box(group, to_pixels))
+                group = []
+            group.append((rect, word))
+        text_boxes.append(_line_box(group, to_pixels))
+
+    text_boxes.sort(key=lambda box: (box.bbox[1], box.bbox[0]))
+    return text_boxes
+
+
+def _line_box(words: List[Any], to_pixels: Any) -> TextBox:
+    rect = words[0][0]
+    for word_rect, _ in words[1:]:
+        rect = rect | word_rect
+    x0, y0, x1, y1 = (rect * to_pixels).irect
+    return TextBox(
+        coordinates=[[x0, y0], [x1, y0], [x1, y1], [x0, y1]],
+        text=" ".join(word for _, word in words),
+        confidence=1.0,
+    )
+
+
+def extract_text_layer(
+    pdf_path: Union[str, Path],
+    dpi: int = 300,
+    max_pages: Optional[int] = None,
+    min_chars: Optional[int] = None,
+) -> List[Optional[OCRResult]]:
+    """Read the text layer of every page of a PDF.
+
+    Args:
+        pdf_path: Path to PDF file
+        dpi: Render DPI the coordinates are scaled to
+        max_pages: Maximum number of pages to read (None for all)
+        min_chars: Minimum characters for a page to count as born-digital
+
+    Returns:
+        One entry per page: an OCRResult for born-digital pages, None for
+        pages that need OCR. Empty if the PDF cannot be read with PyMuPDF.
+    """
+    if not PYMUPDF_AVAILABLE:
+        return []
+    import fitz  # PyMuPDF
+
+    results: List[Optional[OCRResult]] = []
+    try:
+        with fitz.open(pdf_path) as doc:
+            page_count = min(len(doc), max_pages) if max_pages else len(doc)
+            for page_num in range(page_count):
+                start_time = time.time()
+                page = doc[page_num]
+                if not has_text_layer(page, min_chars):
+                    results.append(None)
+                    continue
+                size = (page.rect * fitz.Matrix(dpi / 72, dpi / 72)).irect
+                results.append(OCRResult(
+                    text_boxes=page_text_boxes(page, dpi),
+                    processing_time=time.time() - start_time,
+                    image_size=(size.width, size.height),
+                ))
+    except Exception as e:
+        logger.warning(f"Could not read PDF text layer of {pdf_path}: {e}")
+        return []
+
+    found = sum(r is not None for r in results)
+    logger.info(f"PDF text layer: {found}/{len(results)} pages born-digital in {pdf_path}")
+    return results
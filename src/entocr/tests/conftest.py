@@ -110,6 +110,7 @@ def mock_ocr_service(mock_ocr_result):
     service = Mock(spec=OCRService)
     service.extract_text.return_value = mock_ocr_result
     service.batch_extract_text.return_value = [mock_ocr_result]
+    service.pools_recognition = False
     
     return service
 
@@ -0,0 +1,66 @@
+"""Tests for adaptive PDF render resolution."""
+
+import cv2
+import pytest
+
+from config.settings import settings
+from src.entocr.adaptive import adaptive_dpi_steps
+from src.entocr.extractor import ImageDataExtractor
+from src.entocr.ocr_service import OCRService
+
+fitz = pytest.importorskip("fitz")
+
+
+class WidthSensitiveEngine:
+    """Fake engine that is only confident on images at least 400px wide."""
+
+    def __init__(self) -> None:
+        self.widths = []
+
+    def predict(self, image_path):
+        width = cv2.imread(str(image_path)).shape[1]
+        self.widths.append(width)
+        return [{
+            "rec_texts": ["Total 990,000"],
+            "rec_scores": [0.95 if width >= 400 else 0.5],
+            "rec_polys": [[[10, 10], [120, 10], [120, 30], [10, 30]]],
+        }]
+
+
+@pytest.fixture
+def scanned_pdf(tmp_path):
+    """A one-page 200x100pt PDF that only contains an image."""
+    path = tmp_path / "scan.pdf"
+    doc = fitz.open()
+    pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 400, 200), False)
+    pix.clear_with(230)
+    doc.new_page(width=200, height=100).insert_image(fitz.Rect(0, 0, 200, 100), pixmap=pix)
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+class TestAdaptiveDpi:
+    """Test cases for confidence-driven re-rendering."""
+
+    def test_dpi_steps(self, monkeypatch) -> None:
+        """Configured lower steps are tried before the target DPI."""
+        monkeypatch.setattr(settings, "pdf_adaptive_dpi_steps", "200, 100,400")
+        assert adaptive_dpi_steps(300, adaptive=True) == [100, 200, 300]
+        assert adaptive_dpi_steps(300, adaptive=False) == [300]
+
+    def test_low_confidence_page_is_rerendered(self, scanned_pdf, tmp_path, monkeypatch) -> None:
+        """OCR stops at the first DPI whose result passes the thresholds."""
+        monkeypatch.setattr(settings, "pdf_adaptive_dpi_steps", "100,150")
+        engine = WidthSensitiveEngine()
+        extractor = ImageDataExtractor(OCRService(backend=engine))
+
+        results = extractor.extract_from_pdf(scanned_pdf, output_dir=tmp_path, dpi=300, adaptive=True)
+
+        metadata = results["pages"][0]["extraction_result"]["extraction_metadata"]
+        assert engine.widths == [278, 417]
+        assert metadata["render_dpi"] == 150
+        assert [(a["dpi"], a["retry_reason"]) for a in metadata["dpi_attempts"]] == [
+            (100, "low_confidence"), (150, None)
+        ]
+        assert results["pdf_info"]["dpi_steps"] == [100, 150, 300]
@@ -0,0 +1,74 @@
+"""Tests for pluggable OCR backends and replay fault injection."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.entocr.backends import ReplayOCRBackend, create_ocr_backend
+from src.entocr.ocr_service import OCRService
+from src.utils.replay import LatencyModel, ReplayFaults, ReplayInjectedError
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+RECORDED_OCR = REPO_ROOT / "test" / "2. LLM" / "INPUT" / "HUNTRIX.json"
+RECORDED_IMAGE = REPO_ROOT / "test" / "1. OCR" / "INPUT" / "HUNTRIX.png"
+
+
+class TestReplayOCRBackend:
+    """Test cases for the replay OCR backend."""
+
+    def test_extract_text_replays_recording(self) -> None:
+        """OCRService with a replay backend returns the recorded text boxes."""
+        recorded = json.loads(RECORDED_OCR.read_text(encoding="utf-8"))
+        service = OCRService(backend=ReplayOCRBackend(RECORDED_OCR))
+
+        result = service.extract_text(RECORDED_IMAGE)
+
+        assert [b.text for b in result.text_boxes] == [
+            b["text"] for b in recorded["text_boxes"] if b["text"].strip()
+        ]
+
+    def test_backend_selected_by_name(self) -> None:
+        """A backend name creates the registered backend lazily."""
+        service = OCRService(backend="replay")
+        assert isinstance(service.ocr_engine, ReplayOCRBackend)
+        with pytest.raises(ValueError):
+            create_ocr_backend("missing")
+
+    def test_injected_errors_surface_as_ocr_failures(self) -> None:
+        """error_rate=1 fails every call and is counted in stats."""
+        backend = ReplayOCRBackend(RECORDED_OCR, error_rate=1.0, seed=0)
+        service = OCRService(backend=backend)
+
+        with pytest.raises(ValueError, match="Injected replay failure"):
+            service.extract_text(RECORDED_IMAGE)
+        assert backend.stats()["errors"] == 1
+
+
+class TestReplayFaults:
+    """Test cases for latency and error injection."""
+
+    def test_latency_spec_parsing(self) -> None:
+        """Latency specs parse into distributions."""
+        assert repr(LatencyModel.parse("0.2")) == "fixed:0.2"
+        assert LatencyModel.parse("uniform:0.1,0.3").kind == "uniform"
+        with pytest.raises(ValueError):
+            LatencyModel.parse("normal:1")
+
+    def test_seeded_faults_are_reproducible(self) -> None:
+        """The same seed yields the same delays and failures."""
+        def run(seed):
+            delays, outcomes = [], []
+            faults = ReplayFaults("lognormal:-2,0.5", error_rate=0.3, seed=seed, sleep=delays.append)
+            for _ in range(50):
+                try:
+                    faults.apply()
+                    outcomes.append(True)
+                except ReplayInjectedError:
+                    outcomes.append(False)
+            return delays, outcomes
+
+        assert run(7) == run(7)
+        delays, outcomes = run(7)
+        assert 0 < outcomes.count(False) < 50
+        assert all(d >= 0 for d in delays)
@@ -0,0 +1,81 @@
+"""Tests for recognition batching across pages."""
+
+import cv2
+import numpy as np
+import pytest
+
+from src.entocr.extractor import ImageDataExtractor
+from src.entocr.ocr_service import OCRService
+
+
+class PooledEngine:
+    """Fake engine that detects filled rectangles and "reads" their gray level."""
+
+    def __init__(self) -> None:
+        self.detect_calls = 0
+        self.recognize_batches = []
+
+    def predict(self, image_path):
+        raise AssertionError("pooled OCR must not run the full pipeline")
+
+    def detect(self, images):
+        self.detect_calls += 1
+        polys = []
+        for image in images:
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            contours, _ = cv2.findContours((gray < 200).astype(np.uint8), cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+            boxes = [cv2.boundingRect(c) for c in contours]
+            polys.append([np.array([[x, y], [x + w, y], [x + w, y + h], [x, y + h]]) for x, y, w, h in boxes])
+        return polys
+
+    def recognize(self, crops):
+        self.recognize_batches.append(len(crops))
+        return [(f"line{int(round(crop.mean()))}", 0.9) for crop in crops]
+
+
+@pytest.fixture
+def receipts(tmp_path):
+    """Three receipts with 2, 3 and 1 lines; the gray level encodes page and line."""
+    paths = []
+    for page, lines in enumerate([2, 3, 1]):
+        image = np.full((200, 300, 3), 255, dtype=np.uint8)
+        for line in range(lines):
+            y = 20 + line * 50
+            image[y:y + 20, 20:20 + 60 * (line + 1)] = 10 + 40 * page + 10 * line
+        path = tmp_path / f"receipt_{page}.png"
+        cv2.imwrite(str(path), image)
+        paths.append(path)
+    return paths
+
+
+class TestCrossPageBatching:
+    """Test cases for pooled recognition in OCRService."""
+
+    def test_lines_of_all_pages_share_batches(self, receipts, monkeypatch) -> None:
+        """Recognition crops are pooled across images and routed back to their page and box."""
+        engine = PooledEngine()
+        service = OCRService(backend=engine, cross_page_batching=True)
+        monkeypatch.setattr(service, "rec_pool_size", 4)
+
+        results = service.batch_extract_text(receipts)
+
+        assert engine.recognize_batches == [4, 2]
+        assert [[box.text for box in r.text_boxes] for r in results] == [
+            ["line10", "line20"], ["line50", "line60", "line70"], ["line90"]
+        ]
+        assert results[1].text_boxes[2].bbox == (20, 120, 200, 140)
+
+    def test_extractor_uses_pooled_results(self, receipts) -> None:
+        """The extractor OCRs a batch once and builds each result from the pooled reads."""
+        engine = PooledEngine()
+        extractor = ImageDataExtractor(OCRService(backend=engine, cross_page_batching=True))
+
+        results = [extractor.extract_from_image(path, ocr_result=r) for path, r in zip(receipts, extractor.ocr_batch(receipts))]
+
+        assert engine.detect_calls == 1 and engine.recognize_batches == [6]
+        assert results[2].structured_data["raw_text_lines"] == ["line90"]
+
+    def test_disabled_without_detector(self) -> None:
+        """Backends without detect/recognize keep per-image OCR."""
+        service = OCRService(backend=object(), cross_page_batching=True)
+        assert not service.pools_recognition
@@ -0,0 +1,105 @@
+"""Tests for document boundary detection and cropping."""
+
+import json
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from src.entocr.backends import ReplayOCRBackend
+from src.entocr.document import find_document
+from src.entocr.ocr_service import OCRService
+
+RECORDED_OCR = Path(__file__).resolve().parents[3] / "test" / "2. LLM" / "INPUT" / "HUNTRIX.json"
+
+# 어두운 책상 위에 살짝 기울어진 영수증 (원본 사진 좌표, TL, TR, BR, BL)
+PAGE = np.array([[420, 180], [880, 210], [850, 1020], [390, 990]], dtype=np.float32)
+
+
+def _photo(path=None):
+    photo = np.full((1200, 1300, 3), (60, 70, 80), dtype=np.uint8)
+    cv2.fillConvexPoly(photo, PAGE.astype(np.int32), (245, 245, 245))
+    for y in range(300, 900, 60):
+        cv2.line(photo, (470, y), (780, y + 20), (20, 20, 20), 6)
+    if path is not None:
+        cv2.imwrite(str(path), photo)
+    return photo
+
+
+class RecordingEngine:
+    """Fake engine that records its input and reports one box around the whole input."""
+
+    def __init__(self) -> None:
+        self.inputs = []
+
+    def predict(self, image, **kwargs):
+        self.inputs.append(image)
+        height, width = image.shape[:2]
+        return [{"rec_texts": ["page"], "rec_scores": [0.9],
+                 "rec_polys": [[[0, 0], [width, 0], [width, height], [0, height]]]}]
+
+
+class TestDocumentCrop:
+    """Test cases for cropping photos to the document before OCR."""
+
+    def test_find_document(self) -> None:
+        """The page corners are found in TL, TR, BR, BL order."""
+        quad = find_document(_photo())
+
+        assert quad is not None
+        assert np.abs(quad - PAGE).max() < 8
+
+    def test_no_document(self) -> None:
+        """A scan without background is left alone."""
+        scan = np.full((800, 600, 3), 245, dtype=np.uint8)
+        cv2.line(scan, (50, 100), (500, 100), (0, 0, 0), 4)
+
+        assert find_document(scan) is None
+
+    def test_boxes_map_back_to_photo(self, tmp_path) -> None:
+        """Only the page is OCR'd and box coordinates come back in photo pixels."""
+        path = tmp_path / "photo.png"
+        _photo(path)
+        engine = RecordingEngine()
+        service = OCRService(backend=engine, document_crop=True, grayscale=True)
+
+        result = service.extract_text(path)
+
+        [page] = engine.inputs
+        assert page.shape[0] * page.shape[1] < 0.3 * 1200 * 1300
+        assert (page[..., 0] == page[..., 2]).all()
+        assert result.image_size == (1300, 1200)
+        assert result.document_crop["page_size"] == [page.shape[1], page.shape[0]]
+        [box] = result.text_boxes
+        assert np.abs(np.array(box.coordinates) - PAGE).max() < 10
+
+    def test_grayscale_without_crop_feeds_the_array(self, tmp_path) -> None:
+        """Grayscale conversion alone also sends the preprocessed page instead of the file."""
+        path = tmp_path / "photo.png"
+        _photo(path)
+        engine = RecordingEngine()
+        service = OCRService(backend=engine, document_crop=False, grayscale=True)
+
+        result = service.extract_text(path)
+
+        [page] = engine.inputs
+        assert isinstance(page, np.ndarray) and page.shape == (1200, 1300, 3)
+        assert (page[..., 0] == page[..., 1]).all() and (page[..., 0] == page[..., 2]).all()
+        [box] = result.text_boxes
+        assert box.coordinates == [[0, 0], [1300, 0], [1300, 1200], [0, 1200]]
+
+    def test_path_only_backend_is_not_cropped(self, tmp_path) -> None:
+        """Backends that take file paths only get the file, and their boxes are kept as recorded."""
+        recorded = json.loads(RECORDED_OCR.read_text(encoding="utf-8"))
+        path = tmp_path / "HUNTRIX.png"
+        _photo(path)
+        service = OCRService(
+            backend=ReplayOCRBackend(RECORDED_OCR), document_crop=True, orientation_prepass=True
+        )
+
+        result = service.extract_text(path)
+
+        assert result.document_crop is None and result.orientation is None
+        assert [b.coordinates for b in result.text_boxes] == [
+            b["coordinates"] for b in recorded["text_boxes"] if b["text"].strip()
+        ]
@@ -0,0 +1,102 @@
+"""Tests for recycled OCR worker processes."""
+
+import os
+import threading
+import time
+
+import pytest
+
+from src.entocr.ocr_workers import OCRWorkerPool
+
+
+# 워커 프로세스에서 실행되는 작업 (spawn 이므로 모듈 수준 함수여야 함)
+def pid_task(pages: int):
+    return os.getpid(), pages
+
+
+def failing_task():
+    raise ValueError("unreadable image")
+
+
+def crashing_task():
+    os._exit(3)
+
+
+def slow_task(seconds: float):
+    time.sleep(seconds)
+    return "done", 1
+
+
+@pytest.fixture
+def make_pool():
+    pools = []
+
+    def make(**kwargs):
+        kwargs.setdefault("max_pages", 0)
+        kwargs.setdefault("max_rss_mb", 0)
+        pool = OCRWorkerPool(1, **kwargs)
+        pools.append(pool)
+        return pool
+
+    yield make
+    for pool in pools:
+        pool.shutdown(timeout=10)
+
+
+class TestOCRWorkerPool:
+    """Test cases for OCRWorkerPool."""
+
+    def test_recycle_after_max_pages(self, make_pool) -> None:
+        """A worker is replaced once it has processed max_pages pages."""
+        pool = make_pool(max_pages=3)
+
+        pids = [pool.run(pid_task, 2) for _ in range(3)]
+
+        assert pids[0] == pids[1] != pids[2]
+        assert pool.recycles["pages"] == 1
+        assert pool.stats()["workers"][0]["pages"] == 2
+
+    def test_recycle_above_max_rss(self, make_pool) -> None:
+        """A worker above the RSS limit is replaced after every task."""
+        pool = make_pool(max_rss_mb=1)
+
+        pids = [pool.run(pid_task, 1) for _ in range(2)]
+
+        assert pids[0] != pids[1]
+        assert pool.recycles["rss"] == 2
+
+    def test_task_error_keeps_worker(self, make_pool) -> None:
+        """Exceptions are raised in the caller and the worker stays in use."""
+        pool = make_pool()
+        pid = pool.run(pid_task, 1)
+
+        with pytest.raises(ValueError, match="unreadable image"):
+            pool.run(failing_task)
+
+        assert pool.run(pid_task, 1) == pid
+
+    def test_crashed_worker_is_replaced(self, make_pool) -> None:
+        """A worker that dies during a task is replaced."""
+        pool = make_pool()
+
+        with pytest.raises(RuntimeError, match="exit code 3"):
+            pool.run(crashing_task)
+
+        assert pool.run(pid_task, 1) != 0
+        assert pool.recycles["crashed"] == 1
+
+    def test_shutdown_drains_in_flight_task(self, make_pool) -> None:
+        """Shutdown waits for running tasks and then rejects new ones."""
+        pool = make_pool()
+        pool.run(pid_task, 1)  # 워커 기동 완료 대기
+        results = []
+        runner = threading.Thread(target=lambda: results.append(pool.run(slow_task, 0.5)))
+        runner.start()
+        time.sleep(0.1)
+
+        pool.shutdown()
+        runner.join()
+
+        assert results == ["done"]
+        with pytest.raises(RuntimeError, match="shut down"):
+            pool.run(pid_task, 1)
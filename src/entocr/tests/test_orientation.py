@@ -0,0 +1,143 @@
+"""Tests for the page orientation pre-pass."""
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from config.settings import settings
+from src.entocr import ocr_main
+from src.entocr.extractor import ImageDataExtractor
+from src.entocr.ocr_service import OCRService
+
+
+class OrientationAwareEngine:
+    """Fake engine with a whole-page classifier that records how predict() was called."""
+
+    def __init__(self, rotation: int = 90, confidence: float = 0.98) -> None:
+        self.rotation = rotation
+        self.confidence = confidence
+        self.classified = 0
+        self.inputs = []
+
+    def classify_orientation(self, images):
+        self.classified += len(images)
+        return [(self.rotation, self.confidence) for _ in images]
+
+    def predict(self, image, **kwargs):
+        self.inputs.append((image, kwargs))
+        return [{"rec_texts": ["Total"], "rec_scores": [0.9], "rec_polys": [[[10, 10], [60, 10], [60, 30], [10, 30]]]}]
+
+
+class MarkFindingEngine(OrientationAwareEngine):
+    """Fake engine that reports one box around the dark mark in its input."""
+
+    def predict(self, image, **kwargs):
+        self.inputs.append((image, kwargs))
+        ys, xs = np.nonzero(image[..., 0] < 128)
+        x0, y0, x1, y1 = int(xs.min()), int(ys.min()), int(xs.max()) + 1, int(ys.max()) + 1
+        return [{"rec_texts": ["mark"], "rec_scores": [0.9], "rec_polys": [[[x0, y0], [x1, y0], [x1, y1], [x0, y1]]]}]
+
+
+class FileReadingEngine(OrientationAwareEngine):
+    """Fake engine that records the decoded pages it was given as files or arrays."""
+
+    def predict(self, image, **kwargs):
+        self.inputs.append((cv2.imread(image) if isinstance(image, str) else image, kwargs))
+        return [{"rec_texts": ["Total"], "rec_scores": [0.9], "rec_polys": [[[10, 10], [60, 10], [60, 30], [10, 30]]]}]
+
+
+def _write_page(path, exif_orientation=None):
+    image = Image.new("RGB", (300, 100), "white")
+    if exif_orientation is None:
+        image.save(path)
+    else:
+        exif = Image.Exif()
+        exif[0x0112] = exif_orientation
+        image.save(path, exif=exif)
+    return path
+
+
+class TestOrientationPrepass:
+    """Test cases for settling page orientation before OCR."""
+
+    def test_classified_page_is_rotated_once(self, tmp_path) -> None:
+        """A confidently classified page is rotated and OCR'd as an array."""
+        path = _write_page(tmp_path / "sideways.png")
+        engine = OrientationAwareEngine(rotation=90)
+        service = OCRService(backend=engine, orientation_prepass=True)
+
+        result = service.extract_text(path)
+
+        [(image, _)] = engine.inputs
+        assert isinstance(image, np.ndarray) and image.shape[:2] == (300, 100)
+        assert result.image_size == (300, 100)
+        assert result.orientation["source"] == "classifier" and result.orientation["known"]
+        assert service.orientation_stats["rotated"] == 1 and service.orientation_stats["angle_cls_skipped"] == 1
+
+    def test_exif_skips_classifier(self, tmp_path) -> None:
+        """JPEGs with an EXIF orientation are known without running the classifier."""
+        path = _write_page(tmp_path / "photo.jpg", exif_orientation=6)
+        engine = OrientationAwareEngine()
+        service = OCRService(backend=engine, orientation_prepass=True)
+
+        result = service.extract_text(path)
+
+        assert engine.classified == 0
+        assert result.orientation == {
+            "source": "exif", "exif_orientation": 6, "rotation": 0, "confidence": 1.0, "known": True
+        }
+        assert result.image_size == cv2.imread(str(path)).shape[1::-1] == (100, 300)
+
+    def test_low_confidence_keeps_angle_classification(self, tmp_path) -> None:
+        """An unsure classifier leaves the page as is and counts it as unknown."""
+        path = _write_page(tmp_path / "unsure.png")
+        engine = OrientationAwareEngine(rotation=180, confidence=0.6)
+        service = OCRService(backend=engine, orientation_prepass=True)
+
+        result = service.extract_text(path)
+
+        assert engine.inputs[0][0] == str(path)
+        assert not result.orientation["known"] and result.orientation["rotation"] == 0
+        assert service.orientation_stats == {
+            "pages": 1, "exif": 0, "classifier": 0, "unknown": 1, "rotated": 0, "angle_cls_skipped": 0
+        }
+
+    def test_rotated_page_boxes_in_file_pixels(self, tmp_path, monkeypatch) -> None:
+        """Boxes of a rotated and downscaled page come back in the file's pixels."""
+        monkeypatch.setattr(settings, "max_image_size", 200)
+        page = np.full((200, 400, 3), 255, dtype=np.uint8)
+        page[20:60, 300:380] = 0
+        path = tmp_path / "rotated.png"
+        cv2.imwrite(str(path), page)
+        engine = MarkFindingEngine(rotation=90, confidence=0.99)
+        service = OCRService(backend=engine, orientation_prepass=True)
+
+        result = service.extract_text(path)
+
+        assert engine.inputs[0][0].shape[:2] == (200, 100)
+        assert result.image_size == (400, 200)
+        [box] = result.text_boxes
+        assert np.abs(np.array(box.bbox) - (300, 20, 380, 60)).max() <= 2
+
+    def test_exif_rotated_jpg_upload(self, tmp_path, monkeypatch) -> None:
+        """A sideways JPG upload is turned upright by the PNG conversion and known from EXIF."""
+        page = np.full((100, 300, 3), 255, dtype=np.uint8)
+        page[:, :20] = 0
+        path = tmp_path / "upload.jpg"
+        exif = Image.Exif()
+        exif[0x0112] = 6
+        Image.fromarray(page).save(path, exif=exif)
+        engine = FileReadingEngine()
+        extractor = ImageDataExtractor(OCRService(backend=engine, orientation_prepass=True))
+        monkeypatch.setattr(ocr_main, "get_shared_extractor", lambda: extractor)
+        monkeypatch.setattr(ocr_main, "EXTRACTED_JSON_DIR", str(tmp_path / "json"))
+
+        result = ocr_main.ocr_image_and_save_json_by_extension(str(path))
+
+        [(image, _)] = engine.inputs
+        # 태그 6 은 시계 방향 90도 → 왼쪽 가장자리의 검은 띠가 위로 옴
+        assert image.shape[:2] == (300, 100)
+        assert image[:10].mean() < 64 and image[-100:].mean() > 192
+        assert engine.classified == 0
+        assert extractor.ocr_service.orientation_stats["exif"] == 1
+        assert tuple(result["ocr_summary"]["image_size"]) == (100, 300)
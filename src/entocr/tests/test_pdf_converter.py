@@ -0,0 +1,48 @@
+"""Tests for PDF rasterization."""
+
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from config.settings import settings
+from src.entocr.pdf_converter import PDFConverter
+
+fitz = pytest.importorskip("fitz")
+
+
+@pytest.fixture
+def pdf_path(tmp_path) -> Path:
+    """A 6-page PDF with the page number printed on every page."""
+    path = tmp_path / "bundle.pdf"
+    doc = fitz.open()
+    for i in range(6):
+        doc.new_page(width=200, height=100).insert_text((20, 50), f"page {i + 1}")
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+class TestPDFConverter:
+    """Test cases for sequential and multi-process rasterization."""
+
+    def test_parallel_render_keeps_page_order(self, pdf_path, tmp_path, monkeypatch) -> None:
+        """Worker processes honour page selection and max_pages and return pages in order."""
+        monkeypatch.setattr(settings, "pdf_parallel_min_pages", 1)
+        converter = PDFConverter(dpi=72, max_pages=5, workers=2)
+
+        streamed = list(converter.iter_pdf_images(pdf_path, tmp_path / "out", pages=[4, 0, 2, 5]))
+
+        assert [page for page, _ in streamed] == [0, 2, 4]
+        assert [path.name for _, path in streamed] == ["page_001.png", "page_003.png", "page_005.png"]
+        assert all(path.exists() for _, path in streamed)
+
+    def test_grayscale_render(self, pdf_path, tmp_path) -> None:
+        """Grayscale rendering writes single-channel images without alpha."""
+        converter = PDFConverter(dpi=72, workers=1, grayscale=True)
+
+        paths = converter.convert_pdf_to_images(pdf_path, tmp_path / "out")
+
+        assert len(paths) == 6
+        with Image.open(paths[0]) as image:
+            assert image.mode == "L" and image.size == (200, 100)
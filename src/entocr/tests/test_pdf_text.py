@@ -0,0 +1,72 @@
+"""Tests for the born-digital PDF text-layer fast path."""
+
+from pathlib import Path
+
+import pytest
+
+from src.entocr.backends import ReplayOCRBackend
+from src.entocr.extractor import ImageDataExtractor
+from src.entocr.ocr_service import OCRService
+from src.entocr.pdf_text import extract_text_layer
+
+fitz = pytest.importorskip("fitz")
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+RECORDED_OCR = REPO_ROOT / "test" / "2. LLM" / "INPUT" / "HUNTRIX.json"
+
+
+def _make_pdf(path: Path, scanned_page: bool = False) -> Path:
+    """Write an A4 PDF with a text page and optionally an image-only page."""
+    doc = fitz.open()
+    page = doc.new_page(width=595, height=842)
+    page.insert_text((72, 100), "Invoice No 2025-0001", fontsize=12)
+    page.insert_text((72, 130), "Total 990,000", fontsize=12)
+    if scanned_page:
+        page = doc.new_page(width=595, height=842)
+        pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 200, 100), False)
+        pix.clear_with(200)
+        page.insert_image(fitz.Rect(72, 72, 272, 172), pixmap=pix)
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+class TestExtractTextLayer:
+    """Test cases for reading PDF text layers."""
+
+    def test_lines_are_scaled_to_render_dpi(self, tmp_path) -> None:
+        """Words are grouped into lines with pixel coordinates at the given DPI."""
+        pdf_path = _make_pdf(tmp_path / "digital.pdf")
+
+        [page] = extract_text_layer(pdf_path, dpi=144)
+
+        assert page.image_size == (1190, 1684)
+        assert [box.text for box in page.text_boxes] == ["Invoice No 2025-0001", "Total 990,000"]
+        assert all(box.confidence == 1.0 for box in page.text_boxes)
+        x0, y0, x1, y1 = page.text_boxes[0].bbox
+        assert 140 <= x0 <= 148 and y0 < 200 <= y1
+
+    def test_image_only_page_needs_ocr(self, tmp_path) -> None:
+        """Pages without text are reported as None."""
+        pdf_path = _make_pdf(tmp_path / "mixed.pdf", scanned_page=True)
+        pages = extract_text_layer(pdf_path)
+        assert pages[0] is not None and pages[1] is None
+
+
+class TestExtractFromPdf:
+    """Test cases for mixed born-digital/scanned PDFs."""
+
+    def test_only_scanned_pages_are_rasterized(self, tmp_path) -> None:
+        """Text pages skip OCR; the scanned page goes through the OCR engine."""
+        pdf_path = _make_pdf(tmp_path / "mixed.pdf", scanned_page=True)
+        extractor = ImageDataExtractor(OCRService(backend=ReplayOCRBackend(RECORDED_OCR)))
+
+        results = extractor.extract_from_pdf(pdf_path, output_dir=tmp_path, keep_images=True, dpi=72)
+
+        assert [p["text_source"] for p in results["pages"]] == ["pdf_text_layer", "ocr"]
+        assert results["pages"][0]["image_file"] is None
+        assert [p.name for p in (tmp_path / "pages").iterdir()] == ["mixed_page_002.png"]
+        text_page = results["pages"][0]["extraction_result"]
+        assert text_page["source_image"] == str(pdf_path)
+        assert text_page["extraction_metadata"]["text_source"] == "pdf_text_layer"
+        assert text_page["structured_data"]["raw_text_lines"] == ["Invoice No 2025-0001", "Total 990,000"]
@@ -0,0 +1,90 @@
+"""Tests for second-pass recognition of low-confidence boxes."""
+
+import cv2
+import numpy as np
+
+from config.settings import settings
+from src.entocr import ocr_service
+from src.entocr.models import TextBox
+from src.entocr.ocr_service import OCRService
+from src.entocr.refine import crop_box
+
+
+def _box(x0: int, y0: int, x1: int, y1: int) -> TextBox:
+    return TextBox(coordinates=[[x0, y0], [x1, y0], [x1, y1], [x0, y1]], text="?", confidence=0.5)
+
+
+class WeakAmountEngine:
+    """Fake engine with one confident and one weak line; recognizes crops by their height."""
+
+    def __init__(self) -> None:
+        self.crop_batches = []
+
+    def predict(self, image_path):
+        return [{
+            "rec_texts": ["Invoice", "99O,0OO"],
+            "rec_scores": [0.98, 0.42],
+            "rec_polys": [[[10, 10], [200, 10], [200, 30], [10, 30]], [[10, 60], [120, 60], [120, 80], [10, 80]]],
+        }]
+
+    def recognize(self, crops):
+        self.crop_batches.append([crop.shape for crop in crops])
+        return [("990,000", 0.97) for _ in crops]
+
+
+class TestCropBox:
+    """Test cases for cropping text lines."""
+
+    def test_small_text_is_upsampled(self) -> None:
+        """Crops are padded and scaled so the text reaches the target height."""
+        image = np.full((100, 300, 3), 255, dtype=np.uint8)
+        crop = crop_box(image, _box(10, 10, 110, 26), padding=0.25, target_height=64)
+        assert crop.shape == (96, 432, 3)
+
+    def test_degenerate_box_is_skipped(self) -> None:
+        """Boxes without area produce no crop."""
+        image = np.full((100, 300, 3), 255, dtype=np.uint8)
+        assert crop_box(image, _box(10, 10, 110, 10)) is None
+
+
+class TestRefinement:
+    """Test cases for the refinement pass in OCRService."""
+
+    def test_only_weak_boxes_are_rerecognized(self, tmp_path) -> None:
+        """Weak boxes are sent as one batch and replaced when the new read is more confident."""
+        image_path = tmp_path / "receipt.png"
+        cv2.imwrite(str(image_path), np.full((100, 300, 3), 255, dtype=np.uint8))
+        engine = WeakAmountEngine()
+
+        result = OCRService(backend=engine, refine=True, refine_threshold=0.8).extract_text(image_path)
+
+        assert [box.text for box in result.text_boxes] == ["Invoice", "990,000"]
+        assert result.text_boxes[1].confidence == 0.97
+        assert result.text_boxes[1].coordinates[0] == [10, 60]
+        assert len(engine.crop_batches) == 1 and len(engine.crop_batches[0]) == 1
+
+    def test_refinement_is_off_by_default(self, tmp_path) -> None:
+        """Without refine the first-pass reads are kept."""
+        image_path = tmp_path / "receipt.png"
+        cv2.imwrite(str(image_path), np.full((100, 300, 3), 255, dtype=np.uint8))
+        engine = WeakAmountEngine()
+
+        result = OCRService(backend=engine, refine=False).extract_text(image_path)
+
+        assert result.text_boxes[1].text == "99O,0OO" and engine.crop_batches == []
+
+    def test_downscaled_tall_page_uses_exact_factor(self, tmp_path, monkeypatch) -> None:
+        """Boxes on a downscaled portrait page are scaled by the long side, not the truncated width."""
+        monkeypatch.setattr(settings, "max_image_size", 200)
+        image_path = tmp_path / "tall.png"
+        cv2.imwrite(str(image_path), np.full((1000, 301, 3), 255, dtype=np.uint8))
+        calls = []
+
+        def recording_refine(image, text_boxes, recognize, threshold, scale=1.0, **kwargs):
+            calls.append((image.shape[:2], scale))
+            return text_boxes, 0, 0
+
+        monkeypatch.setattr(ocr_service, "refine_boxes", recording_refine)
+        OCRService(backend=WeakAmountEngine(), refine=True, refine_threshold=0.8, grayscale=True).extract_text(image_path)
+
+        assert calls == [((1000, 301), 5.0)]
@@ -0,0 +1,108 @@
+"""Tests for PaddleOCR engine construction (runtime options, init cache)."""
+
+import pytest
+
+from config.settings import settings
+from src.entocr.init_cache import load_rejected_params, paddleocr_version
+from src.entocr.ocr_service import OCRService
+
+paddleocr = pytest.importorskip("paddleocr")
+
+
+class RecordingPaddleOCR:
+    """Stand-in for PaddleOCR that records its constructor arguments."""
+
+    calls = []
+    unsupported = set()
+
+    def __init__(self, **kwargs) -> None:
+        RecordingPaddleOCR.calls.append(kwargs)
+        for name in kwargs.keys() & self.unsupported:
+            raise ValueError(f"Unknown argument: {name}")
+
+
+@pytest.fixture
+def recorded_init(monkeypatch, tmp_path):
+    RecordingPaddleOCR.calls = []
+    RecordingPaddleOCR.unsupported = set()
+    monkeypatch.setattr(paddleocr, "PaddleOCR", RecordingPaddleOCR)
+    monkeypatch.setattr(settings, "ocr_init_cache_file", str(tmp_path / "paddleocr_init.json"))
+    return RecordingPaddleOCR.calls
+
+
+class TestInferenceEngine:
+    """Test cases for selecting the inference runtime."""
+
+    def test_paddle_cpu_threads_and_mkldnn(self, recorded_init) -> None:
+        """Paddle Inference gets explicit MKLDNN and thread settings."""
+        OCRService(backend="paddle", inference_engine="paddle", cpu_threads=4).ocr_engine
+        assert recorded_init[0]["enable_mkldnn"] == settings.ocr_enable_mkldnn
+        assert recorded_init[0]["cpu_threads"] == 4
+
+    def test_onnxruntime_uses_exported_models(self, recorded_init, tmp_path, monkeypatch) -> None:
+        """ONNX Runtime loads the (int8) exported models with the configured intra-op threads."""
+        for name in ("det_int8", "rec_int8", "cls_int8"):
+            (tmp_path / name).mkdir()
+        monkeypatch.setattr(settings, "ocr_onnx_model_dir", str(tmp_path))
+        monkeypatch.setattr(settings, "ocr_onnx_int8", True)
+
+        OCRService(backend="paddle", inference_engine="onnxruntime", cpu_threads=2, use_angle_cls=True).ocr_engine
+
+        params = recorded_init[0]
+        assert params["engine"] == "onnxruntime"
+        assert params["engine_config"] == {"intra_op_num_threads": 2}
+        assert params["text_recognition_model_dir"] == str(tmp_path / "rec_int8")
+        assert params["textline_orientation_model_dir"] == str(tmp_path / "cls_int8")
+
+    def test_missing_onnx_models(self, recorded_init, tmp_path, monkeypatch) -> None:
+        """A missing export fails loudly instead of falling back to Paddle Inference."""
+        monkeypatch.setattr(settings, "ocr_onnx_model_dir", str(tmp_path))
+        with pytest.raises(FileNotFoundError):
+            OCRService(backend="paddle", inference_engine="onnxruntime").ocr_engine
+
+    def test_unknown_engine(self) -> None:
+        """Unsupported runtimes are rejected up front."""
+        with pytest.raises(ValueError):
+            OCRService(inference_engine="tensorrt")
+
+
+class TestInitCache:
+    """Test cases for caching the accepted constructor arguments."""
+
+    def test_second_start_builds_in_one_attempt(self, recorded_init) -> None:
+        """Arguments rejected once are dropped up front on the next cold start."""
+        RecordingPaddleOCR.unsupported = {"use_gpu", "cpu_threads"}
+
+        OCRService(backend="paddle", use_gpu=True, cpu_threads=2).ocr_engine
+        first_start = len(recorded_init)
+        recorded_init.clear()
+        OCRService(backend="paddle", use_gpu=True, cpu_threads=2).ocr_engine
+
+        assert first_start == 3
+        assert len(recorded_init) == 1
+        assert not recorded_init[0].keys() & {"use_gpu", "cpu_threads"}
+        assert recorded_init[0]["rec_batch_num"] == settings.ocr_rec_batch_num
+
+    def test_stale_cache_falls_back(self, recorded_init) -> None:
+        """A cache entry that no longer works is retried without the newly rejected argument and rewritten."""
+        RecordingPaddleOCR.unsupported = {"cpu_threads"}
+        OCRService(backend="paddle", cpu_threads=2).ocr_engine
+        RecordingPaddleOCR.unsupported = {"cpu_threads", "rec_batch_num"}
+        OCRService(backend="paddle", cpu_threads=2).ocr_engine
+        recorded_init.clear()
+
+        OCRService(backend="paddle", cpu_threads=2).ocr_engine
+
+        assert len(recorded_init) == 1 and "rec_batch_num" not in recorded_init[0]
+
+    def test_only_reported_arguments_are_cached(self, recorded_init) -> None:
+        """A rejected use_gpu is dropped alone; the runtime options are kept and not cached."""
+        RecordingPaddleOCR.unsupported = {"use_gpu"}
+
+        OCRService(backend="paddle", inference_engine="paddle", use_gpu=True, cpu_threads=2).ocr_engine
+
+        assert len(recorded_init) == 2
+        assert "use_gpu" not in recorded_init[-1]
+        assert recorded_init[-1]["enable_mkldnn"] == settings.ocr_enable_mkldnn
+        assert recorded_init[-1]["cpu_threads"] == 2
+        assert load_rejected_params(settings.ocr_init_cache_file, paddleocr_version()) == {"use_gpu"}
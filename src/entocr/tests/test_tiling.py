@@ -0,0 +1,110 @@
+"""Tests for tiled OCR of oversized images."""
+
+import cv2
+import numpy as np
+
+from config.settings import settings
+from src.entocr.models import TextBox
+from src.entocr.ocr_service import OCRService
+from src.entocr.tiling import Tile, merge_tile_boxes, plan_tiles
+
+
+def _box(x0: int, y0: int, x1: int, y1: int, text: str, confidence: float = 0.9) -> TextBox:
+    return TextBox(coordinates=[[x0, y0], [x1, y0], [x1, y1], [x0, y1]], text=text, confidence=confidence)
+
+
+class RectangleOCREngine:
+    """Fake engine that "reads" dark rectangles, named after their gray level."""
+
+    def __init__(self) -> None:
+        self.tile_shapes = []
+
+    def predict(self, images):
+        results = []
+        for image in images:
+            self.tile_shapes.append(image.shape[:2])
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            contours, _ = cv2.findContours((gray < 200).astype(np.uint8), cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+            texts, polys = [], []
+            for contour in contours:
+                x, y, w, h = cv2.boundingRect(contour)
+                texts.append(f"box{gray[y + h // 2, x + w // 2]}")
+                polys.append([[x, y], [x + w - 1, y], [x + w - 1, y + h - 1], [x, y + h - 1]])
+            results.append({"rec_texts": texts, "rec_scores": [0.9] * len(texts), "rec_polys": polys})
+        return results
+
+
+class TestPlanTiles:
+    """Test cases for tile layout."""
+
+    def test_tiles_cover_image_with_overlap(self) -> None:
+        """Tiles cover every pixel and neighbours overlap by at least the requested amount."""
+        tiles = plan_tiles(3000, 1500, tile_size=1024, overlap=128)
+        covered = np.zeros((1500, 3000), dtype=bool)
+        for tile in tiles:
+            assert max(tile.size) <= 1024
+            covered[tile.y0:tile.y1, tile.x0:tile.x1] = True
+        assert covered.all()
+
+        row = sorted({(t.x0, t.x1) for t in tiles})
+        assert all(a[1] - b[0] >= 128 for a, b in zip(row, row[1:]))
+
+    def test_small_image_is_single_tile(self) -> None:
+        """Images within the tile size are not split."""
+        assert plan_tiles(800, 600, tile_size=1024, overlap=128) == [Tile(0, 0, 0, 800, 600)]
+
+
+class TestMergeTileBoxes:
+    """Test cases for merging boxes across tile seams."""
+
+    def test_duplicate_in_overlap_keeps_uncut_copy(self) -> None:
+        """A line cut by the seam in one tile and whole in the other is kept once."""
+        left, right = Tile(0, 0, 0, 100, 50), Tile(1, 60, 0, 200, 50)
+        merged = merge_tile_boxes(
+            [(left, [_box(70, 10, 100, 20, "Tot")]), (right, [_box(10, 10, 50, 20, "Total")])],
+            image_size=(200, 50),
+        )
+        assert [(b.text, b.bbox) for b in merged] == [("Total", (70, 10, 110, 20))]
+
+    def test_line_cut_in_both_tiles_is_stitched(self) -> None:
+        """Fragments of a line longer than the overlap are joined without repeating text."""
+        left, right = Tile(0, 0, 0, 100, 50), Tile(1, 80, 0, 200, 50)
+        merged = merge_tile_boxes(
+            [(left, [_box(50, 10, 100, 20, "ABCDEF")]), (right, [_box(0, 10, 40, 20, "EFGH", 0.8)])],
+            image_size=(200, 50),
+        )
+        assert len(merged) == 1
+        assert merged[0].text == "ABCDEFGH"
+        assert merged[0].bbox == (50, 10, 120, 20)
+        assert merged[0].confidence == 0.8
+
+
+class TestTiledOCRService:
+    """Test cases for tiled recognition in OCRService."""
+
+    def test_oversized_image_is_tiled_at_full_resolution(self, tmp_path) -> None:
+        """Boxes come back once each, in full-resolution image coordinates."""
+        width, height = settings.max_image_size + 1000, 1200
+        image = np.full((height, width, 3), 255, dtype=np.uint8)
+        rects = {
+            10: (100, 100, 300, 140),     # first tile only
+            20: (900, 500, 1000, 540),    # inside the overlap of two tiles
+            30: (990, 800, 1100, 840),    # crosses a tile edge
+            40: (width - 250, 1100, width - 50, 1140),
+        }
+        for level, (x0, y0, x1, y1) in rects.items():
+            image[y0:y1, x0:x1] = level
+        image_path = tmp_path / "wide.png"
+        cv2.imwrite(str(image_path), image)
+
+        engine = RectangleOCREngine()
+        service = OCRService(backend=engine, tiling=True, tile_size=1024, tile_overlap=128)
+        result = service.extract_text(image_path)
+
+        assert result.image_size == (width, height)
+        assert len(engine.tile_shapes) > 1
+        assert all(max(shape) <= 1024 for shape in engine.tile_shapes)
+        found = {box.text: box.bbox for box in result.text_boxes}
+        assert found == {
+            f"box{level}": (x0, y0, x1 - 1, y1 - 1) for level, (x0, y0, x1, y1) in rects.items()
+        }
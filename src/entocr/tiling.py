@@ -0,0 +1,232 @@
+"""Tiled OCR helpers for images larger than ``max_image_size``.
+
+Oversized scans are split into overlapping tiles that are recognized at full
+resolution; the per-tile boxes are shifted back to image coordinates and
+merged across tile seams:
+
+* a line cut by a vertical seam in both neighbouring tiles is stitched into
+  one box (the text overlap between the two fragments is removed),
+* a line seen in two tiles (inside the overlap band) is kept once,
+  preferring the copy that is not cut by a tile edge.
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Iterable, List, Sequence, Set, Tuple
+
+import numpy as np
+
+from .models import TextBox
+
+
+@dataclass(frozen=True)
+class Tile:
+    """A rectangular tile of the source image, ``[x0, x1) x [y0, y1)``."""
+
+    index: int
+    x0: int
+    y0: int
+    x1: int
+    y1: int
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        """Get tile size as (width, height)."""
+        return (self.x1 - self.x0, self.y1 - self.y0)
+
+    def crop(self, image: np.ndarray) -> np.ndarray:
+        """Cut this tile out of an image array."""
+        return np.ascontiguousarray(image[self.y0:self.y1, self.x0:self.x1])
+
+
+def _axis_starts(length: int, tile_size: int, overlap: int) -> List[int]:
+    """Evenly spaced tile offsets covering ``length`` with at least ``overlap``."""
+    if length <= tile_size:
+        return [0]
+    step = tile_size - overlap
+    count = math.ceil((length - overlap) / step)
+    span = length - tile_size
+    return [round(i * span / (count - 1)) for i in range(count)]
+
+
+def plan_tiles(width: int, height: int, tile_size: int, overlap: int) -> List[Tile]:
+    """Split an image into overlapping tiles, row by row.
+
+    Args:
+        width: Image width in pixels
+        height: Image height in pixels
+        tile_size: Maximum tile side length
+        overlap: Minimum overlap between neighbouring tiles; should exceed the
+            height of a text line so every line fits entirely in some tile
+
+    Returns:
+        Tiles covering the whole image
+
+    Raises:
+        ValueError: If overlap is not smaller than tile_size
+    """
+    if tile_size <= 0 or not 0 <= overlap < tile_size:
+        raise ValueError(f"Invalid tiling: tile_size={tile_size}, overlap={overlap}")
+    tiles = []
+    for y0 in _axis_starts(height, tile_size, overlap):
+        for x0 in _axis_starts(width, tile_size, overlap):
+            tiles.append(Tile(
+                index=len(tiles),
+                x0=x0,
+                y0=y0,
+                x1=min(x0 + tile_size, width),
+                y1=min(y0 + tile_size, height),
+            ))
+    return tiles
+
+
+def shift_box(box: TextBox, tile: Tile) -> TextBox:
+    """Translate a box from tile coordinates to image coordinates."""
+    return TextBox(
+        coordinates=[[x + tile.x0, y + tile.y0] for x, y in box.coordinates],
+        text=box.text,
+        confidence=box.confidence,
+    )
+
+
+@dataclass
+class _Piece:
+    """A box in image coordinates with the tile edges it touches."""
+
+    box: TextBox
+    tiles: Set[int]
+    cut_left: bool = False
+    cut_right: bool = False
+    cut_top: bool = False
+    cut_bottom: bool = False
+    bbox: Tuple[int, int, int, int] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.bbox = self.box.bbox
+
+    @property
+    def cut(self) -> bool:
+        return self.cut_left or self.cut_right or self.cut_top or self.cut_bottom
+
+    @property
+    def area(self) -> int:
+        x0, y0, x1, y1 = self.bbox
+        return max(1, x1 - x0) * max(1, y1 - y0)
+
+
+def _intersection(a: Tuple[int, int, int, int], b: Tuple[int, int, int, int]) -> int:
+    w = min(a[2], b[2]) - max(a[0], b[0])
+    h = min(a[3], b[3]) - max(a[1], b[1])
+    return max(0, w) * max(0, h)
+
+
+def _vertical_overlap_ratio(a: Tuple[int, int, int, int], b: Tuple[int, int, int, int]) -> float:
+    overlap = min(a[3], b[3]) - max(a[1], b[1])
+    shorter = min(a[3] - a[1], b[3] - b[1])
+    return overlap / shorter if shorter > 0 else 0.0
+
+
+def _stitch_text(left: TextBox, right: TextBox, overlap_px: int) -> str:
+    """Join two fragments of a line, dropping the characters both tiles read."""
+    a, b = left.text, right.text
+    x0, _, x1, _ = left.bbox
+    char_width = (x1 - x0) / max(1, len(a))
+    expected = round(max(0, overlap_px) / char_width) if char_width > 0 else 0
+    tolerance = max(2, expected // 2)
+    for k in range(min(len(a), len(b)), 0, -1):
+        if abs(k - expected) <= tolerance and a.endswith(b[:k]):
+            return a + b[k:]
+    # 글자 단위로 일치하는 겹침이 없으면 겹친 폭만큼 추정해서 제거
+    return a + b[min(expected, len(b)):]
+
+
+def _stitch(left: _Piece, right: _Piece) -> _Piece:
+    lx0, ly0, lx1, ly1 = left.bbox
+    rx0, ry0, rx1, ry1 = right.bbox
+    x0, y0, x1, y1 = min(lx0, rx0), min(ly0, ry0), max(lx1, rx1), max(ly1, ry1)
+    box = TextBox(
+        coordinates=[[x0, y0], [x1, y0], [x1, y1], [x0, y1]],
+        text=_stitch_text(left.box, right.box, lx1 - rx0),
+        confidence=min(left.box.confidence, right.box.confidence),
+    )
+    return _Piece(
+        box=box,
+        tiles=left.tiles | right.tiles,
+        cut_left=left.cut_left,
+        cut_right=right.cut_right,
+        cut_top=left.cut_top or right.cut_top,
+        cut_bottom=left.cut_bottom or right.cut_bottom,
+    )
+
+
+def _find_stitch_pair(pieces: List[_Piece], margin: int) -> Tuple[int, int]:
+    for i, left in enumerate(pieces):
+        if not left.cut_right:
+            continue
+        for j, right in enumerate(pieces):
+            if i == j or not right.cut_left or left.tiles & right.tiles:
+                continue
+            lb, rb = left.bbox, right.bbox
+            if (
+                lb[0] < rb[0]
+                and lb[2] < rb[2]
+                and rb[0] <= lb[2] + margin
+                and _vertical_overlap_ratio(lb, rb) >= 0.5
+            ):
+                return i, j
+    return -1, -1
+
+
+def merge_tile_boxes(
+    tile_boxes: Iterable[Tuple[Tile, Sequence[TextBox]]],
+    image_size: Tuple[int, int],
+    edge_margin: int = 4,
+    overlap_threshold: float = 0.5,
+) -> List[TextBox]:
+    """Merge per-tile OCR boxes into one list in image coordinates.
+
+    Args:
+        tile_boxes: (tile, boxes in tile coordinates) pairs
+        image_size: Source image size (width, height)
+        edge_margin: Distance in pixels from an inner tile edge at which a box
+            counts as cut by the seam
+        overlap_threshold: Intersection over the smaller box above which two
+            boxes from different tiles are treated as the same text
+
+    Returns:
+        Deduplicated boxes sorted top-to-bottom, left-to-right
+    """
+    width, height = image_size
+    pieces: List[_Piece] = []
+    for tile, boxes in tile_boxes:
+        for box in boxes:
+            piece = _Piece(box=shift_box(box, tile), tiles={tile.index})
+            x0, y0, x1, y1 = piece.bbox
+            piece.cut_left = tile.x0 > 0 and x0 <= tile.x0 + edge_margin
+            piece.cut_right = tile.x1 < width and x1 >= tile.x1 - edge_margin
+            piece.cut_top = tile.y0 > 0 and y0 <= tile.y0 + edge_margin
+            piece.cut_bottom = tile.y1 < height and y1 >= tile.y1 - edge_margin
+            pieces.append(piece)
+
+    # 세로 이음새에 걸려 양쪽 타일 모두에서 잘린 줄 → 하나로 이어붙임
+    while True:
+        i, j = _find_stitch_pair(pieces, edge_margin)
+        if i < 0:
+            break
+        merged = _stitch(pieces[i], pieces[j])
+        pieces = [p for k, p in enumerate(pieces) if k not in (i, j)] + [merged]
+
+    # 겹침 영역에서 중복 인식된 박스 제거: 잘리지 않은 것 > 큰 것 > 신뢰도 높은 것 우선
+    pieces.sort(key=lambda p: (p.cut, -p.area, -p.box.confidence))
+    kept: List[_Piece] = []
+    for piece in pieces:
+        duplicate = any(
+            not (piece.tiles & other.tiles)
+            and _intersection(piece.bbox, other.bbox) >= overlap_threshold * min(piece.area, other.area)
+            for other in kept
+        )
+        if not duplicate:
+            kept.append(piece)
+
+    kept.sort(key=lambda p: (p.bbox[1], p.bbox[0]))
+    return [p.box for p in kept]
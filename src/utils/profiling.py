@@ -0,0 +1,134 @@
+"""
+요청 단위 opt-in 샘플링 프로파일러(표준 라이브러리만 사용).
+
+    with profile_session(out_dir, "pipeline.ocr_journal") as prof:
+        ...                       # prof.path: 저장될 파일(슬롯이 없으면 prof 는 None)
+
+- 백그라운드 스레드가 interval 마다 대상 스레드의 스택(sys._current_frames)을 샘플링
+  → 대상 스레드 외(워커 풀/네이티브 코드 내부)는 보이지 않음. 네이티브 호출 중에는 호출한 파이썬 프레임에 누적
+- 결과는 collapsed stack 포맷(`a;b;c <샘플수>`) 텍스트 → flamegraph.pl / speedscope / inferno 에서 바로 열림
+- 동시에 프로파일링되는 요청 수는 PROFILE_MAX_CONCURRENT(기본 1)로 제한.
+  자리가 없으면 프로파일링 없이 그대로 실행(요청이 대기하거나 실패하지 않음)
+"""
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from src.utils.tracing import REGISTRY
+
+DEFAULT_INTERVAL_S = float(os.getenv("PROFILE_INTERVAL_S", "0.005"))
+MAX_CONCURRENT_PROFILES = int(os.getenv("PROFILE_MAX_CONCURRENT", "1"))
+MAX_STACK_DEPTH = 128
+
+_slots = threading.BoundedSemaphore(max(1, MAX_CONCURRENT_PROFILES))
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    filename = code.co_filename.replace("\\", "/")
+    # 경로가 길면 flamegraph 가 읽기 어려우므로 src/ 이후 또는 파일명만
+    idx = filename.rfind("/src/")
+    short = filename[idx + 1:] if idx >= 0 else filename.rsplit("/", 1)[-1]
+    return f"{code.co_name} ({short}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    def __init__(self, thread_id: Optional[int] = None, interval: float = DEFAULT_INTERVAL_S):
+        self.thread_id = thread_id or threading.get_ident()
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self.sample_count = 0
+        self.started_at: Optional[float] = None
+        self.duration_s = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "SamplingProfiler":
+        self.started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.duration_s = time.perf_counter() - (self.started_at or time.perf_counter())
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                if not any(t.ident == self.thread_id for t in threading.enumerate()):
+                    break
+                continue
+            stack = []
+            while frame is not None and len(stack) < MAX_STACK_DEPTH:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            self.samples[";".join(reversed(stack))] += 1
+            self.sample_count += 1
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {n}\n" for stack, n in self.samples.most_common())
+
+    def write_collapsed(self, path: os.PathLike) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(self.collapsed(), encoding="utf-8")
+        os.replace(tmp, path)
+        return path
+
+
+class ProfileSession:
+    def __init__(self, profiler: SamplingProfiler, path: Path):
+        self.profiler = profiler
+        self.path = path
+
+
+def profile_path(out_dir: os.PathLike, name: str) -> Path:
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+    return Path(out_dir) / f"profile_{stamp}_{name.replace('/', '_')}.collapsed"
+
+@contextmanager
+def profile_session(out_dir: os.PathLike, name: str, interval: float = DEFAULT_INTERVAL_S):
+    """
+    현재 스레드를 프로파일링하고 종료 시(오류 포함) out_dir 에 collapsed stack 저장.
+    동시 프로파일 상한에 걸리면 None 을 넘기고 프로파일링 없이 실행
+    """
+    if not _slots.acquire(blocking=False):
+        REGISTRY.inc("profiles_total", help="Profiling requests by outcome.", outcome="skipped_busy")
+        yield None
+        return
+    try:
+        profiler = SamplingProfiler(interval=interval).start()
+        session = ProfileSession(profiler, profile_path(out_dir, name))
+        try:
+            yield session
+        finally:
+            profiler.stop()
+            try:
+                profiler.write_collapsed(session.path)
+                REGISTRY.inc("profiles_total", help="Profiling requests by outcome.", outcome="written")
+            except OSError:
+                session.path = None
+                REGISTRY.inc("profiles_total", help="Profiling requests by outcome.", outcome="write_failed")
+    finally:
+        _slots.release()
+
+def profiling_requested(*flags) -> bool:
+    """쿼리/헤더 값 중 하나라도 참이면 True ("1", "true", "yes", "on")"""
+    for flag in flags:
+        if isinstance(flag, bool):
+            if flag:
+                return True
+        elif flag is not None and str(flag).strip().lower() in ("1", "true", "yes", "on"):
+            return True
+    return False
@@ -0,0 +1,153 @@
+"""
+녹화된 결과를 재생하는 가짜(replay) 백엔드용 공통 도구.
+
+OCR/LLM replay 백엔드가 함께 사용합니다.
+- LatencyModel: 호출당 지연시간 분포. 문자열 스펙으로 설정
+    "0" / "fixed:0.2" / "uniform:0.1,0.5" / "normal:0.8,0.2" / "lognormal:-0.5,0.4"
+    (단위: 초. lognormal 은 ln 기준 mu,sigma. 음수 샘플은 0으로 자름)
+- ReplayFaults: 지연 + error_rate 확률의 주입 오류(ReplayInjectedError)
+- seed 를 주면 지연/오류 순서가 재현됨
+"""
+import json
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+_DISTRIBUTIONS = {
+    "fixed": 1,
+    "uniform": 2,
+    "normal": 2,
+    "lognormal": 2,
+}
+
+
+class ReplayInjectedError(RuntimeError):
+    """replay 백엔드가 error_rate 에 따라 일부러 발생시킨 오류"""
+
+
+class LatencyModel:
+    def __init__(self, kind: str = "fixed", params: tuple = (0.0,)):
+        if kind not in _DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution: {kind}")
+        if len(params) != _DISTRIBUTIONS[kind]:
+            raise ValueError(f"'{kind}' latency expects {_DISTRIBUTIONS[kind]} parameter(s), got {len(params)}")
+        self.kind = kind
+        self.params = tuple(float(p) for p in params)
+
+    @classmethod
+    def parse(cls, spec: Union[str, float, int, None, "LatencyModel"]) -> "LatencyModel":
+        if isinstance(spec, LatencyModel):
+            return spec
+        if spec is None or spec == "":
+            return cls()
+        if isinstance(spec, (int, float)):
+            return cls("fixed", (spec,))
+        kind, _, rest = str(spec).partition(":")
+        if not rest:
+            # 숫자만 주면 고정 지연
+            return cls("fixed", (float(kind),))
+        return cls(kind.strip().lower(), tuple(p for p in rest.split(",") if p.strip()))
+
+    def sample(self, rng: random.Random) -> float:
+        p = self.params
+        if self.kind == "fixed":
+            value = p[0]
+        elif self.kind == "uniform":
+            value = rng.uniform(p[0], p[1])
+        elif self.kind == "normal":
+            value = rng.gauss(p[0], p[1])
+        else:
+            value = rng.lognormvariate(p[0], p[1])
+        return max(0.0, value)
+
+    def __repr__(self) -> str:
+        return f"{self.kind}:{','.join(str(p) for p in self.params)}"
+
+
+class ReplayFaults:
+    """지연/오류 주입 + 호출 통계(스레드 안전)"""
+
+    def __init__(self, latency=None, error_rate: float = 0.0, seed: Optional[int] = None, sleep=time.sleep):
+        if not 0.0 <= float(error_rate) <= 1.0:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.latency = LatencyModel.parse(latency)
+        self.error_rate = float(error_rate)
+        self._rng = random.Random(seed)
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.errors = 0
+        self.total_latency_s = 0.0
+
+    def apply(self, label: str = "") -> None:
+        """지연 후, error_rate 확률로 ReplayInjectedError"""
+        with self._lock:
+            delay = self.latency.sample(self._rng)
+            fail = self._rng.random() < self.error_rate
+            self.calls += 1
+            self.total_latency_s += delay
+            if fail:
+                self.errors += 1
+        if delay:
+            self._sleep(delay)
+        if fail:
+            raise ReplayInjectedError(f"Injected replay failure{f' ({label})' if label else ''}")
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "errors": self.errors,
+                "total_latency_s": round(self.total_latency_s, 6),
+                "latency": repr(self.latency),
+                "error_rate": self.error_rate,
+            }
+
+
+def recording_key(path: Union[str, Path, None]) -> str:
+    """파일 경로 → 녹화 매칭 키(파일명 stem, 소문자). Windows 경로 구분자도 처리"""
+    if not path:
+        return ""
+    name = str(path).replace("\\", "/").rsplit("/", 1)[-1]
+    return name.rsplit(".", 1)[0].lower() if "." in name else name.lower()
+
+
+def load_recordings(source: Union[str, Path], suffix: str = "") -> dict[str, dict]:
+    """
+    녹화 JSON 로드. source 가 디렉토리면 *.json 전체, 파일이면 그 파일 하나.
+    키는 파일명 stem(suffix 가 붙어 있으면 제거. 예: HUNTRIX_data.json → huntrix)
+    """
+    source = Path(source)
+    files = sorted(source.glob("*.json")) if source.is_dir() else [source]
+    if not files:
+        raise FileNotFoundError(f"No recordings found in: {source}")
+    out = {}
+    for f in files:
+        with open(f, "r", encoding="utf-8") as fp:
+            key = recording_key(f)
+            if suffix and key.endswith(suffix.lower()):
+                key = key[: -len(suffix)]
+            out[key] = json.load(fp)
+    return out
+
+
+class RecordingPicker:
+    """요청 키로 녹화를 고르고, 없으면 녹화 목록을 순서대로 돌려가며 반환"""
+
+    def __init__(self, recordings: dict[str, dict]):
+        if not recordings:
+            raise ValueError("recordings must not be empty")
+        self.recordings = recordings
+        self._order = list(recordings)
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def pick(self, key: str = "") -> dict:
+        if key and key in self.recordings:
+            return self.recordings[key]
+        with self._lock:
+            name = self._order[self._next % len(self._order)]
+            self._next += 1
+        return self.recordings[name]
@@ -0,0 +1,357 @@
+"""
+경량 트레이싱(span) + 메트릭 집계.
+
+    with span("ocr.extract_text", file=path):
+        ...
+
+    @traced("db.update_voucher_data")
+    def update_voucher_data(...): ...
+
+- span 마다 wall(perf_counter), CPU(process_time), 읽기/쓰기 바이트, 종료 시점 peak RSS 기록
+  · CPU/바이트는 프로세스 단위 카운터의 차이라서 동시에 실행 중인 다른 작업이 섞일 수 있음
+  · 바이트는 psutil io_counters(Linux: read_chars/write_chars) 가 있을 때만 기록
+- 모든 span 은 프로세스 전역 REGISTRY 에 이름별로 누적 → render_prometheus() 로 /metrics 출력
+- trace_run(name, out_dir) 안에서 끝난 span 은 run 단위로 모아 out_dir/run_<시각>_<name>.json 에 요약 저장
+- span 중첩은 contextvars 로 추적(parent 이름 기록). 스레드풀 요청별로 분리됨
+"""
+import contextvars
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+from loguru import logger
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:  # Windows
+    RESOURCE_AVAILABLE = False
+
+METRIC_PREFIX = "voucherai"
+# wall time 히스토그램 경계(초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_PROC = psutil.Process() if PSUTIL_AVAILABLE else None
+
+
+def _io_counters() -> tuple[int, int]:
+    if _PROC is None:
+        return 0, 0
+    try:
+        io = _PROC.io_counters()
+    except (AttributeError, psutil.Error):
+        return 0, 0
+    # Linux 는 캐시 적중 I/O 까지 포함하는 *_chars 사용
+    return getattr(io, "read_chars", io.read_bytes), getattr(io, "write_chars", io.write_bytes)
+
+def peak_rss_bytes() -> Optional[int]:
+    """프로세스 최대 RSS(high-water mark)"""
+    if RESOURCE_AVAILABLE:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux 는 KB, macOS 는 bytes
+        return peak if sys.platform == "darwin" else peak * 1024
+    if _PROC is not None:
+        info = _PROC.memory_info()
+        return getattr(info, "peak_wset", info.rss)
+    return None
+
+
+class Span:
+    __slots__ = ("name", "parent", "attrs", "start", "wall_s", "cpu_s",
+                 "bytes_read", "bytes_written", "peak_rss_bytes", "error",
+                 "_t0", "_c0", "_io0")
+
+    def __init__(self, name: str, parent: Optional[str], attrs: dict):
+        self.name = name
+        self.parent = parent
+        self.attrs = attrs
+        self.start = datetime.now(timezone.utc).isoformat()
+        self.wall_s = self.cpu_s = 0.0
+        self.bytes_read = self.bytes_written = 0
+        self.peak_rss_bytes = None
+        self.error = None
+        self._io0 = _io_counters()
+        self._c0 = time.process_time()
+        self._t0 = time.perf_counter()
+
+    def set(self, **attrs) -> None:
+        """span 속성 추가(예: 처리한 페이지 수)"""
+        self.attrs.update(attrs)
+
+    def _finish(self, error: Optional[BaseException]) -> None:
+        self.wall_s = time.perf_counter() - self._t0
+        self.cpu_s = time.process_time() - self._c0
+        r1, w1 = _io_counters()
+        self.bytes_read = r1 - self._io0[0]
+        self.bytes_written = w1 - self._io0[1]
+        self.peak_rss_bytes = peak_rss_bytes()
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "parent": self.parent,
+            "start": self.start,
+            "wall_s": round(self.wall_s, 6),
+            "cpu_s": round(self.cpu_s, 6),
+            "bytes_read": self.bytes_read,
+            "bytes_written": self.bytes_written,
+            "peak_rss_bytes": self.peak_rss_bytes,
+            "error": self.error,
+            "attrs": self.attrs,
+        }
+
+
+class _SpanStats:
+    __slots__ = ("count", "errors", "wall_s", "cpu_s", "bytes_read", "bytes_written", "buckets")
+
+    def __init__(self):
+        self.count = self.errors = 0
+        self.wall_s = self.cpu_s = 0.0
+        self.bytes_read = self.bytes_written = 0
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+
+    def add(self, sp: Span) -> None:
+        self.count += 1
+        self.errors += sp.error is not None
+        self.wall_s += sp.wall_s
+        self.cpu_s += sp.cpu_s
+        self.bytes_read += sp.bytes_read
+        self.bytes_written += sp.bytes_written
+        for i, le in enumerate(LATENCY_BUCKETS):
+            if sp.wall_s <= le:
+                self.buckets[i] += 1
+                break
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "wall_s": round(self.wall_s, 6),
+            "cpu_s": round(self.cpu_s, 6),
+            "bytes_read": self.bytes_read,
+            "bytes_written": self.bytes_written,
+        }
+
+
+class MetricsRegistry:
+    """span 이름별 누적 통계 + 임의 카운터/게이지(스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._spans: dict[str, _SpanStats] = {}
+        self._counters: dict[tuple[str, tuple], float] = {}
+        self._gauges: dict[tuple[str, tuple], float] = {}
+        self._help: dict[str, str] = {}
+
+    def observe(self, sp: Span) -> None:
+        with self._lock:
+            stats = self._spans.get(sp.name)
+            if stats is None:
+                stats = self._spans[sp.name] = _SpanStats()
+            stats.add(sp)
+
+    def inc(self, name: str, value: float = 1.0, help: str = "", **labels) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + value
+            if help:
+                self._help[name] = help
+
+    def set_gauge(self, name: str, value: float, help: str = "", **labels) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._gauges[key] = value
+            if help:
+                self._help[name] = help
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {name: st.to_dict() for name, st in self._spans.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._spans.clear()
+            self._counters.clear()
+            self._gauges.clear()
+
+    def render_prometheus(self) -> str:
+        p = METRIC_PREFIX
+        with self._lock:
+            spans = {name: (st.to_dict(), list(st.buckets)) for name, st in sorted(self._spans.items())}
+            counters = sorted(self._counters.items())
+            gauges = sorted(self._gauges.items())
+            helps = dict(self._help)
+
+        out = [
+            f"# HELP {p}_span_seconds Wall time of traced pipeline stages.",
+            f"# TYPE {p}_span_seconds histogram",
+        ]
+        for name, (st, buckets) in spans.items():
+            lbl = _labels({"span": name})
+            cumulative = 0
+            for le, n in zip(LATENCY_BUCKETS, buckets):
+                cumulative += n
+                out.append(f'{p}_span_seconds_bucket{_labels({"span": name, "le": _num(le)})} {cumulative}')
+            out.append(f'{p}_span_seconds_bucket{_labels({"span": name, "le": "+Inf"})} {st["count"]}')
+            out.append(f"{p}_span_seconds_sum{lbl} {_num(st['wall_s'])}")
+            out.append(f"{p}_span_seconds_count{lbl} {st['count']}")
+        for metric, key, help_text in (
+            ("span_cpu_seconds_total", "cpu_s", "Process CPU time spent inside traced stages."),
+            ("span_read_bytes_total", "bytes_read", "Bytes read by the process inside traced stages."),
+            ("span_written_bytes_total", "bytes_written", "Bytes written by the process inside traced stages."),
+            ("span_errors_total", "errors", "Traced stages that raised an exception."),
+        ):
+            out.append(f"# HELP {p}_{metric} {help_text}")
+            out.append(f"# TYPE {p}_{metric} counter")
+            for name, (st, _) in spans.items():
+                out.append(f"{p}_{metric}{_labels({'span': name})} {_num(st[key])}")
+
+        for kind, items in (("counter", counters), ("gauge", gauges)):
+            seen = set()
+            for (name, labels), value in items:
+                if name not in seen:
+                    seen.add(name)
+                    if name in helps:
+                        out.append(f"# HELP {p}_{name} {helps[name]}")
+                    out.append(f"# TYPE {p}_{name} {kind}")
+                out.append(f"{p}_{name}{_labels(dict(labels))} {_num(value)}")
+
+        rss = peak_rss_bytes()
+        if rss is not None:
+            out.append(f"# HELP {p}_process_peak_rss_bytes Peak resident set size of the process.")
+            out.append(f"# TYPE {p}_process_peak_rss_bytes gauge")
+            out.append(f"{p}_process_peak_rss_bytes {rss}")
+        return "\n".join(out) + "\n"
+
+
+def _num(v: float) -> str:
+    return repr(float(v)) if isinstance(v, float) else str(v)
+
+def _labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    esc = lambda s: str(s).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return "{" + ",".join(f'{k}="{esc(v)}"' for k, v in labels.items()) + "}"
+
+
+REGISTRY = MetricsRegistry()
+
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("current_span", default=None)
+_current_run: contextvars.ContextVar[Optional["Run"]] = contextvars.ContextVar("current_run", default=None)
+
+
+@contextmanager
+def span(name: str, **attrs):
+    parent = _current_span.get()
+    sp = Span(name, parent.name if parent else None, attrs)
+    token = _current_span.set(sp)
+    error = None
+    try:
+        yield sp
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        _current_span.reset(token)
+        sp._finish(error)
+        REGISTRY.observe(sp)
+        run = _current_run.get()
+        if run is not None:
+            run.add(sp)
+
+def traced(name: Optional[str] = None):
+    """함수 전체를 span 으로 감싸는 데코레이터(기본 이름: 모듈.함수)"""
+    def deco(fn):
+        span_name = name or f"{fn.__module__}.{fn.__qualname__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(span_name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return deco
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+class Run:
+    """한 번의 실행(예: 파이프라인 1회)에서 끝난 span 모음"""
+
+    def __init__(self, name: str, attrs: dict):
+        self.name = name
+        self.attrs = attrs
+        self.started_at = datetime.now(timezone.utc)
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+        self.summary_path: Optional[Path] = None
+
+    def add(self, sp: Span) -> None:
+        with self._lock:
+            self.spans.append(sp)
+
+    def summary(self) -> dict:
+        totals: dict[str, _SpanStats] = {}
+        with self._lock:
+            spans = list(self.spans)
+        for sp in spans:
+            totals.setdefault(sp.name, _SpanStats()).add(sp)
+        root = next((sp for sp in reversed(spans) if sp.name == self.name and sp.parent is None), None)
+        return {
+            "run": self.name,
+            "attrs": self.attrs,
+            "started_at": self.started_at.isoformat(),
+            "wall_s": round(root.wall_s, 6) if root else None,
+            "peak_rss_bytes": peak_rss_bytes(),
+            "error": root.error if root else None,
+            "totals": {name: st.to_dict() for name, st in totals.items()},
+            "spans": [sp.to_dict() for sp in spans],
+        }
+
+
+@contextmanager
+def trace_run(name: str, out_dir: Optional[os.PathLike] = None, **attrs):
+    """
+    run 단위 수집. 블록 전체도 name 이름의 span 으로 기록.
+    out_dir 이 있으면 종료 시(오류 포함) 요약 JSON 저장 — 저장 실패는 본 작업에 영향 없음
+    """
+    run = Run(name, attrs)
+    token = _current_run.set(run)
+    try:
+        with span(name, **attrs):
+            yield run
+    finally:
+        _current_run.reset(token)
+        if out_dir is not None:
+            try:
+                run.summary_path = write_run_summary(run, out_dir)
+            except Exception as e:
+                logger.warning(f"Could not write run summary for {name}: {e}")
+
+def write_run_summary(run: Run, out_dir: os.PathLike) -> Path:
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    stamp = run.started_at.strftime("%Y%m%dT%H%M%S%fZ")
+    path = out_dir / f"run_{stamp}_{run.name.replace('/', '_')}.json"
+    with open(path, "w", encoding="utf-8") as f:
+        # span 속성에 numpy 스칼라 등 JSON 비호환 값이 있어도 문자열로 기록
+        json.dump(run.summary(), f, ensure_ascii=False, indent=2, default=str)
+    return path
+
+def render_prometheus() -> str:
+    return REGISTRY.render_prometheus()